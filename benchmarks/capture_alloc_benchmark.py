@@ -0,0 +1,71 @@
+"""캡쳐 경로의 프레임당 메모리 할당량 벤치마크
+
+python -m benchmarks.capture_alloc_benchmark
+
+기존 경로: ImageGrab(PIL RGB 이미지) -> np.array 복사 -> binarize_image(grayscale 변환)
+링 버퍼 경로: GDI가 채운 BGRA 버퍼 -> 미리 할당한 grayscale 버퍼로 변환 (FrameRing.store)
+Windows API는 호출하지 않고, 화면 캡쳐 결과는 합성 이미지로 대신한다.
+"""
+import time
+import tracemalloc
+
+import numpy as np
+from PIL import Image
+
+from utils import image
+from utils.screen_capture import FrameRing
+
+RESOLUTIONS = [(1600, 900), (3200, 1350)]
+FRAME_COUNT = 20
+
+
+def legacy_capture(screen):
+    grabbed = Image.fromarray(screen)  # ImageGrab.grab()이 만드는 PIL 이미지
+    return image.binarize_image(np.array(grabbed))
+
+
+def measure(capture, frames):
+    """프레임당 (추적된 최대 추가 할당 바이트, 실행 시간 ms)"""
+    capture(frames[0])  # 첫 호출의 지연 초기화는 제외
+
+    tracemalloc.start()
+    peaks = []
+    start = time.perf_counter()
+    for frame in frames:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        capture(frame)
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - baseline)
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+
+    return int(np.mean(peaks)), elapsed / len(frames) * 1000
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'resolution':>12} {'path':>8} {'alloc bytes/frame':>18} {'PIL bytes/frame':>16} {'ms/frame':>9}")
+    for width, height in RESOLUTIONS:
+        screens = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(FRAME_COUNT)]
+
+        # PIL은 자체 할당자를 써서 tracemalloc에 잡히지 않으므로 RGB 이미지 크기(픽셀당 4바이트)를 별도 표기
+        pil_bytes = width * height * 4
+        legacy_bytes, legacy_ms = measure(legacy_capture, screens)
+
+        ring = FrameRing(width, height)
+        bgra_screens = [np.dstack([screen, np.full((height, width), 255, np.uint8)]) for screen in screens]
+
+        def ring_capture(screen):
+            np.copyto(ring.bgra, screen)  # GetDIBits가 ring.bgra에 직접 쓰는 부분
+            return ring.store()
+
+        ring_bytes, ring_ms = measure(ring_capture, bgra_screens)
+
+        resolution = f"{width}x{height}"
+        print(f"{resolution:>12} {'legacy':>8} {legacy_bytes:>18,} {pil_bytes:>16,} {legacy_ms:>9.2f}")
+        print(f"{resolution:>12} {'ring':>8} {ring_bytes:>18,} {0:>16,} {ring_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
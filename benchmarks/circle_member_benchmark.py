@@ -0,0 +1,107 @@
+"""서클원 객체 메모리와 가입기간 표시 시간 벤치마크 (기존 CircleMember vs __slots__ + 날짜 캐시)
+
+python -m benchmarks.circle_member_benchmark [--members 1000] [--repaints 20]
+
+서클원 한 명당 메모리(tracemalloc)와, 서클원 목록을 다시 그릴 때 가입기간 열의 data() 호출 한 번에 걸리는 시간을 비교한다.
+PyQt5가 설치되어 있으면 실제 CircleMemberModel.data() 시간도 출력한다.
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import datetime
+
+from circle_member import CircleMember, CircleMemberManager
+
+
+class LegacyCircleMember:
+    """기존 CircleMember (__dict__, 가입기간을 읽을 때마다 날짜 변환)"""
+
+    def __init__(self, nickname="새 서클원", uid="", arcalive_id="", join_date=None, position="서클원", remark="",
+                 member_id=None):
+        self.member_id = member_id
+        self.nickname = nickname
+        self.uid = uid
+        self.arcalive_id = arcalive_id
+        self.position = position
+        self.remark = remark
+        self.join_date = join_date.strftime("%Y-%m-%d") if isinstance(join_date, datetime) else join_date
+
+    @property
+    def join_period(self):
+        result = None
+        if self.join_date:
+            join_date = datetime.strptime(self.join_date, "%Y-%m-%d")
+            today = datetime.now()
+            result = (today - join_date).days
+
+        return result
+
+
+def create_members(member_class, size):
+    return [member_class(nickname=f"member_{index:05d}", uid=str(100000 + index),
+                         join_date=f"20{20 + index % 5}-{1 + index % 12:02d}-{1 + index % 28:02d}")
+            for index in range(size)]
+
+
+def memory_per_member(member_class, size):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    members = create_members(member_class, size)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del members
+    return allocated / size
+
+
+def repaint_time(members, repaints):
+    """다시 그릴 때마다 보이는 행 전체의 가입기간을 읽는 시간 (호출 한 번 평균)"""
+    start = time.perf_counter()
+    for _ in range(repaints):
+        for member in members:
+            member.join_period
+    return (time.perf_counter() - start) / (repaints * len(members))
+
+
+def model_data_time(members, repaints):
+    """실제 CircleMemberModel.data() 호출 한 번 평균 (PyQt5가 없으면 None)"""
+    try:
+        from PyQt5.QtCore import Qt
+        from PyQt5.QtWidgets import QApplication
+        from gui.circle_member_model import CircleMemberModel
+    except ImportError:
+        return None
+
+    app = QApplication.instance() or QApplication([])
+    manager = CircleMemberManager()
+    manager.members = members
+    model = CircleMemberModel()
+    column = model._join_period_column
+    indexes = [model.index(row, column) for row in range(len(members))]
+    start = time.perf_counter()
+    for _ in range(repaints):
+        for index in indexes:
+            model.data(index, Qt.DisplayRole)
+    elapsed = (time.perf_counter() - start) / (repaints * len(members))
+    del app
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--repaints", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'class':>8} {'bytes/member':>13} {'join_period us':>15} {'model data() us':>16}")
+    for name, member_class in [("legacy", LegacyCircleMember), ("slots", CircleMember)]:
+        members = create_members(member_class, args.members)
+        memory = memory_per_member(member_class, args.members)
+        join_period_time = repaint_time(members, args.repaints)
+        data_time = model_data_time(members, args.repaints) if member_class is CircleMember else None
+        data_text = "-" if data_time is None else f"{data_time * 1e6:.2f}"
+        print(f"{name:>8} {memory:>13.0f} {join_period_time * 1e6:>15.2f} {data_text:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Clova OCR API를 흉내 내는 로컬 HTTP 서버 (벤치마크/테스트용, tests/test_clova_ocr.py)
+
+with ClovaStubServer(fail_statuses=[503, 429]) as server:
+    client = ClovaOcrClient(server.url, "secret")
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class ClovaStubServer:
+    def __init__(self, fields=None, latency=0.0, fail_statuses=None, respond=None):
+        """fields: 응답할 필드 목록, fail_statuses: 앞쪽 요청부터 순서대로 돌려줄 오류 상태 코드,
+        respond: payload를 받아 응답 JSON을 만드는 함수 (fields보다 우선)"""
+        self.fields = fields if fields is not None else []
+        self.latency = latency
+        self.fail_statuses = list(fail_statuses or [])
+        self.respond = respond
+        self.requests = []
+        self.connections = set()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._create_handler())
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}/ocr"
+
+    def _create_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body=b""):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_HEAD(self):
+                with stub._lock:
+                    stub.connections.add(self.client_address)
+                self._send(405)
+
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub._lock:
+                    stub.connections.add(self.client_address)
+                    stub.requests.append(payload)
+                    status = stub.fail_statuses.pop(0) if stub.fail_statuses else 200
+
+                time.sleep(stub.latency)
+                if status != 200:
+                    self._send(status, b'{"code": "stub error"}')
+                    return
+
+                if stub.respond:
+                    result = stub.respond(payload)
+                else:
+                    result = {"images": [{"inferResult": "SUCCESS", "fields": stub.fields}
+                                         for _ in payload.get("images", [])]}
+                self._send(200, json.dumps(result, ensure_ascii=False).encode("utf-8"))
+
+        return Handler
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,76 @@
+"""설정 입력 중 저장 비용 벤치마크 (기존 동기 저장 vs 지연 저장)
+
+python -m benchmarks.config_benchmark [--chars 100]
+
+설정 창에서 Clova API URL을 한 글자씩 입력하는 것처럼 ConfigManager.set을 연속 호출하고,
+호출 한 번(입력 처리 스레드)에 걸리는 시간과 실제 파일 저장 횟수를 비교한다.
+임시 폴더의 config.json을 사용하므로 실제 설정 파일은 바뀌지 않는다.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import config
+from config import ConfigManager, ConfigKeys
+
+URL_KEYS = [ConfigKeys.CLOVA_API, ConfigKeys.CLOVA_API_URL]
+
+
+def legacy_set(data, keys, value, path):
+    """기존 ConfigManager.set (호출마다 파일 전체를 바로 덮어씀)"""
+    target = data
+    for key in keys[:-1]:
+        target = target.get(key)
+    target[keys[-1]] = value
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chars", type=int, default=100)
+    args = parser.parse_args()
+
+    url = ("https://example.apigw.ntruss.com/custom/v1/00000/" + "a" * args.chars)[:args.chars]
+
+    with tempfile.TemporaryDirectory() as directory:
+        config.CONFIG_PATH = os.path.join(directory, config.CONFIG_FILE_NAME)
+        manager = ConfigManager()
+
+        writes = 0
+        write = manager._write
+
+        def counted_write(text):
+            nonlocal writes
+            writes += 1
+            write(text)
+
+        manager._write = counted_write
+
+        legacy_data = json.loads(repr(manager))
+        legacy_path = os.path.join(directory, "legacy.json")
+        start = time.perf_counter()
+        for length in range(1, len(url) + 1):
+            legacy_set(legacy_data, URL_KEYS, url[:length], legacy_path)
+        legacy_time = (time.perf_counter() - start) / len(url)
+
+        writes = 0
+        start = time.perf_counter()
+        for length in range(1, len(url) + 1):
+            manager.set(URL_KEYS, url[:length])
+        set_time = (time.perf_counter() - start) / len(url)
+        time.sleep(config.SAVE_DELAY * 2)
+
+        with open(config.CONFIG_PATH, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        assert saved[ConfigKeys.CLOVA_API][ConfigKeys.CLOVA_API_URL] == url
+
+        print(f"{'mode':>12} {'set us':>8} {'file writes':>12}")
+        print(f"{'legacy':>12} {legacy_time * 1e6:>8.1f} {len(url):>12}")
+        print(f"{'write-behind':>12} {set_time * 1e6:>8.1f} {writes:>12}")
+
+
+if __name__ == "__main__":
+    main()
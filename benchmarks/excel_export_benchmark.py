@@ -0,0 +1,102 @@
+"""엑셀 저장 엔진 벤치마크 (standard vs write_only)
+
+python -m benchmarks.excel_export_benchmark [--rows 200 1000 5000] [--sheets 6]
+
+서클원 추출 결과(명단에 없는 닉네임, 부족한 공헌도 강조 포함)를 두 엔진으로 저장하며
+이전 엑셀의 시트 --sheets개를 함께 복사한다. 저장 시간과 최대 메모리(tracemalloc)를 비교하고,
+두 파일의 값, 스타일, 병합, 표, 제목 행 높이가 같은지 확인한다.
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from openpyxl.reader.excel import load_workbook
+
+from benchmarks.sheet_copy_benchmark import create_workbook, same_workbooks
+from circle_member import CircleMember, CircleMemberManager
+from excel import Excel
+from excel.output_manifest import OutputManifest
+from extractors import CircleMemberExtractor
+from utils.result_table import ResultTable
+
+ENGINES = ["standard", "write_only"]
+
+
+def create_table(extractor, row_count):
+    records = [{"nickname": f"member_{index:05d}" if index % 10 else f"guest_{index}", "position": "서클원",
+                "weekly_contrib": index * 37 % 4000, "total_contrib": index * 1000, "status": "접속 중",
+                "level": 30 + index % 20} for index in range(row_count)]
+    table = ResultTable.from_records(records, [key for key, _ in extractor.ocr_headers], extractor.numeric_keys)
+    _, table = extractor._create_excel_data(table)
+    return table
+
+
+def export(engine, path, sheet_name, extractor, table):
+    excel = Excel()
+    export_function = excel.export_write_only if engine == "write_only" else excel.export_standard
+    with OutputManifest(os.path.dirname(path)) as manifest:
+        latest_file = manifest.latest(exclude_prefix=sheet_name)
+        export_function(path=path, sheet_name=sheet_name, title=f"{sheet_name} 12:00:00 월요일",
+                        columns=extractor.excel_columns, data=table, latest_file=latest_file,
+                        old_sheets=manifest.sheets(latest_file))
+
+
+def same_layout(first_path, second_path):
+    """제목 행 높이와 표 열 이름 비교"""
+    first, second = load_workbook(first_path), load_workbook(second_path)
+    for sheet_name in first.sheetnames:
+        first_ws, second_ws = first[sheet_name], second[sheet_name]
+        if first_ws.row_dimensions[1].height != second_ws.row_dimensions[1].height:
+            return False
+        for name, table in dict(first_ws.tables).items():
+            other = second_ws.tables.get(name)
+            if other is None or [column.name for column in table.tableColumns] != \
+                    [column.name for column in other.tableColumns] or table.ref != other.ref:
+                return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[200, 1000, 5000])
+    parser.add_argument("--sheets", type=int, default=6)
+    args = parser.parse_args()
+
+    manager = CircleMemberManager()
+    extractor = CircleMemberExtractor()
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    print(f"{'rows':>6} {'engine':>10} {'export ms':>10} {'peak MB':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        # 이전 엑셀 (오늘 날짜로 시작하는 파일은 복사 대상에서 제외되므로 저장 결과와 섞이지 않음)
+        create_workbook(os.path.join(directory, "2025-01-01.xlsx"), args.sheets, 200)
+
+        for row_count in args.rows:
+            manager.members = [CircleMember(nickname=f"member_{index:05d}", uid=str(100000 + index),
+                                            join_date="2024-01-01") for index in range(row_count)]
+            manager.rebuild_indexes()
+            table = create_table(extractor, row_count)
+
+            paths = {}
+            for engine in ENGINES:
+                path = paths[engine] = os.path.join(directory, f"{today}_{engine}_{row_count}.xlsx")
+                start = time.perf_counter()
+                export(engine, path, today, extractor, table)
+                elapsed = time.perf_counter() - start
+
+                tracemalloc.start()
+                export(engine, path, today, extractor, table)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(f"{row_count:>6} {engine:>10} {elapsed * 1000:>10.1f} {peak / 2 ** 20:>8.1f}")
+
+            same = same_workbooks(paths["standard"], paths["write_only"]) and \
+                same_layout(paths["standard"], paths["write_only"])
+            print(f"{'':>6} same visible output: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""추출 기록(history.db) 추가/조회 시간 벤치마크
+
+python -m benchmarks.history_benchmark [--members 200] [--weeks 52 104 208]
+
+서클원 수 x 주 수 만큼 서클원 추출 결과(이번 주 공헌도, 누적 공헌도, 레벨)를 합성해 기록한 뒤
+서클원 한 명의 변화, 한 날짜의 전체 목록, 주간 비교 조회 시간을 측정한다.
+닉네임 일부는 주마다 OCR이 다르게 읽은 것처럼 바꾸고, 명단의 서클원으로 기록되어 변화가 이어지는지 확인한다.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from circle_member import CircleMember
+from utils.history_store import HistoryStore
+from utils.result_table import ResultTable
+
+EXTRACTOR = "output"
+METRICS = ["level", "total_contrib", "weekly_contrib"]
+
+
+def create_members(count):
+    return [CircleMember(nickname=f"member_{index:04d}", uid=str(100000 + index)) for index in range(count)]
+
+
+def ocr_nickname(member, week):
+    """OCR이 주마다 다르게 읽은 닉네임 (서클원 7명 중 1명은 홀수 주에 m -> rn)"""
+    index = int(member.uid) - 100000
+    return member.nickname.replace("m", "rn", 1) if index % 7 == 0 and week % 2 else member.nickname
+
+
+def create_table(members, week, rng):
+    records = [{"nickname": ocr_nickname(member, week), "uid": member.uid,
+                "weekly_contrib": rng.randint(0, 3000), "total_contrib": week * 2000 + index,
+                "level": 30 + week // 10} for index, member in enumerate(members)]
+    return ResultTable.from_records(records, ["nickname", "uid"] + METRICS, METRICS)
+
+
+def timed(function, repeat=20):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--members", type=int, default=200)
+    parser.add_argument("--weeks", type=int, nargs="+", default=[52, 104, 208])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    start_date = datetime(2024, 1, 1, 12)
+    print(f"{'weeks':>6} {'rows':>8} {'append ms/run':>14} {'member ms':>10} {'by uid ms':>10} "
+          f"{'on date ms':>11} {'compare ms':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for weeks in args.weeks:
+            with HistoryStore(os.path.join(directory, f"history_{weeks}.db")) as history:
+                members = create_members(args.members)
+                tables = [create_table(members, week, rng) for week in range(weeks)]
+                start = time.perf_counter()
+                for week, table in enumerate(tables):
+                    history.append(EXTRACTOR, table, METRICS, start_date + timedelta(weeks=week), members)
+                append_time = (time.perf_counter() - start) / weeks
+
+                dates = history.dates(EXTRACTOR)
+                last, previous = dates[-1], dates[-2]
+                nickname = members[0].nickname  # OCR이 다르게 읽은 주가 있는 서클원
+                member_time, (member_dates, _) = timed(
+                    lambda: history.member_history(EXTRACTOR, nickname, "weekly_contrib"))
+                uid_time, (uid_dates, _) = timed(lambda: history.member_history_by_uid(
+                    EXTRACTOR, members[0].uid, "weekly_contrib"))
+                date_time, (nicknames, _) = timed(lambda: history.on_date(EXTRACTOR, last, "weekly_contrib"))
+                compare_time, (compared, values, previous_values) = timed(
+                    lambda: history.compare(EXTRACTOR, "total_contrib", last, previous))
+                assert len(member_dates) == len(uid_dates) == weeks and len(nicknames) == len(compared) == args.members
+                assert (values - previous_values == 2000).all()
+
+                print(f"{weeks:>6} {weeks * args.members * len(METRICS):>8} {append_time * 1000:>14.1f} "
+                      f"{member_time * 1000:>10.2f} {uid_time * 1000:>10.2f} {date_time * 1000:>11.2f} "
+                      f"{compare_time * 1000:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""템플릿 매칭 엔진별 정확도와 속도 벤치마크
+
+python -m benchmarks.matcher_benchmark [세션.npz ...]
+
+연속된 두 프레임마다 다음 프레임 상단 20%를 이전 프레임에서 찾는다.
+녹화 세션은 기본 엔진(full)의 결과를, 합성 세션은 실제 스크롤 이동량을 정답으로 사용한다.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import create_list_image, create_frames
+from utils import image
+from utils.frame_source import ReplayFrameSource
+from utils.matcher import MATCHERS
+
+SYNTHETIC_FRAME_HEIGHT = 900
+SYNTHETIC_SCROLL_STEP = 610
+TEMPLATE_RATIO = 0.2
+
+
+def load_frame_pairs(path):
+    frames = ReplayFrameSource(path).frames
+    frames = [image.binarize_image(frame) for frame in frames]
+    pairs = [(prev, frame) for prev, frame in zip(frames, frames[1:])]
+
+    full_matcher = MATCHERS["full"]()
+    offsets = [full_matcher(prev, frame[:int(frame.shape[0] * TEMPLATE_RATIO)])[1][1] for prev, frame in pairs]
+    return pairs, offsets
+
+
+def synthetic_frame_pairs(frame_count=40):
+    frames = create_frames(create_list_image(frame_count * 6), SYNTHETIC_FRAME_HEIGHT,
+                           SYNTHETIC_SCROLL_STEP)[:frame_count]
+    pairs = [(prev, frame) for prev, frame in zip(frames, frames[1:])]
+    return pairs, [SYNTHETIC_SCROLL_STEP] * len(pairs)
+
+
+def run(name, pairs, offsets, repeat=3):
+    print(f"📊 {name}: 프레임 쌍 {len(pairs)}개")
+    print(f"{'engine':>10} {'ms/frame':>10} {'exact %':>9} {'mean err px':>12} {'similarity':>11}")
+    for engine, matcher_class in MATCHERS.items():
+        matcher = matcher_class()
+        best = None
+        for _ in range(repeat):
+            results = []
+            start = time.perf_counter()
+            for prev, frame in pairs:
+                results.append(matcher(prev, frame[:int(frame.shape[0] * TEMPLATE_RATIO)]))
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        errors = np.abs(np.array([location[1] for _, location in results]) - np.array(offsets))
+        similarity = np.mean([similarity for similarity, _ in results])
+        print(f"{engine:>10} {best / len(pairs) * 1000:>10.2f} {np.mean(errors == 0) * 100:>9.1f} "
+              f"{errors.mean():>12.2f} {similarity:>11.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("sessions", nargs="*")
+    args = parser.parse_args()
+
+    if not args.sessions:
+        run("synthetic", *synthetic_frame_pairs())
+
+    for path in args.sessions:
+        run(os.path.basename(path), *load_frame_pairs(path))
+
+
+if __name__ == "__main__":
+    main()
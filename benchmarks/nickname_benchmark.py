@@ -0,0 +1,122 @@
+"""OCR 오인식 닉네임을 명단 닉네임으로 찾는 색인의 정확도와 조회 시간 벤치마크
+
+python -m benchmarks.nickname_benchmark [--roster 100 1000 10000] [--queries 500]
+
+합성 명단(한글/영문 닉네임)에 OCR에서 자주 생기는 오류(ㅐ/ㅔ 같은 모음, l/1/I, 받침 하나, 공백)를
+넣은 닉네임으로 NicknameIndex(q-gram 색인)와 전체 비교(선형 탐색)의 결과와 시간을 비교한다.
+명단에 없는 닉네임을 다른 서클원으로 잘못 찾는 비율(stranger %)도 함께 출력한다.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from utils.nickname_index import NicknameIndex, edit_distance, nickname_key
+
+HANGUL_BASE = 0xAC00
+JUNG_COUNT = 21
+JONG_COUNT = 28
+JUNG_CONFUSIONS = {1: 5, 5: 1, 3: 7, 7: 3, 10: 15, 11: 15}  # ㅐ<->ㅔ, ㅒ<->ㅖ, ㅙ/ㅚ->ㅞ
+LATIN = "abcdefghjkmnpqrstuvwxyz"
+LATIN_CONFUSIONS = {"l": "1", "1": "l", "I": "l", "o": "0", "0": "o"}
+
+
+def syllable(cho, jung, jong):
+    return chr(HANGUL_BASE + (cho * JUNG_COUNT + jung) * JONG_COUNT + jong)
+
+
+def random_nickname(rng):
+    if rng.random() < 0.7:
+        length = int(rng.integers(2, 7))
+        return "".join(syllable(int(rng.integers(0, 19)), int(rng.integers(0, JUNG_COUNT)),
+                                int(rng.integers(0, JONG_COUNT)) if rng.random() < 0.4 else 0)
+                       for _ in range(length))
+    length = int(rng.integers(4, 10))
+    name = "".join(LATIN[int(rng.integers(0, len(LATIN)))] for _ in range(length))
+    return name + ("l" if rng.random() < 0.5 else "") + str(int(rng.integers(0, 100)))
+
+
+def create_roster(size, seed=0):
+    rng = np.random.default_rng(seed)
+    roster = set()
+    while len(roster) < size:
+        roster.add(random_nickname(rng))
+    return sorted(roster)
+
+
+def misread(nickname, rng):
+    """OCR 오류 하나를 넣은 닉네임"""
+    chars = list(nickname)
+    position = int(rng.integers(0, len(chars)))
+    char = chars[position]
+    code = ord(char) - HANGUL_BASE
+    error = int(rng.integers(0, 3))
+
+    if 0 <= code < 11172:
+        cho, jung, jong = code // (JUNG_COUNT * JONG_COUNT), (code // JONG_COUNT) % JUNG_COUNT, code % JONG_COUNT
+        if error == 0 and jung in JUNG_CONFUSIONS:
+            chars[position] = syllable(cho, JUNG_CONFUSIONS[jung], jong)
+        elif error == 1:
+            chars[position] = syllable(cho, jung, (jong + 1) % JONG_COUNT)
+        else:
+            chars.insert(position, " ")
+    elif char in LATIN_CONFUSIONS:
+        chars[position] = LATIN_CONFUSIONS[char]
+    elif error == 0:
+        chars[position] = char.upper()
+    else:
+        chars.insert(position, " ")
+    return "".join(chars)
+
+
+def linear_search(keys, text, budget):
+    """전체 키와 편집 거리를 비교하는 기준 구현"""
+    key = nickname_key(text)
+    matches = [(edit_distance(key, other, budget), nickname) for other, nickname in keys]
+    best = min(matches)
+    return best if best[0] <= budget else None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--roster", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'roster':>7} {'correct %':>10} {'wrong %':>8} {'unknown %':>10} {'stranger %':>11} {'verified %':>11} "
+          f"{'index us':>9} {'linear us':>10}")
+    for size in args.roster:
+        rng = np.random.default_rng(size)
+        roster = create_roster(size + args.queries)
+        roster, strangers = roster[:size], roster[size:]
+        index = NicknameIndex(roster)
+        keys = [(nickname_key(nickname), nickname) for nickname in roster]
+        answers = [roster[int(i)] for i in rng.integers(0, size, args.queries)]
+        queries = [misread(answer, rng) for answer in answers]
+
+        correct = wrong = 0
+        start = time.perf_counter()
+        for query, answer in zip(queries, answers):
+            match = index.search(query)
+            if match is not None:
+                correct += match[0] == answer
+                wrong += match[0] != answer
+        index_time = (time.perf_counter() - start) / len(queries)
+        verified = index._grams.verified
+        matched_strangers = sum(index.search(misread(stranger, rng)) is not None for stranger in strangers)
+
+        sample = queries[:max(1, min(len(queries), 20000 // size))]
+        start = time.perf_counter()
+        for query in sample:
+            linear_search(keys, query, index.budget(nickname_key(query)))
+        linear_time = (time.perf_counter() - start) / len(sample)
+
+        unknown = len(queries) - correct - wrong
+        print(f"{size:>7} {correct / len(queries) * 100:>10.1f} {wrong / len(queries) * 100:>8.1f} "
+              f"{unknown / len(queries) * 100:>10.1f} {matched_strangers / len(strangers) * 100:>11.1f} "
+              f"{verified / len(queries) / size * 100:>11.2f} "
+              f"{index_time * 1e6:>9.0f} {linear_time * 1e6:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""엑셀 저장 준비 시간 벤치마크 (폴더 목록 + 워크북 전체 읽기 vs 매니페스트 + read_only)
+
+python -m benchmarks.output_manifest_benchmark [--files 10 100 1000] [--rows 200] [--repeat 5]
+
+출력 폴더에 이전 엑셀 파일 --files개(가장 최근 파일은 6개 시트 x --rows행, 나머지는 작은 파일)를 두고,
+저장할 때마다 하는 준비 작업(가장 최근 파일 찾기 + 복사할 시트 읽기)의 시간을 비교한다.
+매니페스트는 처음 한 번 폴더를 읽어 만들며(이후에는 폴더 수정 시각만 확인), 그 시간도 함께 출력한다.
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from openpyxl.reader.excel import load_workbook
+from openpyxl.workbook import Workbook
+
+from benchmarks.excel_export_benchmark import create_table
+from benchmarks.sheet_copy_benchmark import create_workbook
+from circle_member import CircleMember, CircleMemberManager
+from excel import Excel
+from excel.output_manifest import OutputManifest, MANIFEST_FILENAME
+from extractors import CircleMemberExtractor
+
+
+def legacy_find_latest_excel_file(directory):
+    """기존 Excel.find_latest_excel_file (폴더 목록 + 파일마다 수정 시각 확인)"""
+    files = [f for f in os.listdir(directory) if f.endswith('.xlsx')]
+    today_date = datetime.now().strftime('%Y-%m-%d')
+    files = [f for f in files if not f.startswith(today_date)]
+    if not files:
+        return None
+    latest_file = max(files, key=lambda x: os.path.getmtime(os.path.join(directory, x)))
+    return os.path.join(directory, latest_file)
+
+
+def legacy_setup(directory):
+    """기존 준비 작업: 가장 최근 파일 찾기 + 워크북 전체 읽기 + 최근 6개 시트의 셀 읽기"""
+    latest_file = legacy_find_latest_excel_file(directory)
+    old_wb = load_workbook(latest_file)
+    for sheet_name in sorted(old_wb.sheetnames, reverse=True)[:6]:
+        for row in old_wb[sheet_name].iter_rows():
+            for cell in row:
+                cell.value
+    return latest_file
+
+
+def manifest_setup(directory):
+    """매니페스트 준비 작업: 기록에서 가장 최근 파일 찾기 + read_only로 최근 6개 시트의 셀 읽기"""
+    with OutputManifest(directory) as manifest:
+        latest_file = manifest.latest(exclude_prefix=datetime.now().strftime('%Y-%m-%d'))
+        old_wb, old_sheets = Excel().read_old_sheets(latest_file, manifest.sheets(latest_file))
+    for _, rows in old_sheets:
+        for row in rows:
+            for cell in row:
+                cell.value
+    old_wb.close()
+    return latest_file
+
+
+def timed(function, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def create_folder(directory, file_count, row_count, extractor):
+    """작은 이전 파일 file_count - 1개와, 6개 시트를 가진 가장 최근 파일 (매니페스트에 기록하며 저장)"""
+    start_date = datetime(2020, 1, 1)
+    for index in range(file_count - 1):
+        sheet_name = (start_date + timedelta(days=index)).strftime('%Y-%m-%d')
+        wb = Workbook()
+        wb.active.title = sheet_name
+        wb.active.append(["닉네임"])
+        path = os.path.join(directory, f"{sheet_name}.xlsx")
+        wb.save(path)
+        os.utime(path, (index, index))
+
+    # 가장 최근 파일 = 이전 시트 5개 + 새 결과 시트 (Excel.export로 저장해 매니페스트에 시트 정보 기록)
+    create_workbook(os.path.join(directory, "2024-12-01.xlsx"), 5, row_count)
+    os.utime(os.path.join(directory, "2024-12-01.xlsx"), (file_count, file_count))
+    scan_time, _ = timed(lambda: OutputManifest(directory).close(), 1)
+    Excel().export(os.path.join(directory, "2025-06-01.xlsx"), "2025-06-01", "2025-06-01 12:00:00",
+                   extractor.excel_columns, create_table(extractor, row_count))
+    return scan_time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    manager = CircleMemberManager()
+    manager.members = [CircleMember(nickname=f"member_{index:05d}", join_date="2024-01-01")
+                       for index in range(args.rows)]
+    manager.rebuild_indexes()
+    extractor = CircleMemberExtractor()
+
+    print(f"{'files':>6} {'scan once ms':>13} {'legacy find ms':>15} {'manifest find ms':>17} "
+          f"{'legacy setup ms':>16} {'manifest setup ms':>18}")
+    for file_count in args.files:
+        with tempfile.TemporaryDirectory() as directory:
+            scan_time = create_folder(directory, file_count, args.rows, extractor)
+            assert os.path.exists(os.path.join(directory, MANIFEST_FILENAME))
+
+            def manifest_find():
+                with OutputManifest(directory) as manifest:
+                    return manifest.latest(exclude_prefix=datetime.now().strftime('%Y-%m-%d'))
+
+            legacy_find_time, legacy_latest = timed(lambda: legacy_find_latest_excel_file(directory), args.repeat)
+            manifest_find_time, manifest_latest = timed(manifest_find, args.repeat)
+            assert legacy_latest == manifest_latest
+            legacy_time, _ = timed(lambda: legacy_setup(directory), args.repeat)
+            manifest_time, _ = timed(lambda: manifest_setup(directory), args.repeat)
+
+            print(f"{file_count:>6} {scan_time * 1000:>13.1f} {legacy_find_time * 1000:>15.2f} "
+                  f"{manifest_find_time * 1000:>17.2f} {legacy_time * 1000:>16.1f} {manifest_time * 1000:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""API 호출 없이 OCR 결과 파싱과 엑셀 저장 처리량을 측정하는 벤치마크
+
+python -m benchmarks.parse_export_benchmark [--extractor circle|dust] [--rows 100 500 2000] [--responses 폴더]
+
+합성 목록 이미지와 정답 필드를 SyntheticBackend로 돌려주고 파싱 정확도(정답과 같은 행 비율)도 함께 출력한다.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic import create_member_list, LAYOUTS
+from excel import Excel
+from extractors import CircleMemberExtractor, DustFrontlineExtractor
+from utils.ocr_backend import SyntheticBackend, ReplayBackend
+
+EXTRACTORS = {"circle": CircleMemberExtractor, "dust": DustFrontlineExtractor}
+
+
+def timed(function, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def expected_rows(extractor, fields):
+    """정답 필드를 헤더 순서대로 나눈 행 목록 (파싱 결과와 비교용)"""
+    texts = [field.text for field in fields]
+    return extractor._split_extracted_text(texts).records()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--extractor", choices=EXTRACTORS.keys(), default="circle")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    extractor = EXTRACTORS[args.extractor]()
+    directory = tempfile.mkdtemp()
+
+    print(f"{'rows':>6} {'ocr ms':>8} {'replay ms':>10} {'parse ms':>9} {'rows/s':>9} {'accuracy %':>11} "
+          f"{'excel data ms':>14} {'export ms':>10}")
+    for row_count in args.rows:
+        canvas, fields = create_member_list(row_count, LAYOUTS[args.extractor])
+        backend = SyntheticBackend(canvas, fields)
+        replay = ReplayBackend(os.path.join(directory, f"responses_{row_count}"), backend)
+        replay.recognize(canvas)  # 녹화
+
+        ocr_time, ocr_fields = timed(lambda: backend.recognize(canvas), args.repeat)
+        replay_time, _ = timed(lambda: replay.recognize(canvas), args.repeat)
+        parse_time, table = timed(lambda: extractor._parse_fields(ocr_fields), args.repeat)
+        rows = table.records()
+        data_time, (_, data) = timed(lambda: extractor._create_excel_data(table), args.repeat)
+
+        # 같은 폴더의 이전 파일 시트를 복사하지 않도록 행 수별 폴더에 저장
+        excel_directory = os.path.join(directory, f"excel_{row_count}")
+        os.makedirs(excel_directory)
+        excel_path = os.path.join(excel_directory, "benchmark.xlsx")
+        export_time, _ = timed(lambda: Excel().export(path=excel_path, sheet_name="benchmark", title="benchmark",
+                                                      columns=extractor.excel_columns, data=data), 1)
+
+        expected = expected_rows(extractor, fields)
+        accuracy = sum(row == answer for row, answer in zip(rows, expected)) / max(len(expected), 1)
+        print(f"{row_count:>6} {ocr_time * 1000:>8.1f} {replay_time * 1000:>10.1f} {parse_time * 1000:>9.1f} "
+              f"{row_count / parse_time:>9.0f} {accuracy * 100:>11.1f} {data_time * 1000:>14.1f} "
+              f"{export_time * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
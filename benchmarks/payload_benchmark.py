@@ -0,0 +1,156 @@
+"""OCR 요청 이미지 인코딩 설정별 크기, 인코딩 시간, 파싱 일치율 벤치마크
+
+python -m benchmarks.payload_benchmark [세션.npz | 이미지 ...] [--extractor circle|dust] [--ocr] [--stub]
+
+세션 파일은 병합 후 프로필 영역을 잘라낸 이미지(실제 OCR 요청과 같은 이미지)를 사용하고,
+입력을 지정하지 않으면 합성 목록 이미지를 사용한다.
+--ocr 옵션은 config.json의 Clova API로 설정마다 OCR을 요청하여 기준 설정(기본값)과
+파싱 결과(행 목록)가 같은 비율을 계산한다. 옵션이 없으면 복원 이미지의 PSNR만 비교한다.
+--stub 옵션은 API 대신 로컬 흉내 서버(benchmarks.clova_stub)가 합성 목록의 정답 필드를 돌려주어,
+API 없이 --ocr 경로(요청, 좌표 복원, 파싱, 일치율)를 확인한다.
+"""
+import argparse
+import base64
+import os
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.clova_stub import ClovaStubServer
+from benchmarks.synthetic import create_list_image, create_member_list, LAYOUTS
+from config import ConfigManager, ConfigKeys
+from extractors import CircleMemberExtractor, DustFrontlineExtractor
+from utils import clova_ocr
+from utils.frame_source import ReplayFrameSource
+from utils.ocr_payload import PayloadOptions, encode_payload, estimate_glyph_height
+
+EXTRACTORS = {"circle": CircleMemberExtractor, "dust": DustFrontlineExtractor}
+
+BASELINE = PayloadOptions()
+SETTINGS = [
+    BASELINE,
+    PayloadOptions(quality=80),
+    PayloadOptions(quality=60),
+    PayloadOptions(format="png"),
+    PayloadOptions(format="png", gray_levels=16),
+    PayloadOptions(format="png", gray_levels=8),
+    PayloadOptions(glyph_height=32),
+    PayloadOptions(glyph_height=24),
+    PayloadOptions(glyph_height=18),
+    PayloadOptions(quality=80, glyph_height=24),
+    PayloadOptions(format="png", glyph_height=24, gray_levels=16),
+    PayloadOptions(format="png", glyph_height=18, gray_levels=8),
+]
+
+
+def load_canvas(path, extractor):
+    """세션 파일이면 병합 후 프로필 영역을 잘라낸 이미지, 그 외에는 grayscale 이미지 파일"""
+    if path.endswith(".npz"):
+        source = ReplayFrameSource(path)
+        capture_result = extractor.capture(source, len(source.frames) + 1, 0)  # 목록 끝 확인 스크롤 포함
+        return extractor._crop_profile(capture_result.image, source)
+    return cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+
+
+def psnr(canvas, options):
+    """전송 이미지를 디코딩하고 원본 크기로 되돌렸을 때의 PSNR (dB)"""
+    data, _ = encode_payload(canvas, options)
+    decoded = cv2.imdecode(np.frombuffer(base64.b64decode(data), np.uint8), cv2.IMREAD_GRAYSCALE)
+    restored = cv2.resize(decoded, (canvas.shape[1], canvas.shape[0]), interpolation=cv2.INTER_LINEAR)
+    return cv2.PSNR(canvas, restored)
+
+
+def agreement(table, baseline_table):
+    """기준 결과 표와 같은 위치의 행이 완전히 같은 비율"""
+    rows, baseline_rows = table.records(), baseline_table.records()
+    total = max(len(rows), len(baseline_rows))
+    if total == 0:
+        return 1.0
+    return sum(row == baseline_row for row, baseline_row in zip(rows, baseline_rows)) / total
+
+
+def stub_response(canvas, fields):
+    """흉내 서버 응답 함수 (전송 이미지 크기에 맞춰 정답 필드 좌표를 축소)"""
+    def respond(payload):
+        images = []
+        for image in payload["images"]:
+            data = np.frombuffer(base64.b64decode(image["data"]), np.uint8)
+            scale = cv2.imdecode(data, cv2.IMREAD_GRAYSCALE).shape[1] / canvas.shape[1]
+            images.append({"inferResult": "SUCCESS", "fields": [
+                {"inferText": field.text, "inferConfidence": field.confidence,
+                 "boundingPoly": {"vertices": [{"x": x * scale, "y": y * scale}
+                                               for x, y in [(field.left, field.top), (field.right, field.top),
+                                                            (field.right, field.bottom), (field.left, field.bottom)]]}}
+                for field in fields]})
+        return {"images": images}
+
+    return respond
+
+
+def run(name, canvas, extractor, recognize=None, repeat=3):
+    glyph_height = estimate_glyph_height(canvas)
+    print(f"📊 {name}: {canvas.shape[1]}x{canvas.shape[0]}, 추정 글자 높이 {glyph_height}px")
+    print(f"{'setting':>32} {'bytes':>10} {'ratio':>7} {'encode ms':>10} {'psnr':>7} {'agree %':>8}")
+
+    baseline_table = None
+    baseline_size = None
+    for options in SETTINGS:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            data, _ = encode_payload(canvas, options)
+            timings.append(time.perf_counter() - start)
+
+        size = len(data)
+        baseline_size = baseline_size or size
+
+        agree = "-"
+        if recognize:
+            table = extractor._parse_fields(recognize(canvas, options))
+            if baseline_table is None:
+                baseline_table = table
+            agree = f"{agreement(table, baseline_table) * 100:.1f}"
+
+        print(f"{repr(options):>32} {size:>10} {size / baseline_size:>7.2f} {min(timings) * 1000:>10.1f} "
+              f"{psnr(canvas, options):>7.1f} {agree:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("inputs", nargs="*")
+    parser.add_argument("--extractor", choices=EXTRACTORS.keys(), default="circle")
+    parser.add_argument("--ocr", action="store_true")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--stub", action="store_true")
+    args = parser.parse_args()
+
+    extractor = EXTRACTORS[args.extractor]()
+
+    if args.stub:
+        canvas, fields = create_member_list(150, LAYOUTS[args.extractor])
+        with ClovaStubServer(respond=stub_response(canvas, fields)) as server:
+            client = clova_ocr.ClovaOcrClient(server.url, "secret")
+            run("synthetic (stub OCR)", canvas, extractor,
+                lambda image, options: client.recognize_fields([image], options)[0], args.repeat)
+            client.close()
+        return
+
+    recognize = None
+    if args.ocr:
+        config = ConfigManager()
+        client = clova_ocr.ClovaOcrClient(config.get([ConfigKeys.CLOVA_API, ConfigKeys.CLOVA_API_URL]),
+                                          config.get([ConfigKeys.CLOVA_API, ConfigKeys.CLOVA_X_OCR_SECRET]))
+
+        def recognize(canvas, options):
+            return client.recognize_fields([canvas], options)[0]
+
+    if not args.inputs:
+        run("synthetic", create_list_image(150), extractor, recognize, args.repeat)
+
+    for path in args.inputs:
+        run(os.path.basename(path), load_canvas(path, extractor), extractor, recognize, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""녹화된 캡쳐 세션을 재생하여 병합(및 전체 추출) 시간을 측정하는 벤치마크
+
+python -m benchmarks.replay_benchmark [세션.npz ...] [--extractor circle|dust] [--full] [--responses 폴더]
+
+세션 파일을 지정하지 않으면 합성 목록 이미지로 만든 세션을 사용한다.
+--full 옵션은 OCR, 파싱, 엑셀 저장까지 Extractor.run 전체 경로를 실행한다.
+OCR은 합성 세션이면 정답 필드를 돌려주는 SyntheticBackend를 사용하고,
+녹화 세션이면 --responses 폴더에 녹화된 응답을 사용한다 (없는 응답만 Clova API로 요청하여 녹화).
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.synthetic import create_member_list, create_frames, LAYOUTS
+from config import ConfigManager, ConfigKeys
+from extractors import CircleMemberExtractor, DustFrontlineExtractor
+from utils.frame_source import ReplayFrameSource
+from utils.ocr_backend import ClovaBackend, ReplayBackend, SyntheticBackend, RESPONSE_FOLDER_NAME
+
+EXTRACTORS = {"circle": CircleMemberExtractor, "dust": DustFrontlineExtractor}
+
+
+def create_synthetic_session(path, frame_count=30, layout=LAYOUTS["circle"]):
+    """합성 목록으로 세션 파일을 만들고 (경로, SyntheticBackend)를 반환"""
+    list_image, fields = create_member_list(frame_count * 6, layout)
+    frames = create_frames(list_image, frame_height=900, scroll_step=610)[:frame_count]
+    frames = np.stack([cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR) for frame in frames])
+    np.savez_compressed(path, frames=frames, rect_ratio=np.array([16 / 9, 1 / 16, 1 / 16, 0.083, 0.062, 0.064]),
+                        client_width=np.array(1920))
+    return path, SyntheticBackend(list_image, fields)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("sessions", nargs="*")
+    parser.add_argument("--extractor", choices=EXTRACTORS.keys(), default="circle")
+    parser.add_argument("--full", action="store_true")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--responses", default=os.path.join(os.getcwd(), RESPONSE_FOLDER_NAME))
+    args = parser.parse_args()
+
+    extractor = EXTRACTORS[args.extractor]()
+    config = ConfigManager()
+    max_scroll = config.get(ConfigKeys.MAX_SCROLLS)
+
+    if args.sessions:
+        api_url = config.get([ConfigKeys.CLOVA_API, ConfigKeys.CLOVA_API_URL])
+        api_secret_key = config.get([ConfigKeys.CLOVA_API, ConfigKeys.CLOVA_X_OCR_SECRET])
+        backend = ReplayBackend(args.responses, ClovaBackend.from_config(config, api_url, api_secret_key))
+        sessions = [(path, backend) for path in args.sessions]
+    else:
+        sessions = [create_synthetic_session(os.path.join(tempfile.mkdtemp(), "synthetic.npz"),
+                                             layout=LAYOUTS[args.extractor])]
+
+    for path, backend in sessions:
+        source = ReplayFrameSource(path)
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            # 마지막 프레임에서 목록 끝을 확인하는 스크롤 2번 포함
+            capture_result = extractor.capture(source, max(max_scroll, len(source.frames) + 1), 0)
+            timings.append(time.perf_counter() - start)
+
+        print(f"📊 {os.path.basename(path)}: 프레임 {len(source.frames)}개, 병합 이미지 {capture_result.image.shape}, "
+              f"종료 사유 {capture_result.stop_reason}, 병합 {min(timings) * 1000:.1f}ms")
+
+        if args.full:
+            start = time.perf_counter()
+            result = extractor.run(ReplayFrameSource(path), backend)
+            print(f"📊 전체 추출 {time.perf_counter() - start:.2f}초: {result.excel_path}")
+
+
+if __name__ == "__main__":
+    main()
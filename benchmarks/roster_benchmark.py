@@ -0,0 +1,89 @@
+"""엑셀 저장 중 서클원 조회 비용 벤치마크 (선형 탐색 vs 닉네임/UID 색인)
+
+python -m benchmarks.roster_benchmark [--sizes 100 200 400 800 1600]
+
+명단 크기와 추출 목록 크기를 함께 늘리며, 엑셀 저장 한 번에 일어나는 조회
+(행마다 속성 열 5개 + 셀마다 스타일 처리 1번)를 기존 선형 탐색과 색인 조회로 비교한다.
+색인 쪽은 실제 CircleMemberExtractor의 엑셀 데이터 생성과 스타일 처리(openpyxl 저장 제외) 시간도 출력한다.
+"""
+import argparse
+import time
+
+from circle_member import CircleMember, CircleMemberManager
+from extractors import CircleMemberExtractor
+from utils.result_table import ResultTable
+
+MEMBER_ATTRIBUTES = ["join_date", "join_period", "arcalive_id", "uid", "remark"]
+
+
+class Cell:
+    """스타일 처리용 가짜 셀"""
+    fill = None
+
+
+def linear_get_by_nickname(members, nickname, attribute=None):
+    """기존 CircleMemberManager.get_by_nickname (명단 전체 선형 탐색)"""
+    member = next((member for member in members if member.nickname == nickname), None)
+    if member is None:
+        return None
+    return getattr(member, attribute) if attribute else member
+
+
+def export_lookups(get, nicknames, column_count):
+    """엑셀 저장 한 번의 조회: 행마다 속성 열 + 셀마다 스타일 처리"""
+    for nickname in nicknames:
+        for attribute in MEMBER_ATTRIBUTES:
+            get(nickname, attribute)
+        for _ in range(column_count):
+            get(nickname)
+
+
+def create_members(size):
+    return [CircleMember(nickname=f"member_{index:05d}", uid=str(100000 + index), join_date="2024-01-01")
+            for index in range(size)]
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 200, 400, 800, 1600])
+    args = parser.parse_args()
+
+    manager = CircleMemberManager()
+    extractor = CircleMemberExtractor()
+    column_count = len(extractor.excel_columns)
+
+    print(f"{'members':>8} {'rows':>6} {'linear ms':>10} {'indexed ms':>11} {'excel data + styles ms':>23}")
+    for size in args.sizes:
+        manager.members = create_members(size)
+        manager.rebuild_indexes()
+        # 목록에는 명단의 모든 서클원 + 명단에 없는 닉네임 10%
+        nicknames = [member.nickname for member in manager.members] + [f"guest_{i}" for i in range(size // 10)]
+
+        linear_time = timed(lambda: export_lookups(lambda nickname, attribute=None: linear_get_by_nickname(
+            manager.members, nickname, attribute), nicknames, column_count))
+        indexed_time = timed(lambda: export_lookups(manager.get_by_nickname, nicknames, column_count))
+
+        def export_path():
+            table = ResultTable.from_records(
+                [{"nickname": nickname, "position": "서클원", "weekly_contrib": 100, "total_contrib": 1000,
+                  "status": "접속 중", "level": 30} for nickname in nicknames],
+                [key for key, _ in extractor.ocr_headers], extractor.numeric_keys)
+            _, table = extractor._create_excel_data(table)
+            for index in range(len(table)):
+                row_data = table.row(index)
+                for column in extractor.excel_columns:
+                    column.style_handler(Cell(), row_data)
+
+        export_time = timed(export_path)
+        print(f"{size:>8} {len(nicknames):>6} {linear_time * 1000:>10.1f} {indexed_time * 1000:>11.1f} "
+              f"{export_time * 1000:>23.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""서클원 명단 저장 시간 벤치마크 (기존 JSON 전체 저장 vs JSON 저장소 vs SQLite 저장소)
+
+python -m benchmarks.roster_store_benchmark [--sizes 100 400 1600 6400] [--edits 50]
+
+명단 크기별로 셀 하나 수정(서클원 한 명 수정 + 저장)에 걸리는 평균 시간과,
+--edits 명을 삭제할 때 한 명씩 저장하는 경우와 transaction()으로 한 번에 저장하는 경우를 비교한다.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from utils.roster_store import JsonRosterStore, SqliteRosterStore
+
+
+def create_members(size):
+    return [{"nickname": f"member_{index:05d}", "uid": str(100000 + index), "arcalive_id": "",
+             "join_date": "2024-01-01", "position": "서클원", "remark": ""} for index in range(size)]
+
+
+def legacy_save(path, members):
+    """기존 CircleMemberManager.save_to_json (파일 전체를 들여쓰기하여 바로 덮어씀)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(members, f, ensure_ascii=False, indent=4)
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 400, 1600, 6400])
+    parser.add_argument("--edits", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'members':>8} {'legacy ms':>10} {'json ms':>8} {'sqlite ms':>10} "
+          f"{'json delete x' + str(args.edits):>17} {'sqlite delete x' + str(args.edits):>19} {'batched ms':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            members = create_members(size)
+            json_path = os.path.join(directory, f"members_{size}.json")
+            db_path = os.path.join(directory, f"members_{size}.db")
+            legacy_save(json_path, members)
+
+            json_store = JsonRosterStore(json_path)
+            sqlite_store = SqliteRosterStore(db_path, json_path=json_path)
+            json_ids = [data["id"] for data in json_store.load()]
+            sqlite_ids = [data["id"] for data in sqlite_store.load()]
+
+            def edit_each(save):
+                for index in range(args.edits):
+                    members[index]["remark"] = f"edit {index}"
+                    save(index)
+
+            legacy_time = timed(lambda: edit_each(lambda index: legacy_save(json_path, members)))
+            json_time = timed(lambda: edit_each(lambda index: json_store.update(json_ids[index], members[index])))
+            sqlite_time = timed(lambda: edit_each(lambda index: sqlite_store.update(sqlite_ids[index],
+                                                                                    members[index])))
+
+            json_delete_time = timed(lambda: [json_store.delete(member_id) for member_id in json_ids[:args.edits]])
+            sqlite_delete_time = timed(lambda: [sqlite_store.delete(member_id)
+                                                for member_id in sqlite_ids[:args.edits]])
+
+            def delete_batched():
+                with sqlite_store.transaction():
+                    for member_id in sqlite_ids[args.edits:args.edits * 2]:
+                        sqlite_store.delete(member_id)
+
+            batched_time = timed(delete_batched)
+            sqlite_store.close()
+
+            print(f"{size:>8} {legacy_time / args.edits * 1000:>10.2f} {json_time / args.edits * 1000:>8.2f} "
+                  f"{sqlite_time / args.edits * 1000:>10.2f} {json_delete_time * 1000:>17.1f} "
+                  f"{sqlite_delete_time * 1000:>19.1f} {batched_time * 1000:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
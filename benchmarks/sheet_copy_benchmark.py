@@ -0,0 +1,155 @@
+"""기존 시트 복사(Excel.copy_old_sheets) 시간 벤치마크 (셀마다 스타일 생성 vs 스타일 캐시)
+
+python -m benchmarks.sheet_copy_benchmark [--sheets 6] [--rows 200] [--repeat 3]
+
+서클원 추출 엑셀과 같은 모양(제목 병합, 헤더, 표, 일부 셀 채우기)의 시트를 --sheets개 만든 뒤
+기존 구현과 현재 구현으로 새 워크북에 복사하는 시간과 저장까지의 시간을 비교하고, 두 결과의 값과 스타일이 같은지 확인한다.
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+from openpyxl.reader.excel import load_workbook
+from openpyxl.styles import Font, Alignment, Border, PatternFill, Side
+from openpyxl.utils import get_column_letter
+from openpyxl.workbook import Workbook
+from openpyxl.worksheet.table import Table, TableStyleInfo
+
+from excel import Excel
+
+HEADERS = ["직위", "가입일", "가입기간", "닉네임", "아카라이브 ID", "UID", "레벨", "이번 주 공헌도", "누적 공헌도",
+           "부족한 공헌도", "상태", "비고"]
+FILLS = [PatternFill(start_color=color, end_color=color, fill_type="solid") for color in ["FFFFE0", "FFDFDF", "DFFFDF"]]
+
+
+def create_workbook(path, sheet_count, row_count):
+    """추출 엑셀과 같은 모양의 시트 sheet_count개"""
+    wb = Workbook()
+    wb.remove(wb.active)
+    last_column = get_column_letter(len(HEADERS))
+    thin = Side(style="thin")
+    for sheet_index in range(sheet_count):
+        sheet_name = (date(2025, 1, 1) + timedelta(weeks=sheet_index)).strftime('%Y-%m-%d')
+        ws = wb.create_sheet(sheet_name)
+        ws.merge_cells(f"A1:{last_column}1")
+        ws["A1"] = f"{sheet_name} 12:00:00"
+        ws["A1"].font = Font(size=16, bold=True)
+        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
+        ws.append(HEADERS)
+        for row in range(row_count):
+            ws.append(["서클원", "2024-01-01", 400 + row, f"member_{row:04d}", f"arca_{row}", str(100000 + row),
+                       30 + row % 20, row * 37 % 4000, row * 1000, max(0, 1500 - row * 37 % 4000), "접속 중", ""])
+            for column in range(1, len(HEADERS) + 1):
+                cell = ws.cell(ws.max_row, column)
+                if (row + column) % 7 == 0:
+                    cell.fill = FILLS[(row + column) % len(FILLS)]
+                if column == 9:
+                    cell.number_format = "#,##0"
+                    cell.border = Border(left=thin, right=thin)
+        table = Table(displayName=f"Table_{sheet_name.replace('-', '_')}", ref=f"A2:{last_column}{ws.max_row}")
+        table.tableStyleInfo = TableStyleInfo(name="TableStyleLight8", showFirstColumn=False, showLastColumn=False,
+                                              showRowStripes=True, showColumnStripes=False)
+        ws.add_table(table)
+    wb.save(path)
+
+
+def legacy_copy_old_sheets(new_wb, latest_file):
+    """기존 Excel.copy_old_sheets (셀마다 Font, Alignment, Border, PatternFill을 새로 만들어 설정)"""
+    old_wb = load_workbook(latest_file)
+    sheet_names = sorted(old_wb.sheetnames, reverse=True)[:6]
+
+    copied_sheets = []
+    for sheet_name in sheet_names:
+        old_ws = old_wb[sheet_name]
+        new_ws = new_wb.create_sheet(title=sheet_name)
+
+        for row in old_ws.iter_rows():
+            for cell in row:
+                new_ws[cell.coordinate].value = cell.value
+                new_cell = new_ws[cell.coordinate]
+                new_cell.font = Font(name=cell.font.name, size=cell.font.size, bold=cell.font.bold,
+                                     italic=cell.font.italic, color=cell.font.color)
+                new_cell.alignment = Alignment(horizontal=cell.alignment.horizontal,
+                                               vertical=cell.alignment.vertical)
+                new_cell.border = Border(left=cell.border.left, right=cell.border.right, top=cell.border.top,
+                                         bottom=cell.border.bottom)
+                new_cell.fill = PatternFill(fill_type=cell.fill.fill_type, fgColor=cell.fill.fgColor)
+                new_cell.number_format = cell.number_format
+
+        for merged_range in old_ws.merged_cells.ranges:
+            new_ws.merge_cells(str(merged_range))
+
+        for table in old_ws.tables.values():
+            new_table = Table(displayName=table.displayName, ref=table.ref)
+            new_table.tableStyleInfo = TableStyleInfo(
+                name=table.tableStyleInfo.name,
+                showFirstColumn=table.tableStyleInfo.showFirstColumn,
+                showLastColumn=table.tableStyleInfo.showLastColumn,
+                showRowStripes=table.tableStyleInfo.showRowStripes,
+                showColumnStripes=table.tableStyleInfo.showColumnStripes
+            )
+            new_ws.add_table(new_table)
+
+        copied_sheets.append(sheet_name)
+
+    return copied_sheets
+
+
+def copy_and_save(copy, latest_file, path):
+    wb = Workbook()
+    start = time.perf_counter()
+    copy(wb, latest_file)
+    copied = time.perf_counter()
+    wb.remove(wb.active)
+    wb.save(path)
+    return copied - start, time.perf_counter() - start
+
+
+def cell_signature(cell):
+    """비교할 값과 스타일 (기존 구현이 복사하던 속성)"""
+    return (cell.value, cell.font.b, cell.font.sz, cell.alignment.horizontal, cell.fill.fill_type,
+            cell.fill.fgColor.rgb, cell.border.left.style, cell.number_format)
+
+
+def same_workbooks(first_path, second_path):
+    first, second = load_workbook(first_path), load_workbook(second_path)
+    if first.sheetnames != second.sheetnames:
+        return False
+    for sheet_name in first.sheetnames:
+        first_ws, second_ws = first[sheet_name], second[sheet_name]
+        if (set(map(str, first_ws.merged_cells.ranges)) != set(map(str, second_ws.merged_cells.ranges))
+                or list(first_ws.tables) != list(second_ws.tables)):
+            return False
+        for first_row, second_row in zip(first_ws.iter_rows(), second_ws.iter_rows()):
+            if [cell_signature(cell) for cell in first_row] != [cell_signature(cell) for cell in second_row]:
+                return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sheets", type=int, default=6)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source_path = os.path.join(directory, "source.xlsx")
+        create_workbook(source_path, args.sheets, args.rows)
+
+        results = {}
+        for name, copy in [("legacy", legacy_copy_old_sheets), ("cached", Excel().copy_old_sheets)]:
+            path = os.path.join(directory, f"{name}.xlsx")
+            times = [copy_and_save(copy, source_path, path) for _ in range(args.repeat)]
+            results[name] = (min(copy_time for copy_time, _ in times), min(total for _, total in times), path)
+
+        print(f"{'mode':>8} {'copy ms':>8} {'copy + save ms':>15}")
+        for name, (copy_time, total_time, _) in results.items():
+            print(f"{name:>8} {copy_time * 1000:>8.1f} {total_time * 1000:>15.1f}")
+        print(f"same values and styles: {same_workbooks(results['legacy'][2], results['cached'][2])}")
+
+
+if __name__ == "__main__":
+    main()
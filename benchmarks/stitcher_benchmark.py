@@ -0,0 +1,63 @@
+"""스크롤 캡쳐 병합 벤치마크
+
+python -m benchmarks.stitcher_benchmark
+
+누적 프레임 수가 10, 50, 200일 때 마지막 SAMPLE_ITERATIONS회의 프레임당 처리 시간을 비교한다.
+"""
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import create_list_image, create_frames
+from utils import image
+from utils.stitcher import ImageStitcher
+
+FRAME_HEIGHT = 900
+SCROLL_STEP = 610
+FRAME_COUNTS = [10, 50, 200]
+SAMPLE_ITERATIONS = 5
+
+
+def legacy_stitch(frames):
+    """기존 Extractor.extract 방식: 누적 캔버스 전체 탐색 + np.vstack"""
+    warmup = len(frames) - SAMPLE_ITERATIONS
+
+    # 측정 전 구간은 매칭 없이 알려진 이동량으로 캔버스만 쌓음
+    canvas = np.vstack([frame[:SCROLL_STEP] for frame in frames[:warmup - 1]] + [frames[warmup - 1]])
+
+    crop_height = int(FRAME_HEIGHT * 0.2)
+    timings = []
+    for frame in frames[warmup:]:
+        start = time.perf_counter()
+        similarity, location = image.compare_images(canvas, frame[:crop_height])
+        if similarity > 0.8:
+            canvas = image.merge_images(canvas, frame, location)
+        timings.append(time.perf_counter() - start)
+    return canvas, timings
+
+
+def incremental_stitch(frames):
+    stitcher = ImageStitcher(frames[0])
+    timings = []
+    for frame in frames[1:]:
+        start = time.perf_counter()
+        stitcher.add(frame)
+        timings.append(time.perf_counter() - start)
+    return stitcher.image, timings[-SAMPLE_ITERATIONS:]
+
+
+def main():
+    row_count = (max(FRAME_COUNTS) * SCROLL_STEP + FRAME_HEIGHT) // 120 + 1
+    frames = create_frames(create_list_image(row_count), FRAME_HEIGHT, SCROLL_STEP)
+
+    print(f"{'frames':>8} {'legacy ms/iter':>16} {'stitcher ms/iter':>18}")
+    for count in FRAME_COUNTS:
+        legacy_canvas, legacy_timings = legacy_stitch(frames[:count])
+        canvas, timings = incremental_stitch(frames[:count])
+        assert legacy_canvas.shape == canvas.shape and (legacy_canvas == canvas).all()
+
+        print(f"{count:>8} {np.mean(legacy_timings) * 1000:>16.2f} {np.mean(timings) * 1000:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import cv2
+import numpy as np
+
+from circle_member import POSITIONS
+from utils.clova_ocr import OcrField
+
+ROW_HEIGHT = 120
+
+
+def create_list_image(row_count, width=1600, row_height=ROW_HEIGHT, seed=0):
+    """게임 목록과 비슷한 긴 grayscale 이미지를 생성"""
+    rng = np.random.default_rng(seed)
+    canvas = np.full((row_count * row_height, width), 40, dtype=np.uint8)
+
+    for row in range(row_count):
+        top = row * row_height
+        cv2.rectangle(canvas, (10, top + 8), (width - 10, top + row_height - 8), 70, -1)
+        cv2.putText(canvas, f"member_{row:04d}", (40, top + 50), cv2.FONT_HERSHEY_SIMPLEX, 1.2, 230, 2)
+        cv2.putText(canvas, f"Lv.{rng.integers(1, 61)}", (40, top + 95), cv2.FONT_HERSHEY_SIMPLEX, 0.9, 200, 2)
+        for col, x in enumerate(range(500, width - 200, 260)):
+            cv2.putText(canvas, str(rng.integers(0, 10000)), (x, top + 70), cv2.FONT_HERSHEY_SIMPLEX, 1.1, 220, 2)
+
+    return canvas
+
+
+def create_frames(list_image, frame_height, scroll_step):
+    """목록 이미지를 scroll_step씩 내려가며 잘라낸 화면 프레임 목록"""
+    frames = []
+    for top in range(0, list_image.shape[0] - frame_height + 1, scroll_step):
+        frames.append(list_image[top:top + frame_height].copy())
+    return frames
+
+
+# 추출기별 한 항목의 글자 배치 [(키, x, 항목 안의 글자 기준선 y)], 읽는 순서가 ocr_headers 순서와 같다
+STATUSES = ["접속 중", "1시간 전", "3일 전"]
+CIRCLE_LAYOUT = [("nickname", 160, 45), ("position", 520, 45), ("weekly_contrib", 800, 45),
+                 ("total_contrib", 1050, 45), ("status", 1300, 45), ("level", 160, 80)]
+DUST_LAYOUT = [("nickname", 160, 45), ("higher_point_title", 700, 45), ("total_point_title", 1100, 45),
+               ("level", 160, 80), ("position", 400, 80), ("higher_point", 700, 80), ("total_point", 1100, 80)]
+LAYOUTS = {"circle": CIRCLE_LAYOUT, "dust": DUST_LAYOUT}
+
+
+def member_values(row, rng):
+    """항목 하나의 정답 글자 {키: 글자}"""
+    position = POSITIONS[0] if row == 0 else POSITIONS[1] if row < 3 else POSITIONS[2]
+    return {
+        "nickname": f"member_{row:04d}",
+        "position": position,
+        "weekly_contrib": str(rng.integers(0, 631)),
+        "total_contrib": str(rng.integers(0, 100000)),
+        "status": STATUSES[rng.integers(0, len(STATUSES))],
+        "level": f"Lv.{rng.integers(1, 61)}",
+        "higher_point_title": "단일 전투 최고 점수",
+        "total_point_title": "누적 점수",
+        "higher_point": str(rng.integers(0, 5000)),
+        "total_point": str(rng.integers(0, 50000)),
+    }
+
+
+def create_member_list(row_count, layout=CIRCLE_LAYOUT, width=1600, row_height=ROW_HEIGHT, seed=0):
+    """목록 이미지와 정답 OcrField 목록을 생성 (SyntheticBackend용)
+
+    cv2.putText는 한글을 그리지 못하므로 이미지에는 글자 자리에 ASCII를 그리고, 정답 필드에는 실제 글자를 넣는다.
+    """
+    rng = np.random.default_rng(seed)
+    canvas = np.full((row_count * row_height, width), 40, dtype=np.uint8)
+    font, scale, thickness = cv2.FONT_HERSHEY_SIMPLEX, 0.9, 2
+
+    fields = []
+    for row in range(row_count):
+        top = row * row_height
+        cv2.rectangle(canvas, (10, top + 8), (width - 10, top + row_height - 8), 70, -1)
+        cv2.circle(canvas, (70, top + row_height // 2), 40, 150, -1)  # 프로필 아바타
+
+        values = member_values(row, rng)
+        for key, x, baseline in layout:
+            text = values[key]
+            drawn = text if text.isascii() else f"{key[:6]}_{row}"
+            (text_width, text_height), descent = cv2.getTextSize(drawn, font, scale, thickness)
+            cv2.putText(canvas, drawn, (x, top + baseline), font, scale, 220, thickness)
+            fields.append(OcrField(text, x, top + baseline - text_height, x + text_width, top + baseline + descent))
+
+    return canvas, fields
@@ -0,0 +1,105 @@
+"""레코드 토크나이저 벤치마크용 OCR 토큰 스트림 말뭉치
+
+Clova가 텍스트 순서로만 돌려줄 때 자주 생기는 오류(닉네임/직위/상태/레벨/제목이 나뉘어 인식, 숫자의 쉼표나
+붙은 글자, 인식되지 않은 숫자, 닉네임과 다음 글자가 붙어서 인식)를 정답 레코드에 섞어 토큰 스트림과 정답을 만든다.
+
+python -m benchmarks.token_corpus  # benchmarks/corpus/*.json 다시 생성
+"""
+import json
+import os
+
+import numpy as np
+
+from benchmarks.synthetic import member_values
+
+CORPUS_DIRECTORY = os.path.join(os.path.dirname(__file__), "corpus")
+CORPUS_KEYS = {
+    "circle": ["nickname", "position", "weekly_contrib", "total_contrib", "status", "level"],
+    "dust": ["nickname", "higher_point_title", "total_point_title", "level", "position", "higher_point",
+             "total_point"],
+}
+ERROR_RATE = 0.12
+GLUE_RATE = 0.08  # 닉네임이 다음 필드와 붙어서 인식되는 비율
+
+
+def split_token(text, at):
+    return [text[:at], text[at:]]
+
+
+def corrupt_record(key, text, rng):
+    """(토큰 목록, 정답 값) — 나뉜 토큰은 공백 없이 이어 붙인 값이 정답"""
+    if rng.random() >= ERROR_RATE:
+        return [text], text
+
+    if key == "nickname" and len(text) > 2:
+        return split_token(text, int(rng.integers(1, len(text)))), text
+    if key == "position" and text == "부서클장":
+        return split_token(text, 2), text
+    if key == "status" and " " in text:
+        tokens = text.split(" ")
+        return tokens, "".join(tokens)
+    if key == "level":
+        return split_token(text, 3), text
+    if key == "higher_point_title":
+        tokens = ["단일 전투", "최고 점수"]
+        return tokens, "".join(tokens)
+    if key in ("weekly_contrib", "total_contrib", "higher_point", "total_point"):
+        error = rng.integers(0, 3)
+        if error == 0:
+            return [f"{int(text):,}"], text
+        if error == 1:
+            return [f"{text}점"], text
+        return [], ""
+    return [text], text
+
+
+def generate_stream(extractor_name, record_count, seed):
+    rng = np.random.default_rng(seed)
+    glue_rng = np.random.default_rng(seed + 1000)  # 다른 오류의 난수 순서는 그대로 두기 위해 분리
+    keys = CORPUS_KEYS[extractor_name]
+    tokens, expected = [], []
+    for row in range(record_count):
+        values = member_values(row + seed * record_count, rng)
+        values["nickname"] = f"{values['nickname']}_{seed}"
+        record = {}
+        glue = glue_rng.random() < GLUE_RATE
+        for index, key in enumerate(keys):
+            record_tokens, record[key] = corrupt_record(key, values[key], rng)
+            if index == 1 and glue and record_tokens:
+                tokens[-1] += record_tokens.pop(0)
+            tokens.extend(record_tokens)
+        expected.append(record)
+    return {"tokens": tokens, "expected": expected}
+
+
+def split_nickname_stream(extractor_name, record_count, seed=0):
+    """모든 레코드의 닉네임만 둘로 나뉜 토큰 스트림 (기존 보정 루프도 처리할 수 있는 입력, 처리 시간 비교용)"""
+    rng = np.random.default_rng(seed)
+    tokens = []
+    for row in range(record_count):
+        values = member_values(row, rng)
+        for key in CORPUS_KEYS[extractor_name]:
+            tokens.extend(split_token(values[key], 4) if key == "nickname" else [values[key]])
+    return tokens
+
+
+def corpus_path(extractor_name):
+    return os.path.join(CORPUS_DIRECTORY, f"{extractor_name}_tokens.json")
+
+
+def load_corpus(extractor_name):
+    with open(corpus_path(extractor_name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(stream_count=20, record_count=30):
+    os.makedirs(CORPUS_DIRECTORY, exist_ok=True)
+    for extractor_name in CORPUS_KEYS:
+        streams = [generate_stream(extractor_name, record_count, seed) for seed in range(stream_count)]
+        with open(corpus_path(extractor_name), 'w', encoding='utf-8') as f:
+            json.dump(streams, f, ensure_ascii=False, indent=1)
+        print(f"✅ {corpus_path(extractor_name)}: 스트림 {stream_count}개")
+
+
+if __name__ == "__main__":
+    main()
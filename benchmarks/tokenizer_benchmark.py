@@ -0,0 +1,170 @@
+"""텍스트 순서 기반 레코드 분리의 정확도와 처리량 벤치마크 (기존 del 보정 루프 vs RecordTokenizer vs 명단 분할 + RecordTokenizer)
+
+python -m benchmarks.tokenizer_benchmark [--extractor circle|dust] [--scale 2000 8000]
+
+benchmarks/corpus의 토큰 스트림으로 정답과 같은 행의 비율을 비교하고,
+긴 입력으로 레코드 수에 따른 처리 시간을 비교한다.
+명단 분할(RosterSegmenter)의 명단은 정답 닉네임에서 ROSTER_MISSING_EVERY번째마다 뺀 것 (명단에 없는 새 서클원)
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from benchmarks.token_corpus import load_corpus, split_nickname_stream
+from extractors import CircleMemberExtractor, DustFrontlineExtractor
+from utils.ocr_layout import typed_row
+from utils.record_tokenizer import RecordTokenizer
+from utils.token_segmenter import RosterSegmenter
+
+EXTRACTORS = {"circle": CircleMemberExtractor, "dust": DustFrontlineExtractor}
+POSITIONS = ["서클장", "서클원", "부서클장"]
+ROSTER_MISSING_EVERY = 10
+
+
+def extract_numbers(input_string):
+    return ''.join(char for char in input_string if char.isdigit())
+
+
+def legacy_fix_circle(extracted_text, header_size):
+    """기존 CircleMemberExtractor._fix_extracted_text (서클원 목록이 비어 있는 경우)"""
+    if len(extracted_text) % header_size == 0:
+        return extracted_text
+
+    max_size = (len(extracted_text) // header_size) * header_size
+    for i in range(0, max_size, header_size):
+        if not extracted_text[i + 1] in POSITIONS:
+            extracted_text[i] += extracted_text[i + 1]
+            del extracted_text[i + 1]
+
+        if not extracted_text[i + 2].isdigit():
+            extracted_text[i + 1] += extracted_text[i + 2]
+            del extracted_text[i + 2]
+
+        if not extracted_text[i + 5].startswith("Lv"):
+            extracted_text[i + 4] += extracted_text[i + 5]
+            del extracted_text[i + 5]
+
+    return extracted_text
+
+
+def legacy_fix_dust(extracted_text, header_size):
+    """기존 DustFrontlineExtractor._fix_extracted_text (서클원 목록이 비어 있는 경우, 잘못된 인덱스 포함)"""
+    max_size = (len(extracted_text) // header_size) * header_size
+    for i in range(0, max_size, header_size):
+        if "단일 전투" not in extracted_text[i + 1]:
+            extracted_text[i] += extracted_text[i + 1]
+            del extracted_text[i + 1]
+
+        if "누적 점수" not in extracted_text[i + 2]:
+            extracted_text[i + 1] += extracted_text[i + 2]
+            del extracted_text[i + 3]
+
+        if not extracted_text[i + 3].startswith("Lv"):
+            extracted_text[i + 2] += extracted_text[i + 3]
+            del extracted_text[i + 3]
+
+        if not extracted_text[i + 4] in POSITIONS:
+            extracted_text[i + 3] += extracted_text[i + 4]
+            del extracted_text[i + 4]
+
+        if not extracted_text[i + 5].isdigit():
+            number = extract_numbers(extracted_text[i + 5])
+            extracted_text[i + 5] = 0 if number == "" else number
+
+        if not extracted_text[i + 6].isdigit():
+            number = extract_numbers(extracted_text[i + 6])
+            if number == "":
+                extracted_text[i + 5] = 0
+            else:
+                extracted_text[i + 6] = number
+
+    return extracted_text
+
+
+LEGACY_FIXES = {"circle": legacy_fix_circle, "dust": legacy_fix_dust}
+
+
+def legacy_parse(extractor, extractor_name, tokens):
+    """기존 경로 (보정 후 헤더 수만큼 묶음), 보정 중 인덱스 오류가 나면 그때까지의 행"""
+    header_size = len(extractor.ocr_headers)
+    try:
+        extracted_text = LEGACY_FIXES[extractor_name](list(tokens), header_size)
+    except IndexError:
+        return None
+    usable = (len(extracted_text) // header_size) * header_size
+    with contextlib.redirect_stdout(io.StringIO()):  # 숫자 인식 실패 경고 생략
+        return extractor._split_extracted_text(extracted_text[:usable]).records()
+
+
+def tokenizer_parse(extractor, tokens, segmenter: RosterSegmenter = None):
+    """RecordTokenizer 경로 (Extractor._tokenize_records에서 경고 출력만 뺀 것)"""
+    keys = [key for key, _ in extractor.ocr_headers]
+    if segmenter:
+        tokens = segmenter.segment(tokens)
+    with contextlib.redirect_stdout(io.StringIO()):  # 숫자 인식 실패 경고 생략
+        return [typed_row(values, keys, extractor.numeric_keys)
+                for values, _ in RecordTokenizer(extractor.record_grammar).tokenize(tokens)]
+
+
+def accuracy(rows, expected_rows):
+    if rows is None:
+        return 0.0
+    return sum(row == expected for row, expected in zip(rows, expected_rows)) / len(expected_rows)
+
+
+def timed(function, repeat=3):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--extractor", choices=EXTRACTORS.keys(), default="circle")
+    parser.add_argument("--scale", type=int, nargs="+", default=[1000, 4000, 16000])
+    args = parser.parse_args()
+
+    extractor = EXTRACTORS[args.extractor]()
+    keys = [key for key, _ in extractor.ocr_headers]
+    streams = load_corpus(args.extractor)
+
+    roster = [record["nickname"] for stream in streams for record in stream["expected"]]
+    segmenter = RosterSegmenter.from_grammar(extractor.record_grammar,
+                                             [nickname for i, nickname in enumerate(roster) if i % ROSTER_MISSING_EVERY])
+
+    legacy_scores, new_scores, segmented_scores = [], [], []
+    for stream in streams:
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected_rows = [typed_row(record, keys, extractor.numeric_keys) for record in stream["expected"]]
+        legacy_scores.append(accuracy(legacy_parse(extractor, args.extractor, stream["tokens"]), expected_rows))
+
+        new_scores.append(accuracy(tokenizer_parse(extractor, stream["tokens"]), expected_rows))
+        segmented_scores.append(accuracy(tokenizer_parse(extractor, stream["tokens"], segmenter), expected_rows))
+
+    token_count = sum(len(stream["tokens"]) for stream in streams)
+    print(f"📊 {args.extractor}: 스트림 {len(streams)}개, 토큰 {token_count}개")
+    print(f"   기존 보정 정확도 {sum(legacy_scores) / len(legacy_scores) * 100:.1f}% "
+          f"(완전히 맞은 스트림 {sum(score == 1.0 for score in legacy_scores)}개)")
+    print(f"   토크나이저 정확도 {sum(new_scores) / len(new_scores) * 100:.1f}% "
+          f"(완전히 맞은 스트림 {sum(score == 1.0 for score in new_scores)}개)")
+    print(f"   명단 분할 + 토크나이저 정확도 {sum(segmented_scores) / len(segmented_scores) * 100:.1f}% "
+          f"(완전히 맞은 스트림 {sum(score == 1.0 for score in segmented_scores)}개)")
+
+    # 레코드 수에 따른 처리 시간 (기존 보정 루프도 끝까지 처리하는, 닉네임만 나뉜 입력)
+    print(f"{'records':>8} {'legacy ms':>10} {'tokenizer ms':>13} {'tokens/s':>12} {'segmented ms':>13}")
+    for record_count in args.scale:
+        tokens = split_nickname_stream(args.extractor, record_count)
+        legacy_time, _ = timed(lambda: legacy_parse(extractor, args.extractor, tokens), 1)
+        new_time, _ = timed(lambda: tokenizer_parse(extractor, tokens))
+        segmented_time, _ = timed(lambda: tokenizer_parse(extractor, tokens, segmenter))
+        print(f"{record_count:>8} {legacy_time * 1000:>10.1f} {new_time * 1000:>13.1f} {len(tokens) / new_time:>12.0f} "
+              f"{segmented_time * 1000:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
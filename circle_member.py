@@ -1,30 +1,60 @@
-import json
 import os
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import date, datetime
+
+from config import ConfigManager, ConfigKeys
+from utils.game_clock import game_today
+from utils.nickname_index import AliasTable, NicknameIndex
+from utils.roster_store import RosterStore, JsonRosterStore, SqliteRosterStore
 
 CIRCLE_MEMBERS_FILENAME = "circle_members.json"
 CIRCLE_MEMBERS_PATH = os.path.join(os.getcwd(), CIRCLE_MEMBERS_FILENAME)
+CIRCLE_MEMBERS_DB_FILENAME = "circle_members.db"
+CIRCLE_MEMBERS_DB_PATH = os.path.join(os.getcwd(), CIRCLE_MEMBERS_DB_FILENAME)
+NICKNAME_ALIASES_FILENAME = "nickname_aliases.json"
+NICKNAME_ALIASES_PATH = os.path.join(os.getcwd(), NICKNAME_ALIASES_FILENAME)
+
+# 직위 리스트
+POSITIONS = ["서클장", "부서클장", "서클원"]
 
 
 class CircleMember:
-    def __init__(self, nickname="새 서클원", uid="", arcalive_id="", join_date=None, position="서클원", remark=""):
+    # 서클원 수만큼 만들어지므로 __dict__ 없이 저장, 가입일은 설정할 때 한 번만 날짜로 변환
+    __slots__ = ("member_id", "nickname", "uid", "arcalive_id", "_join_date", "joined_on", "position", "remark")
+
+    def __init__(self, nickname="새 서클원", uid="", arcalive_id="", join_date=None, position="서클원", remark="",
+                 member_id=None):
+        self.member_id = member_id  # 저장소의 번호 (저장 전에는 None)
         self.nickname = nickname
         self.uid = uid
         self.arcalive_id = arcalive_id
-        self.join_date = join_date if join_date else datetime.now()
+        self.join_date = join_date
         self.position = position
         self.remark = remark
-        self.join_date = join_date.strftime("%Y-%m-%d") if isinstance(join_date, datetime) else join_date
 
     @property
-    def join_period(self):
-        result = None
-        if self.join_date:
-            join_date = datetime.strptime(self.join_date, "%Y-%m-%d")
-            today = datetime.now()
-            result = (today - join_date).days
+    def join_date(self):
+        """가입일 문자열 (YYYY-MM-DD)"""
+        return self._join_date
 
-        return result
+    @join_date.setter
+    def join_date(self, join_date):
+        if isinstance(join_date, (datetime, date)):
+            join_date = join_date.strftime("%Y-%m-%d")
+        self._join_date = join_date
+
+        # 가입기간 계산, 엑셀 저장용 날짜 (형식이 맞지 않으면 None)
+        try:
+            self.joined_on = datetime.strptime(join_date, "%Y-%m-%d").date() if join_date else None
+        except ValueError:
+            self.joined_on = None
+
+    @property
+    def join_period(self):
+        """5시 기준 오늘까지의 가입 일수"""
+        if self.joined_on is None:
+            return None
+        return (game_today() - self.joined_on).days
 
     def to_dict(self):
         """서클원 객체를 딕셔너리로 변환"""
@@ -46,10 +76,18 @@ class CircleMember:
             arcalive_id=data["arcalive_id"],
             join_date=data["join_date"],
             position=data["position"],
-            remark=data["remark"]
+            remark=data["remark"],
+            member_id=data.get("id")
         )
 
 
+def create_roster_store() -> RosterStore:
+    """설정(roster_store)에 따른 명단 저장소, sqlite면 처음 한 번 circle_members.json을 가져옴"""
+    if ConfigManager().get(ConfigKeys.ROSTER_STORE) == "sqlite":
+        return SqliteRosterStore(CIRCLE_MEMBERS_DB_PATH, json_path=CIRCLE_MEMBERS_PATH)
+    return JsonRosterStore(CIRCLE_MEMBERS_PATH)
+
+
 class CircleMemberManager:
     _instance = None
     _initialized = False
@@ -64,46 +102,168 @@ class CircleMemberManager:
         if not self._initialized:
             self._initialized = True
             self.members = []
-            self.load_from_json()
+            self.aliases = AliasTable(NICKNAME_ALIASES_PATH)
+            self._nickname_index = None
+            self._unresolved = set()
+            self.fuzzy_matches = {}  # 이번 실행에서 편집 거리로 추정한 OCR 닉네임 -> 명단 닉네임 (확인 전이라 저장하지 않음)
+            self._by_nickname = {}  # 닉네임 -> [서클원] (같은 닉네임이 여럿이면 먼저 추가된 서클원이 앞)
+            self._by_uid = {}  # UID -> [서클원]
+            self._indexed_keys = {}  # id(서클원) -> 색인에 넣을 때의 (닉네임, UID), 제자리 수정 후 제거용
+            self.store = create_roster_store()
+            self.load()
+
+    @property
+    def nickname_index(self):
+        """명단 닉네임 색인 (명단이 바뀌면 다음 조회 때 다시 생성)"""
+        if self._nickname_index is None:
+            self._nickname_index = NicknameIndex(member.nickname for member in self.members)
+            self._unresolved = set()
+        return self._nickname_index
+
+    def invalidate_index(self):
+        self._nickname_index = None
+
+    def _index_member(self, member):
+        self._indexed_keys[id(member)] = (member.nickname, member.uid)
+        self._by_nickname.setdefault(member.nickname, []).append(member)
+        if member.uid:
+            self._by_uid.setdefault(member.uid, []).append(member)
+
+    def _unindex_member(self, member):
+        nickname, uid = self._indexed_keys.pop(id(member), (None, None))
+        for index, key in ((self._by_nickname, nickname), (self._by_uid, uid)):
+            members = index.get(key)
+            if members is None:
+                continue
+            members[:] = [indexed for indexed in members if indexed is not member]
+            if not members:
+                del index[key]
+
+    def rebuild_indexes(self):
+        """members 목록을 직접 바꾼 경우 닉네임/UID 색인을 다시 생성"""
+        self._by_nickname = {}
+        self._by_uid = {}
+        self._indexed_keys = {}
+        for member in self.members:
+            self._index_member(member)
+        self.invalidate_index()
 
     def add_member(self, member=None):
         """서클원 추가"""
         if member is None:
             member = CircleMember()
 
+        member.member_id = self.store.insert(member.to_dict())
         self.members.append(member)
+        self._index_member(member)
+        self.invalidate_index()
         return member
 
     def update_member(self, idx, updated_member):
-        """서클원의 데이터를 수정"""
+        """서클원의 데이터를 수정 (제자리에서 수정한 서클원도 색인에 넣을 때의 키로 찾아 갱신)"""
+        updated_member.member_id = self.members[idx].member_id
+        self.store.update(updated_member.member_id, updated_member.to_dict())
+        self._unindex_member(self.members[idx])
         self.members[idx] = updated_member
-        self.save_to_json()
+        self._index_member(updated_member)
+        self.invalidate_index()
 
     def remove_member(self, idx):
-        """서클원 추가"""
+        """서클원 삭제"""
+        self.store.delete(self.members[idx].member_id)
+        self._unindex_member(self.members[idx])
         del self.members[idx]
+        self.invalidate_index()
 
-    def save_to_json(self):
-        """JSON 파일로 저장"""
-        with open(CIRCLE_MEMBERS_PATH, 'w', encoding='utf-8') as f:
-            json.dump([member.to_dict() for member in self.members], f, ensure_ascii=False, indent=4)
-
-    def load_from_json(self):
-        """JSON 파일에서 데이터 로드"""
+    @contextmanager
+    def transaction(self):
+        """with 블록 안의 추가/수정/삭제를 한 번에 저장, 예외가 나면 저장소에서 다시 로드"""
         try:
-            with open(CIRCLE_MEMBERS_PATH, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.members = [CircleMember.from_dict(member) for member in data]
-        except FileNotFoundError:
-            print(f"{CIRCLE_MEMBERS_PATH} 파일이 존재하지 않습니다.")
-            self.members = []
+            with self.store.transaction():
+                yield self
+        except Exception:
+            self.load()
+            raise
+
+    def save_to_json(self, path=CIRCLE_MEMBERS_PATH):
+        """JSON 파일로 내보내기 (변경은 저장소에 바로 저장되므로 호환용)"""
+        self.store.export_json(path)
+
+    def load(self):
+        """저장소에서 데이터 로드"""
+        self.members = [CircleMember.from_dict(member) for member in self.store.load()]
+        self.rebuild_indexes()
+
+    def resolve_nickname(self, nickname):
+        """OCR로 읽은 닉네임에 해당하는 명단의 닉네임, 없으면 None
+
+        정확히 일치하지 않으면 대응표 -> 헷갈리는 글자와 편집 거리를 고려한 색인 순으로 찾는다.
+        색인으로 추정한 닉네임은 이번 실행에서만 기억하고(fuzzy_matches), 사용자가 확인한 것만 대응표에 저장한다.
+        """
+        index = self.nickname_index
+        if nickname in index:
+            return nickname
+
+        alias = self.aliases.get(nickname)
+        if alias in index:
+            return alias
+
+        fuzzy = self.fuzzy_matches.get(nickname)
+        if fuzzy in index:
+            return fuzzy
+
+        if nickname in self._unresolved:
+            return None
+
+        match = index.search(nickname)
+        if match is None:
+            self._unresolved.add(nickname)
+            return None
+
+        resolved, distance = match
+        print(f"🔎 '{nickname}'을(를) 서클원 '{resolved}'(으)로 추정합니다. (편집 거리 {distance}, 확인 전)")
+        self.fuzzy_matches[nickname] = resolved
+        return resolved
+
+    def fuzzy_match(self, nickname):
+        """편집 거리로 추정해 찾은 명단 닉네임 (정확히 일치하거나 대응표로 찾았으면 None)"""
+        resolved = self.resolve_nickname(nickname)
+        return resolved if resolved is not None and self.fuzzy_matches.get(nickname) == resolved else None
+
+    def confirm_alias(self, nickname, resolved):
+        """사용자가 확인한 OCR 닉네임 -> 명단 닉네임 대응을 대응표에 저장"""
+        self.aliases.add(nickname, resolved)
+        self.fuzzy_matches.pop(nickname, None)
+
+    def reject_alias(self, nickname):
+        """잘못 추정한 닉네임은 이번 실행에서 명단에 없는 닉네임으로 처리"""
+        self.fuzzy_matches.pop(nickname, None)
+        self._unresolved.add(nickname)
 
     def get_by_nickname(self, nickname, attribute=None):
-        circle_member_manager = CircleMemberManager()
-        members: list[CircleMember] = circle_member_manager.members
-        member = next((member for member in members if member.nickname == nickname), None)
+        members = self._by_nickname.get(self.resolve_nickname(nickname))
+        member = members[0] if members else None
 
         if member is None:
             return None
         else:
             return getattr(member, attribute) if attribute else member
+
+    def get_by_uid(self, uid, attribute=None):
+        members = self._by_uid.get(uid)
+        member = members[0] if members else None
+
+        if member is None:
+            return None
+        else:
+            return getattr(member, attribute) if attribute else member
+
+    def get_by_nicknames(self, nicknames, attribute=None):
+        """닉네임 목록을 한 번에 찾음 (같은 닉네임은 한 번만 찾고, 목록 순서대로 서클원 또는 속성 값, 없으면 None)"""
+        found = {}
+        result = []
+        for nickname in nicknames:
+            if nickname not in found:
+                found[nickname] = self.get_by_nickname(nickname, attribute)
+            result.append(found[nickname])
+        return result
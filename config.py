@@ -1,19 +1,49 @@
+import atexit
 import copy
 import json
 import os
+import threading
+import time
 
 CONFIG_FILE_NAME = "config.json"
 CONFIG_PATH = os.path.join(os.getcwd(), CONFIG_FILE_NAME)
 
+# 마지막 변경 후 이 시간(초) 동안 변경이 없으면 저장 (입력 중에는 파일을 쓰지 않음)
+SAVE_DELAY = 0.5
+# 저장에 실패하면(파일 잠김 등) 이 시간(초) 뒤에 다시 저장
+SAVE_RETRY_DELAY = 2.0
+
 
 class ConfigKeys:
     """Config 파일의 키 값을 관리하는 클래스"""
     WINDOW_TITLE = "window_title"
     MAX_SCROLLS = "max_scrolls"
     SCROLL_REPEAT = "scroll_repeat"
+    SCROLL_MOTION_WAIT = "scroll_motion_wait"
     CONTRIB_LIMIT = "contrib_limit"
     DUST_POINT_LIMIT = "dust_point_limit"
     DUST_START_DATE = "dust_start_date"
+    RECORD_SESSION = "record_session"
+    MATCHER_ENGINE = "matcher_engine"
+    OCR_PIPELINE = "ocr_pipeline"
+    OCR_PIPELINE_WORKERS = "ocr_pipeline_workers"
+    OCR_BAND_FRAMES = "ocr_band_frames"
+    OCR_TILE_HEIGHT = "ocr_tile_height"
+    OCR_TILE_OVERLAP = "ocr_tile_overlap"
+    OCR_TILE_CONCURRENCY = "ocr_tile_concurrency"
+    OCR_TILE_BATCH = "ocr_tile_batch"
+    OCR_FORMAT = "ocr_format"
+    OCR_JPEG_QUALITY = "ocr_jpeg_quality"
+    OCR_GLYPH_HEIGHT = "ocr_glyph_height"
+    OCR_GRAY_LEVELS = "ocr_gray_levels"
+    OCR_BLANK_COLUMNS = "ocr_blank_columns"
+    OCR_RATE_LIMIT = "ocr_rate_limit"
+    OCR_RATE_BURST = "ocr_rate_burst"
+    OCR_MAX_IN_FLIGHT = "ocr_max_in_flight"
+    OCR_MONTHLY_LIMIT = "ocr_monthly_limit"
+    OCR_RESPONSE_CACHE = "ocr_response_cache"
+    ROSTER_STORE = "roster_store"
+    EXCEL_ENGINE = "excel_engine"
     CLOVA_API = "clova_api"
     CLOVA_X_OCR_SECRET = "x_ocr_secret"
     CLOVA_API_URL = "api_url"
@@ -23,9 +53,31 @@ DEFAULT_CONFIG = {
     ConfigKeys.WINDOW_TITLE: "EXILIUM",
     ConfigKeys.MAX_SCROLLS: 20,
     ConfigKeys.SCROLL_REPEAT: 25,
+    ConfigKeys.SCROLL_MOTION_WAIT: 0.8,
     ConfigKeys.CONTRIB_LIMIT: 270,
     ConfigKeys.DUST_POINT_LIMIT: 1600,
     ConfigKeys.DUST_START_DATE: "2025-01-01",
+    ConfigKeys.RECORD_SESSION: False,
+    ConfigKeys.MATCHER_ENGINE: "full",
+    ConfigKeys.OCR_PIPELINE: False,
+    ConfigKeys.OCR_PIPELINE_WORKERS: 2,
+    ConfigKeys.OCR_BAND_FRAMES: 3,
+    ConfigKeys.OCR_TILE_HEIGHT: 4000,
+    ConfigKeys.OCR_TILE_OVERLAP: 200,
+    ConfigKeys.OCR_TILE_CONCURRENCY: 2,
+    ConfigKeys.OCR_TILE_BATCH: False,
+    ConfigKeys.OCR_FORMAT: "jpg",
+    ConfigKeys.OCR_JPEG_QUALITY: 95,
+    ConfigKeys.OCR_GLYPH_HEIGHT: 0,
+    ConfigKeys.OCR_GRAY_LEVELS: 256,
+    ConfigKeys.OCR_BLANK_COLUMNS: [],
+    ConfigKeys.OCR_RATE_LIMIT: 5,
+    ConfigKeys.OCR_RATE_BURST: 2,
+    ConfigKeys.OCR_MAX_IN_FLIGHT: 2,
+    ConfigKeys.OCR_MONTHLY_LIMIT: 0,
+    ConfigKeys.OCR_RESPONSE_CACHE: False,
+    ConfigKeys.ROSTER_STORE: "json",
+    ConfigKeys.EXCEL_ENGINE: "write_only",
     ConfigKeys.CLOVA_API: {
         ConfigKeys.CLOVA_X_OCR_SECRET: "",
         ConfigKeys.CLOVA_API_URL: ""
@@ -46,7 +98,14 @@ class ConfigManager:
     def __init__(self):
         if not self._initialized:
             self._initialized = True
+            self._condition = threading.Condition(threading.RLock())  # 설정 읽기/쓰기 보호
+            self._write_lock = threading.Lock()  # 파일 저장 순서 보장
+            self._dirty = False
+            self._version = 0  # 변경할 때마다 증가, 저장 중에 바뀐 변경을 저장된 것으로 처리하지 않도록 확인
+            self._save_at = 0.0
+            self._writer = None
             self._load_config()
+            atexit.register(self.flush)
 
     def _load_config(self):
         """설정 파일을 로드하는 메서드."""
@@ -63,31 +122,87 @@ class ConfigManager:
         if isinstance(keys, str):
             keys = [keys]
 
-        value = self._config
-        for key in keys:
-            value = value.get(key)
+        with self._condition:
+            value = self._config
+            for key in keys:
+                value = value.get(key)
         return default if value is None else value
 
     def set(self, keys, value):
-        """키 경로로 값을 설정하는 메서드"""
+        """키 경로로 값을 설정하는 메서드 (파일은 SAVE_DELAY초 동안 변경이 없을 때 백그라운드에서 저장)"""
         if isinstance(keys, str):
             keys = [keys]
 
-        data = self._config
-        for key in keys[:-1]:
-            data = data.get(key)
-        data[keys[-1]] = value
-
-        self._save_config()
+        with self._condition:
+            data = self._config
+            for key in keys[:-1]:
+                data = data.get(key)
+            data[keys[-1]] = value
+
+            self._dirty = True
+            self._version += 1
+            self._save_at = time.monotonic() + SAVE_DELAY
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_behind, name="config-writer", daemon=True)
+                self._writer.start()
+            self._condition.notify()
+
+    def _write_behind(self):
+        """변경이 멈추면 저장하는 백그라운드 스레드 (저장에 실패하면 SAVE_RETRY_DELAY초 뒤에 다시 저장)"""
+        try:
+            while True:
+                with self._condition:
+                    while not self._dirty:
+                        self._condition.wait()
+                    remaining = self._save_at - time.monotonic()
+                    if remaining > 0:
+                        self._condition.wait(remaining)
+                        continue
+                try:
+                    self.flush()
+                except OSError as e:
+                    print(f"⚠️ 설정 파일을 저장하지 못했습니다. {SAVE_RETRY_DELAY}초 뒤에 다시 저장합니다: {e}")
+                    with self._condition:
+                        self._save_at = max(self._save_at, time.monotonic() + SAVE_RETRY_DELAY)
+        finally:
+            # 예상하지 못한 오류로 종료되면 다음 set에서 스레드를 다시 시작
+            with self._condition:
+                self._writer = None
+
+    def flush(self):
+        """저장하지 않은 변경이 있으면 바로 저장 (종료할 때 호출), 저장에 실패하면 변경은 저장 대기 상태로 남음"""
+        with self._write_lock:
+            with self._condition:
+                if not self._dirty:
+                    return
+                text = json.dumps(self._config, ensure_ascii=False, indent=4)
+                version = self._version
+            self._write(text)
+            with self._condition:
+                if self._version == version:
+                    self._dirty = False
 
     def _save_config(self):
-        """설정을 파일에 저장하는 메서드."""
-        with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-            json.dump(self._config, f, ensure_ascii=False, indent=4)
+        """설정을 파일에 바로 저장하는 메서드."""
+        with self._condition:
+            self._dirty = True
+            self._version += 1
+        self.flush()
+
+    @staticmethod
+    def _write(text):
+        # 임시 파일에 쓴 뒤 교체하여, 저장 중 종료되어도 기존 설정 파일이 깨지지 않게 함
+        temp_path = f"{CONFIG_PATH}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, CONFIG_PATH)
 
     def __repr__(self):
         """현재 설정을 보기 좋게 출력."""
-        return json.dumps(self._config, indent=4, ensure_ascii=False)
+        with self._condition:
+            return json.dumps(self._config, indent=4, ensure_ascii=False)
 
     @staticmethod
     def _init_default_config(config=None):
@@ -1,12 +1,45 @@
 import os
+import warnings
 from datetime import datetime
 
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import Cell, MergedCell
+from openpyxl.cell.read_only import ReadOnlyCell, EmptyCell
 from openpyxl.reader.excel import load_workbook
-from openpyxl.styles import Font, Alignment, Border, PatternFill
+from openpyxl.styles import Font, Alignment
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles.numbers import BUILTIN_FORMATS_MAX_SIZE
 from openpyxl.utils import get_column_letter
 from openpyxl.workbook import Workbook
 from openpyxl.worksheet.table import Table, TableStyleInfo
 
+from config import ConfigManager, ConfigKeys
+from utils.result_table import ResultTable
+from .output_manifest import OutputManifest
+
+# 제목 행 스타일
+TITLE_FONT = Font(size=16, bold=True)
+TITLE_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+TITLE_HEIGHT = 25
+
+# 결과 표 스타일 (TableStyleInfo 인자, 매니페스트에도 그대로 기록)
+TABLE_STYLE = {"name": "TableStyleLight8", "showFirstColumn": False, "showLastColumn": False,
+               "showRowStripes": True, "showColumnStripes": False}
+
+
+class StyleProbe:
+    """style_handler가 셀에 설정한 스타일만 기록하는 셀 대신 객체 (write_only 저장용)"""
+    __slots__ = ("font", "fill", "border", "alignment", "number_format")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.font = self.fill = self.border = self.alignment = self.number_format = None
+
+    def objects(self):
+        return self.font, self.fill, self.border, self.alignment, self.number_format
+
 
 class Excel:
     _instance = None
@@ -36,72 +69,113 @@ class Excel:
         return sheetnames
 
     def find_latest_excel_file(self, directory):
-        """output 폴더에서 가장 최신의 엑셀 파일을 찾습니다."""
-        files = [f for f in os.listdir(directory) if f.endswith('.xlsx')]
+        """output 폴더에서 가장 최신의 엑셀 파일을 찾습니다. (폴더 목록 대신 매니페스트 기록 사용, 금일 파일 제외)"""
+        with OutputManifest(directory) as manifest:
+            return manifest.latest(exclude_prefix=datetime.now().strftime('%Y-%m-%d'))
+
+    def read_old_sheets(self, latest_file, sheets=None):
+        """기존 엑셀 파일의 최근 6개 시트: (워크북, [(시트 정보, (1, 1)부터의 행 반복자)])
+
+        매니페스트에 시트의 병합/표 정보(sheets)가 있으면 read_only로 열어 필요한 시트만 읽고,
+        없으면(매니페스트 이전 파일) 워크북 전체를 읽어 시트 정보를 만든다.
+        """
+        if sheets and all(sheet["merged"] is not None for sheet in sheets):
+            old_wb = load_workbook(latest_file, read_only=True)
+        else:
+            old_wb = load_workbook(latest_file)
+            sheets = [self._sheet_layout(ws) for ws in old_wb.worksheets]
 
-        # 금일 날짜 제외
-        today_date = datetime.now().strftime('%Y-%m-%d')
-        files = [f for f in files if not f.startswith(today_date)]
-        if not files:
-            return None
+        sheets = sorted(sheets, key=lambda sheet: sheet["name"], reverse=True)[:6]  # 최근 6개 시트만 가져옴
+        return old_wb, [(sheet, old_wb[sheet["name"]].iter_rows(min_row=1, min_col=1)) for sheet in sheets]
 
-        # 최신 파일 찾기
-        latest_file = max(files, key=lambda x: os.path.getmtime(os.path.join(directory, x)))
-        return os.path.join(directory, latest_file)
+    def copy_old_sheets(self, new_wb, latest_file, sheets=None):
+        """기존 엑셀 파일에서 최근 6개 시트를 복사하여 새로운 워크북에 추가하고 복사한 시트 정보를 반환
 
-    def copy_old_sheets(self, new_wb, latest_file):
-        """기존 엑셀 파일에서 최근 6개 시트를 복사하여 새로운 워크북에 추가"""
+        셀마다 스타일 객체를 새로 만들지 않고, 원본의 셀 스타일(글꼴, 채우기, 테두리, 정렬, 표시 형식 번호 묶음)을
+        종류별로 한 번만 새 워크북에 등록한 뒤 값과 스타일 번호만 복사한다.
+        """
         if not latest_file:
             return []  # 기존 파일이 없으면 빈 리스트 반환
 
-        old_wb = load_workbook(latest_file)
-        sheet_names = sorted(old_wb.sheetnames, reverse=True)[:6]  # 최근 6개 시트만 가져옴
+        old_wb, old_sheets = self.read_old_sheets(latest_file, sheets)
 
+        style_cache = {}  # 원본 StyleArray -> 새 워크북의 StyleArray
         copied_sheets = []
-        for sheet_name in sheet_names:
-            old_ws = old_wb[sheet_name]
-            new_ws = new_wb.create_sheet(title=sheet_name)
+        for sheet, rows in old_sheets:
+            new_ws = new_wb.create_sheet(title=sheet["name"])
+
+            # 값과 스타일 번호 복사 (병합된 셀은 마지막에 병합 정보로 복원)
+            cells = new_ws._cells
+            row_count = 0
+            for row_count, row in enumerate(rows, 1):
+                for column, cell in enumerate(row, 1):
+                    if isinstance(cell, (MergedCell, EmptyCell)) or (cell.value is None and not cell.has_style):
+                        continue
+                    style = self._new_style(old_wb, new_wb, cell, style_cache)
+                    new_cell = Cell(new_ws, row=row_count, column=column, style_array=style)
+                    new_cell._value = cell.value
+                    new_cell.data_type = cell.data_type
+                    cells[(row_count, column)] = new_cell
+
+            # 셀 병합 정보, 테이블 복사
+            for merged_range in sheet["merged"]:
+                new_ws.merge_cells(merged_range)
+            for table in sheet["tables"]:
+                new_ws.add_table(self._create_table(table))
+
+            copied_sheets.append({**sheet, "rows": row_count})
+
+        old_wb.close()
+        return copied_sheets
 
-            for row in old_ws.iter_rows():
-                for cell in row:
-                    new_ws[cell.coordinate].value = cell.value
-                    # 셀 스타일도 복사합니다.
-                    new_cell = new_ws[cell.coordinate]
-
-                    # 스타일 속성 복사
-                    new_cell.font = Font(name=cell.font.name, size=cell.font.size, bold=cell.font.bold,
-                                         italic=cell.font.italic, color=cell.font.color)
-                    new_cell.alignment = Alignment(horizontal=cell.alignment.horizontal,
-                                                   vertical=cell.alignment.vertical)
-                    new_cell.border = Border(left=cell.border.left, right=cell.border.right, top=cell.border.top,
-                                             bottom=cell.border.bottom)
-                    new_cell.fill = PatternFill(fill_type=cell.fill.fill_type, fgColor=cell.fill.fgColor)
-                    new_cell.number_format = cell.number_format
-
-            # 셀 병합 정보 복사
-            for merged_range in old_ws.merged_cells.ranges:
-                new_ws.merge_cells(str(merged_range))
-
-            # 테이블 복사
-            for table in old_ws.tables.values():
-                new_table = Table(displayName=table.displayName, ref=table.ref)
-
-                # 테이블 스타일 복사
-                new_table.tableStyleInfo = TableStyleInfo(
-                    name=table.tableStyleInfo.name,
-                    showFirstColumn=table.tableStyleInfo.showFirstColumn,
-                    showLastColumn=table.tableStyleInfo.showLastColumn,
-                    showRowStripes=table.tableStyleInfo.showRowStripes,
-                    showColumnStripes=table.tableStyleInfo.showColumnStripes
-                )
-                new_ws.add_table(new_table)
-
-            copied_sheets.append(sheet_name)
+    def _new_style(self, old_wb, new_wb, cell, style_cache):
+        """원본 셀의 스타일을 새 워크북에 등록한 StyleArray (스타일 종류마다 한 번만 등록)"""
+        style = cell.style_array if isinstance(cell, ReadOnlyCell) else cell._style
+        new_style = style_cache.get(style)
+        if new_style is None:
+            new_style = style_cache[style] = self._copy_style(old_wb, new_wb, style)
+        return new_style
+
+    @staticmethod
+    def _copy_style(old_wb, new_wb, style: StyleArray):
+        """원본 워크북의 셀 스타일을 새 워크북에 등록한 StyleArray (같은 스타일은 기존 번호를 재사용)"""
+        number_format_id = style.numFmtId
+        if number_format_id >= BUILTIN_FORMATS_MAX_SIZE:  # 사용자 지정 표시 형식
+            number_format = old_wb._number_formats[number_format_id - BUILTIN_FORMATS_MAX_SIZE]
+            number_format_id = new_wb._number_formats.add(number_format) + BUILTIN_FORMATS_MAX_SIZE
+
+        new_style = StyleArray()
+        new_style.fontId = new_wb._fonts.add(old_wb._fonts[style.fontId])
+        new_style.fillId = new_wb._fills.add(old_wb._fills[style.fillId])
+        new_style.borderId = new_wb._borders.add(old_wb._borders[style.borderId])
+        new_style.numFmtId = number_format_id
+        new_style.protectionId = new_wb._protections.add(old_wb._protections[style.protectionId])
+        new_style.alignmentId = new_wb._alignments.add(old_wb._alignments[style.alignmentId])
+        new_style.pivotButton = style.pivotButton
+        new_style.quotePrefix = style.quotePrefix
+        return new_style
+
+    def export(self, path, sheet_name, title, columns, data: ResultTable):
+        """OCR 결과 표를 엑셀 파일로 저장하며, 기존 시트를 유지하고 새 데이터를 추가 (excel_engine 설정에 따라 저장 방식 선택)
+
+        이전 엑셀 파일과 시트 정보는 출력 폴더의 매니페스트에서 찾고, 저장한 파일의 시트 정보를 다시 기록한다.
+        """
+        directory = os.path.dirname(path)
+        with OutputManifest(directory) as manifest:
+            latest_file = manifest.latest(exclude_prefix=datetime.now().strftime('%Y-%m-%d'))
+            old_sheets = manifest.sheets(latest_file) if latest_file else None
 
-        return copied_sheets
+            if ConfigManager().get(ConfigKeys.EXCEL_ENGINE) == "write_only":
+                sheets = self.export_write_only(path, sheet_name, title, columns, data, latest_file, old_sheets)
+            else:
+                sheets = self.export_standard(path, sheet_name, title, columns, data, latest_file, old_sheets)
 
-    def export(self, path, sheet_name, title, columns, data):
-        """OCR 결과를 엑셀 파일로 저장하며, 기존 시트를 유지하고 새 데이터를 추가"""
+            manifest.record(os.path.basename(path), sheets)
+
+        print(f"✅ 엑셀 파일 저장 완료: {path}")
+
+    def export_standard(self, path, sheet_name, title, columns, data: ResultTable, latest_file=None, old_sheets=None):
+        """워크북 전체를 메모리에 만든 뒤 저장하고 저장한 시트 정보를 반환"""
 
         # 새로운 워크북 생성
         wb = Workbook()
@@ -111,46 +185,170 @@ class Excel:
         ws.title = sheet_name
 
         # A1 셀을 전체 너비만큼 병합하고 타이틀 적용
-        last_column = get_column_letter(len(columns))  # 마지막 컬럼 계산
-        ws.merge_cells(f"A1:{last_column}1")  # A1 ~ 마지막 컬럼 1행까지 병합
+        sheet = self._result_sheet_layout(sheet_name, columns, data)
+        ws.merge_cells(sheet["merged"][0])  # A1 ~ 마지막 컬럼 1행까지 병합
         ws["A1"] = title
 
         # 타이틀 스타일 적용
-        ws["A1"].font = Font(size=16, bold=True)  # 글씨 크기 키우고 Bold 처리
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")  # 중앙 정렬
-        ws.row_dimensions[1].height = 25  # 행 높이 키우기
+        ws["A1"].font = TITLE_FONT  # 글씨 크기 키우고 Bold 처리
+        ws["A1"].alignment = TITLE_ALIGNMENT  # 중앙 정렬
+        ws.row_dimensions[1].height = TITLE_HEIGHT  # 행 높이 키우기
 
         # 헤더 삽입
         ws.append([column.header for column in columns])
 
-        # 데이터 삽입
-        for row in data:
-            row = row + [""] * (len(columns) - len(row))
-            ws.append(row)  # 부족한 부분은 빈칸 채우기
+        # 데이터 삽입 (열 단위 표를 행 목록으로 한 번에 변환, 스타일 처리에는 행 딕셔너리 대신 행 뷰를 전달)
+        for index, row in enumerate(data.rows([column.key for column in columns])):
+            ws.append(row)
 
-            row_data = {column.key: row[col_idx] for col_idx, column in enumerate(columns)}
+            # ws.max_row는 모든 셀을 훑으므로 행 번호를 직접 계산 (제목, 헤더 다음)
+            row_data = data.row(index)
             for col_idx, column in enumerate(columns):
-                column.style_handler(ws.cell(ws.max_row, col_idx + 1), row_data)
+                column.style_handler(ws.cell(index + 3, col_idx + 1), row_data)
 
         # 표 스타일 적용
-        last_row = ws.max_row
-        table_ref = f"A2:{last_column}{last_row}"
-        table = Table(displayName=f"Table_{sheet_name.replace('-', '_')}", ref=table_ref)
-
-        style = TableStyleInfo(name="TableStyleLight8", showFirstColumn=False, showLastColumn=False,
-                               showRowStripes=True, showColumnStripes=False)
-        table.tableStyleInfo = style
-        ws.add_table(table)
+        ws.add_table(self._create_table(sheet["tables"][0]))
 
         # 기존 시트 복사 (금일 시트 뒤에 추가)
-        directory = os.path.dirname(path)
-        latest_file = self.find_latest_excel_file(directory)
-        copied_sheets = self.copy_old_sheets(wb, latest_file)
+        copied_sheets = self.copy_old_sheets(wb, latest_file, old_sheets)
 
         # 새로 추가된 시트가 첫 번째가 되도록 정렬
-        wb._sheets = [wb[sheet_name]] + [wb[name] for name in copied_sheets]
+        wb._sheets = [wb[sheet_name]] + [wb[copied["name"]] for copied in copied_sheets]
 
         # 파일 저장
         wb.save(path)
+        return [sheet] + copied_sheets
+
+    def export_write_only(self, path, sheet_name, title, columns, data: ResultTable, latest_file=None,
+                          old_sheets=None):
+        """write_only 워크북으로 행을 바로 파일에 쓰며 저장하고 저장한 시트 정보를 반환 (셀 객체를 쌓아 두지 않음)
+
+        제목 병합, 행 높이, 표 정의를 먼저 설정하고, 셀 스타일은 style_handler가 설정한 스타일 조합마다
+        한 번만 등록해 같은 StyleArray를 쓰는 WriteOnlyCell로 행을 내보낸다.
+        """
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(title=sheet_name)  # 금일 시트가 가장 먼저 오도록 먼저 생성
+
+        # 제목 병합, 행 높이, 표는 행을 쓰기 전에 설정 (파일에는 행 다음에 기록됨)
+        sheet = self._result_sheet_layout(sheet_name, columns, data)
+        ws.merged_cells.add(sheet["merged"][0])
+        ws.row_dimensions[1].height = TITLE_HEIGHT
+        self._add_table(ws, self._create_table(sheet["tables"][0]))
+
+        title_cell = WriteOnlyCell(ws, value=title)
+        title_cell.font = TITLE_FONT
+        title_cell.alignment = TITLE_ALIGNMENT
+        ws.append([title_cell])
+        ws.append([column.header for column in columns])
 
-        print(f"✅ 엑셀 파일 저장 완료: {path}")
+        styles = {}  # 스타일 객체 번호 조합 -> (스타일 객체, StyleArray), 객체를 붙잡아 두어 번호가 재사용되지 않게 함
+        probe = StyleProbe()
+        for index, row in enumerate(data.rows([column.key for column in columns])):
+            row_data = data.row(index)
+            for col_idx, column in enumerate(columns):
+                if column.style_handler is None:
+                    continue
+                probe.reset()
+                column.style_handler(probe, row_data)
+                style = self._probe_style(ws, probe, styles)
+                if style is not None:
+                    cell = WriteOnlyCell(ws, value=row[col_idx])
+                    cell._style = style
+                    row[col_idx] = cell
+            ws.append(row)
+
+        # 기존 시트 복사 (금일 시트 뒤에 추가)
+        copied_sheets = self.stream_old_sheets(wb, latest_file, old_sheets)
+
+        wb.save(path)
+        return [sheet] + copied_sheets
+
+    @staticmethod
+    def _probe_style(ws, probe, styles):
+        """StyleProbe에 기록된 스타일의 StyleArray (기록된 스타일이 없으면 None)"""
+        objects = probe.objects()
+        if not any(value is not None for value in objects):
+            return None
+
+        key = tuple(map(id, objects))
+        cached = styles.get(key)
+        if cached is None or any(first is not second for first, second in zip(cached[0], objects)):
+            # 처음 보는 조합만 임시 셀에 설정해 워크북의 스타일 목록에 등록
+            cell = WriteOnlyCell(ws)
+            for name, value in zip(StyleProbe.__slots__, objects):
+                if value is not None:
+                    setattr(cell, name, value)
+            cached = styles[key] = (objects, cell._style)
+        return cached[1]
+
+    def stream_old_sheets(self, new_wb, latest_file, sheets=None):
+        """write_only 워크북에 기존 엑셀 파일의 최근 6개 시트를 행 단위로 복사 (copy_old_sheets와 같은 결과)"""
+        if not latest_file:
+            return []  # 기존 파일이 없으면 빈 리스트 반환
+
+        old_wb, old_sheets = self.read_old_sheets(latest_file, sheets)
+
+        style_cache = {}  # 원본 StyleArray -> 새 워크북의 StyleArray
+        copied_sheets = []
+        for sheet, rows in old_sheets:
+            new_ws = new_wb.create_sheet(title=sheet["name"])
+
+            # 셀 병합 정보, 테이블은 행을 쓰기 전에 설정
+            for merged_range in sheet["merged"]:
+                new_ws.merged_cells.add(merged_range)
+            for table in sheet["tables"]:
+                self._add_table(new_ws, self._create_table(table))
+
+            row_count = 0
+            for row_count, row in enumerate(rows, 1):
+                values = []
+                for cell in row:
+                    if isinstance(cell, EmptyCell) or not cell.has_style:
+                        values.append(cell.value)
+                        continue
+                    new_cell = WriteOnlyCell(new_ws)
+                    new_cell._value = cell.value
+                    new_cell.data_type = cell.data_type
+                    new_cell._style = self._new_style(old_wb, new_wb, cell, style_cache)
+                    values.append(new_cell)
+                new_ws.append(values)
+
+            copied_sheets.append({**sheet, "rows": row_count})
+
+        old_wb.close()
+        return copied_sheets
+
+    @staticmethod
+    def _result_sheet_layout(sheet_name, columns, data: ResultTable):
+        """결과 시트 정보: 제목 병합 범위(A1 ~ 마지막 컬럼 1행)와 표 정의 (헤더 다음부터 마지막 행까지)"""
+        last_column = get_column_letter(len(columns))  # 마지막 컬럼 계산
+        table = {"name": f"Table_{sheet_name.replace('-', '_')}", "ref": f"A2:{last_column}{len(data) + 2}",
+                 "style": TABLE_STYLE, "columns": [column.header for column in columns]}
+        return {"name": sheet_name, "rows": len(data) + 2, "merged": [f"A1:{last_column}1"], "tables": [table]}
+
+    @staticmethod
+    def _sheet_layout(ws):
+        """워크북 전체를 읽은 시트의 정보 (매니페스트에 기록이 없는 파일용)"""
+        tables = [{"name": table.displayName, "ref": table.ref,
+                   "style": {key: getattr(table.tableStyleInfo, key) for key in TABLE_STYLE},
+                   "columns": [column.name for column in table.tableColumns]}
+                  for table in ws.tables.values()]
+        return {"name": ws.title, "rows": ws.max_row, "merged": [str(merged_range) for merged_range in
+                                                                   ws.merged_cells.ranges], "tables": tables}
+
+    @staticmethod
+    def _add_table(ws, table):
+        """write_only 시트에 열 이름을 미리 설정한 표 추가 (열 이름을 직접 설정하라는 경고는 표시하지 않음)"""
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="In write-only mode")
+            ws.add_table(table)
+
+    @staticmethod
+    def _create_table(layout):
+        """표 정의(이름, 범위, 스타일, 열 이름)로 표 생성, write_only 시트는 셀에서 열 이름을 읽을 수 없으므로 미리 설정"""
+        table = Table(displayName=layout["name"], ref=layout["ref"])
+        table.tableStyleInfo = TableStyleInfo(**layout["style"])
+        table._initialise_columns()
+        for table_column, header in zip(table.tableColumns, layout["columns"]):
+            table_column.name = str(header)
+        return table
@@ -1,4 +1,7 @@
 class ExcelColumn:
+    """엑셀 열 정의: value는 결과 표(ResultTable)를 받아 열 전체 값을 반환하는 함수,
+    style_handler는 (셀, 행 뷰)를 받아 셀 스타일을 적용하는 함수"""
+
     def __init__(self, key, header, value, style_handler=None):
         self.key = key
         self.header = header
@@ -0,0 +1,126 @@
+import json
+import os
+import sqlite3
+
+from openpyxl.reader.excel import load_workbook
+
+MANIFEST_FILENAME = "manifest.db"
+
+
+class OutputManifest:
+    """출력 폴더(output, output_dust)의 엑셀 파일 목록
+
+    파일마다 날짜, 수정 시각, 시트(이름 = 날짜, 행 수, 병합 범위, 표 정의)를 기록하여
+    가장 최근 파일 찾기와 시트 복사에 폴더 목록이나 워크북 전체를 읽지 않는다.
+    열 때마다 폴더의 수정 시각만 확인하고, 바뀌었으면(파일을 넣거나 지운 경우) 새로 생기거나 바뀐 파일만 읽어
+    시트 이름과 행 수를 기록하고 지워진 파일은 기록에서 제거한다
+    (직접 넣은 파일은 병합/표 정보가 없어 복사할 때 워크북 전체를 읽음).
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.connection = sqlite3.connect(os.path.join(directory, MANIFEST_FILENAME))
+        # 저널 파일을 지우지 않고 재사용하여, 매니페스트 저장으로 폴더 수정 시각이 바뀌지 않게 함
+        self.connection.execute("PRAGMA journal_mode=PERSIST")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS files (name TEXT PRIMARY KEY, date TEXT, saved_at REAL NOT NULL);
+            CREATE INDEX IF NOT EXISTS files_by_saved_at ON files (saved_at);
+            CREATE TABLE IF NOT EXISTS sheets (
+                file TEXT NOT NULL REFERENCES files(name) ON DELETE CASCADE,
+                position INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                rows INTEGER,
+                layout TEXT,
+                PRIMARY KEY (file, position)
+            );
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        """)
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.sync()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def _directory_mtime(self):
+        return str(os.stat(self.directory).st_mtime_ns)
+
+    def sync(self):
+        """폴더 수정 시각이 기록과 다르면 폴더의 엑셀 파일과 기록을 맞춤 (처음 열 때는 모든 파일을 기록)"""
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'directory_mtime'").fetchone()
+        if row and row[0] == self._directory_mtime():
+            return
+
+        recorded = dict(self.connection.execute("SELECT name, saved_at FROM files"))
+        with self.connection:
+            for file_name in os.listdir(self.directory):
+                if not file_name.endswith('.xlsx') or file_name.startswith('~$'):
+                    continue
+                path = os.path.join(self.directory, file_name)
+                mtime = os.path.getmtime(path)
+                if recorded.pop(file_name, None) == mtime:
+                    continue
+                try:
+                    wb = load_workbook(path, read_only=True)
+                except Exception as e:
+                    print(f"⚠️ 엑셀 파일을 읽을 수 없습니다: {path} ({e})")
+                    continue
+                sheets = [{"name": ws.title, "rows": ws.max_row} for ws in wb.worksheets]
+                wb.close()
+                self._record(file_name, sheets, mtime)
+
+            self.connection.executemany("DELETE FROM files WHERE name = ?", [(name,) for name in recorded])
+        self._save_directory_mtime()
+
+    def _save_directory_mtime(self):
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('directory_mtime', ?)",
+                                    (self._directory_mtime(),))
+
+    def record(self, file_name, sheets):
+        """저장한 파일의 시트 목록 기록 (sheets: [{"name", "rows", "merged", "tables"}])"""
+        with self.connection:
+            self._record(file_name, sheets, os.path.getmtime(os.path.join(self.directory, file_name)))
+        self._save_directory_mtime()
+
+    def _record(self, file_name, sheets, saved_at):
+        self.connection.execute("INSERT OR REPLACE INTO files (name, date, saved_at) VALUES (?, ?, ?)",
+                                (file_name, os.path.splitext(file_name)[0], saved_at))
+        self.connection.execute("DELETE FROM sheets WHERE file = ?", (file_name,))
+        self.connection.executemany(
+            "INSERT INTO sheets (file, position, name, rows, layout) VALUES (?, ?, ?, ?, ?)",
+            [(file_name, position, sheet["name"], sheet.get("rows"),
+              json.dumps({"merged": sheet["merged"], "tables": sheet["tables"]}, ensure_ascii=False)
+              if sheet.get("merged") is not None else None)
+             for position, sheet in enumerate(sheets)])
+
+    def latest(self, exclude_prefix=None):
+        """수정 시각이 가장 최근인 파일 경로 (exclude_prefix로 시작하는 파일 제외, 지워진 파일은 기록에서 제거)"""
+        where, parameters = ("WHERE substr(name, 1, ?) != ?", (len(exclude_prefix), exclude_prefix)) \
+            if exclude_prefix else ("", ())
+        while True:
+            # saved_at 색인을 뒤에서부터 읽으므로 파일 수와 무관
+            row = self.connection.execute(f"SELECT name FROM files {where} ORDER BY saved_at DESC LIMIT 1",
+                                          parameters).fetchone()
+            if row is None:
+                return None
+            path = os.path.join(self.directory, row[0])
+            if os.path.exists(path):
+                return path
+            with self.connection:
+                self.connection.execute("DELETE FROM files WHERE name = ?", (row[0],))
+
+    def sheets(self, path):
+        """기록된 시트 목록 ([{"name", "rows", "merged", "tables"}], 병합/표 정보가 없으면 None)"""
+        cursor = self.connection.execute(
+            "SELECT name, rows, layout FROM sheets WHERE file = ? ORDER BY position", (os.path.basename(path),))
+        sheets = []
+        for name, rows, layout in cursor:
+            layout = json.loads(layout) if layout else {"merged": None, "tables": None}
+            sheets.append({"name": name, "rows": rows, **layout})
+        return sheets
@@ -1,19 +1,26 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 
+import numpy as np
 from openpyxl.styles import PatternFill
 
-from circle_member import CircleMemberManager, CircleMember
+from circle_member import CircleMemberManager, CircleMember, POSITIONS
 from config import ConfigKeys, ConfigManager
 from excel import ExcelColumn
 from utils import window
+from utils.game_clock import game_today
+from utils.record_tokenizer import FieldRule, ENUM, NUMBER, PREFIX
 from . import Extractor
 
 MAX_DAILY_CONTRIB = 90
 
+# 셀 배경색 (엑셀 저장 시 같은 스타일 객체를 재사용하도록 한 번만 생성)
+NOT_IN_ROSTER_FILL = PatternFill(start_color="FFFFE0", end_color="FFFFE0", fill_type="solid")
+WARNING_FILL = PatternFill(start_color="FFDFDF", end_color="FFDFDF", fill_type="solid")
+FUZZY_MATCH_FILL = PatternFill(start_color="DFEFFF", end_color="DFEFFF", fill_type="solid")
+
 
 class CircleMemberExtractor(Extractor):
     def __init__(self):
-        manager = CircleMemberManager()
         ocr_headers = [("nickname", "닉네임"), ("position", "직위"),
                        ("weekly_contrib", "이번 주 공헌도"), ("total_contrib", "누적 공헌도"),
                        ("status", "상태"), ("level", "레벨")]
@@ -21,55 +28,55 @@ class CircleMemberExtractor(Extractor):
             ExcelColumn(
                 key="position",
                 header="직위",
-                value=lambda data: data["position"],
+                value=lambda table: table.column("position"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="join_date",
                 header="가입일",
-                value=lambda data: manager.get_by_nickname(data["nickname"], "join_date"),
+                value=lambda table: self._member_column(table, "join_date"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="join_period",
                 header="가입기간",
-                value=lambda data: manager.get_by_nickname(data["nickname"], "join_period"),
+                value=lambda table: self._member_column(table, "join_period"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="nickname",
                 header="닉네임",
-                value=lambda data: data["nickname"],
+                value=lambda table: table.column("nickname"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="arcalive_id",
                 header="아카라이브 ID",
-                value=lambda data: manager.get_by_nickname(data["nickname"], "arcalive_id"),
+                value=lambda table: self._member_column(table, "arcalive_id"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="uid",
                 header="UID",
-                value=lambda data: manager.get_by_nickname(data["nickname"], "uid"),
+                value=lambda table: self._member_column(table, "uid"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="level",
                 header="레벨",
-                value=lambda data: data["level"],
+                value=lambda table: table.column("level"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="weekly_contrib",
                 header="이번 주 공헌도",
-                value=lambda data: data["weekly_contrib"],
+                value=lambda table: table.column("weekly_contrib"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="total_contrib",
                 header="누적 공헌도",
-                value=lambda data: data["total_contrib"],
+                value=lambda table: table.column("total_contrib"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
@@ -81,81 +88,41 @@ class CircleMemberExtractor(Extractor):
             ExcelColumn(
                 key="status",
                 header="상태",
-                value=lambda data: data["status"],
+                value=lambda table: table.column("status"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="remark",
                 header="비고",
-                value=lambda data: manager.get_by_nickname(data["nickname"], "remark"),
+                value=self._remark_column,
                 style_handler=self._cell_style_handler
             )
         ]
 
-        super().__init__(name="서클원 추출", ocr_headers=ocr_headers, excel_columns=excel_columns)
-
-    def _fix_extracted_text(self, extracted_text):
-        is_fix_needed = len(extracted_text) % len(self.ocr_headers)
-        if is_fix_needed == 0:
-            return extracted_text
-
-        header_size = len(self.ocr_headers)
-        max_size = (len(extracted_text) // header_size) * header_size
-        for i in range(0, max_size, header_size):
-            # 직위
-            if not extracted_text[i + 1] in ["서클장", "서클원", "부서클장"]:
-                if CircleMemberManager().get_by_nickname(extracted_text[i]) is None:
-                    extracted_text[i] += extracted_text[i + 1]
-                del extracted_text[i + 1]
-
-            # 주간 공헌도
-            if not extracted_text[i + 2].isdigit():
-                extracted_text[i + 1] += extracted_text[i + 2]
-                del extracted_text[i + 2]
-
-            # # 누적 공헌도
-            # if not extracted_text[i + 3].isdigit():
-            #     pass
+        record_grammar = [FieldRule("nickname"), FieldRule("position", ENUM, values=POSITIONS),
+                          FieldRule("weekly_contrib", NUMBER, maximum=MAX_DAILY_CONTRIB * 7),
+                          FieldRule("total_contrib", NUMBER),
+                          FieldRule("status"), FieldRule("level", PREFIX, "Lv")]
 
-            # # 상태
-            # if not extracted_text[i + 4] == "오늘" and not extracted_text[i + 4].endswith("전"):
-            #     pass
+        super().__init__(name="서클원 추출", ocr_headers=ocr_headers, excel_columns=excel_columns,
+                         numeric_keys=("weekly_contrib", "total_contrib", "level"), record_grammar=record_grammar)
 
-            # 레벨
-            if not extracted_text[i + 5].startswith("Lv"):
-                extracted_text[i + 4] += extracted_text[i + 5]
-                del extracted_text[i + 5]
+    def calculate_missing_weekly_contrib(self, table):
+        """서클원별 부족 공헌도 열 (명단에 없는 서클원은 None, 공헌도를 읽지 못한 행은 0으로 계산)"""
+        join_dates = np.array(self._member_column(table, "joined_on"), dtype="datetime64[D]")
+        missing = self.calculate_weekly_contrib_goal(join_dates) - table.column("weekly_contrib").filled()
+        return np.where(np.isnat(join_dates), None, missing)
 
-        return extracted_text
-
-    def calculate_missing_weekly_contrib(self, data):
-        circle_member_manager = CircleMemberManager()
-        join_date = circle_member_manager.get_by_nickname(data["nickname"], "join_date")
-
-        if join_date:
-            return self.calculate_weekly_contrib_goal(join_date) - int(data["weekly_contrib"])
-
-    def calculate_weekly_contrib_goal(self, join_date):
-        if join_date is None:
-            return None
-
-        # 현재 날짜와 시간
-        today = datetime.now()
-
-        # 5시 기준으로 요일을 변경
-        if today.hour < 5:
-            today -= timedelta(days=1)  # 5시 이전이면 전날로 설정
-
-        # join_date를 datetime 객체로 변환
-        join_date = datetime.strptime(join_date, '%Y-%m-%d')
+    def calculate_weekly_contrib_goal(self, join_dates):
+        """가입일(datetime64[D] 배열)별 이번 주 목표 공헌도"""
+        # 5시 기준 오늘 날짜
+        today = game_today()
 
         # 이번 주 가입은 구분
         weekday = today.weekday()
-        if join_date > today - timedelta(days=weekday):  # 이번 주에 가입한 경우
-            days_since_join = (today - join_date).days + 1
-        else:
-            monday = today - timedelta(days=weekday)
-            days_since_join = (today - monday).days + 1
+        today = np.datetime64(today, "D")
+        monday = today - np.timedelta64(weekday, "D")
+        days_since_join = np.where(join_dates > monday, today - join_dates, today - monday).astype(np.int64) + 1
 
         return MAX_DAILY_CONTRIB * days_since_join
 
@@ -163,15 +130,9 @@ class CircleMemberExtractor(Extractor):
         if join_date is None:
             return None
 
-        # 가입일을 기준으로 목표 누적 공헌도 계산
-        today = datetime.now()
-
-        # 5시 기준으로 요일을 변경
-        if today.hour < 5:
-            today -= timedelta(days=1)  # 5시 이전이면 전날로 설정
-
-        join_date = datetime.strptime(join_date, '%Y-%m-%d')  # 가입일 문자열을 날짜 형식으로 변환
-        days_joined = (today - join_date).days
+        # 가입일을 기준으로 목표 누적 공헌도 계산 (5시 기준 오늘 날짜)
+        join_date = datetime.strptime(join_date, '%Y-%m-%d').date()  # 가입일 문자열을 날짜 형식으로 변환
+        days_joined = (game_today() - join_date).days
 
         # 목표 누적 공헌도 = 90 * 가입일 수
         return MAX_DAILY_CONTRIB * days_joined
@@ -183,15 +144,18 @@ class CircleMemberExtractor(Extractor):
         member: CircleMember = circle_member_manager.get_by_nickname(row_data["nickname"])
 
         if member is None:
-            cell.fill = PatternFill(start_color="FFFFE0", end_color="FFFFE0", fill_type="solid")  # 배경색
+            cell.fill = NOT_IN_ROSTER_FILL  # 배경색
             return
 
+        if circle_member_manager.fuzzy_match(row_data["nickname"]):
+            cell.fill = FUZZY_MATCH_FILL  # 편집 거리로 추정한 서클원 (아래 경고에 해당하면 경고 색)
+
         config = ConfigManager()
         # contrib_idx = next(
         #     (idx for idx, column in enumerate(self.excel_columns) if column.key == "missing_weekly_contrib"), None)
         if row_data["missing_weekly_contrib"] is not None and row_data["missing_weekly_contrib"] >= config.get(
                 ConfigKeys.CONTRIB_LIMIT):
-            cell.fill = PatternFill(start_color="FFDFDF", end_color="FFDFDF", fill_type="solid")  # 배경색
+            cell.fill = WARNING_FILL  # 배경색
 
     def get_dynamic_ratio(self, hwnd=None):
         hwnd = hwnd if hwnd else window.find_window(ConfigManager().get(ConfigKeys.WINDOW_TITLE))
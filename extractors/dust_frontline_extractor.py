@@ -1,19 +1,24 @@
-from datetime import datetime, timedelta
-
+import numpy as np
 from openpyxl.styles import PatternFill
 
-from circle_member import CircleMemberManager, CircleMember
+from circle_member import CircleMemberManager, CircleMember, POSITIONS
 from config import ConfigKeys, ConfigManager, DEFAULT_CONFIG
 from excel import ExcelColumn
 from utils import window
+from utils.game_clock import game_today
+from utils.record_tokenizer import FieldRule, ENUM, MARKER, NUMBER, PREFIX
 from . import Extractor
 
 MIN_DAILY_POINT = 800
 
+# 셀 배경색 (엑셀 저장 시 같은 스타일 객체를 재사용하도록 한 번만 생성)
+NOT_IN_ROSTER_FILL = PatternFill(start_color="FFFFE0", end_color="FFFFE0", fill_type="solid")
+WARNING_FILL = PatternFill(start_color="FFDFDF", end_color="FFDFDF", fill_type="solid")
+FUZZY_MATCH_FILL = PatternFill(start_color="DFEFFF", end_color="DFEFFF", fill_type="solid")
+
 
 class DustFrontlineExtractor(Extractor):
     def __init__(self):
-        manager = CircleMemberManager()
         ocr_headers = [("nickname", "닉네임"),
                        ("higher_point_title", "단일 전투 최고 점수 제목"), ("total_point_title", "누적 점수 제목"),
                        ("level", "레벨"), ("position", "직위"),
@@ -22,55 +27,55 @@ class DustFrontlineExtractor(Extractor):
             ExcelColumn(
                 key="position",
                 header="직위",
-                value=lambda data: data["position"],
+                value=lambda table: table.column("position"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="join_date",
                 header="가입일",
-                value=lambda data: manager.get_by_nickname(data["nickname"], "join_date"),
+                value=lambda table: self._member_column(table, "join_date"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="join_period",
                 header="가입기간",
-                value=lambda data: manager.get_by_nickname(data["nickname"], "join_period"),
+                value=lambda table: self._member_column(table, "join_period"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="nickname",
                 header="닉네임",
-                value=lambda data: data["nickname"],
+                value=lambda table: table.column("nickname"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="arcalive_id",
                 header="아카라이브 ID",
-                value=lambda data: manager.get_by_nickname(data["nickname"], "arcalive_id"),
+                value=lambda table: self._member_column(table, "arcalive_id"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="uid",
                 header="UID",
-                value=lambda data: manager.get_by_nickname(data["nickname"], "uid"),
+                value=lambda table: self._member_column(table, "uid"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="level",
                 header="레벨",
-                value=lambda data: data["level"],
+                value=lambda table: table.column("level"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="higher_point",
                 header="단일 전투 최고 점수",
-                value=lambda data: data["higher_point"],
+                value=lambda table: table.column("higher_point"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
                 key="total_point",
                 header="누적 점수",
-                value=lambda data: data["total_point"],
+                value=lambda table: table.column("total_point"),
                 style_handler=self._cell_style_handler
             ),
             ExcelColumn(
@@ -82,12 +87,18 @@ class DustFrontlineExtractor(Extractor):
             ExcelColumn(
                 key="remark",
                 header="비고",
-                value=lambda data: manager.get_by_nickname(data["nickname"], "remark"),
+                value=self._remark_column,
                 style_handler=self._cell_style_handler
             )
         ]
 
-        super().__init__(name="흙먼지전선 추출", ocr_headers=ocr_headers, excel_columns=excel_columns, folder_name="output_dust")
+        record_grammar = [FieldRule("nickname"), FieldRule("higher_point_title", MARKER, "단일 전투"),
+                          FieldRule("total_point_title", MARKER, "누적 점수"), FieldRule("level", PREFIX, "Lv"),
+                          FieldRule("position", ENUM, values=POSITIONS),
+                          FieldRule("higher_point", NUMBER), FieldRule("total_point", NUMBER)]
+
+        super().__init__(name="흙먼지전선 추출", ocr_headers=ocr_headers, excel_columns=excel_columns, folder_name="output_dust",
+                         numeric_keys=("higher_point", "total_point", "level"), record_grammar=record_grammar)
 
     def extract(self, parent=None, additional_scroll_repeat=-5):
         config = ConfigManager()
@@ -99,73 +110,22 @@ class DustFrontlineExtractor(Extractor):
 
         super().extract(parent, additional_scroll_repeat)
 
-    def _fix_extracted_text(self, extracted_text):
-        # is_fix_needed = len(extracted_text) % len(self.ocr_headers)
-
-        header_size = len(self.ocr_headers)
-        max_size = (len(extracted_text) // header_size) * header_size
-        for i in range(0, max_size, header_size):
-
-            # 단일 전투 최고 점수 제목
-            if "단일 전투" not in extracted_text[i + 1]:
-                extracted_text[i] += extracted_text[i + 1]
-                del extracted_text[i + 1]
-
-            # 누적 점수 제목
-            if "누적 점수" not in extracted_text[i + 2]:
-                extracted_text[i + 1] += extracted_text[i + 2]
-                del extracted_text[i + 3]
-
-            # 레벨
-            if not extracted_text[i + 3].startswith("Lv"):
-                extracted_text[i + 2] += extracted_text[i + 3]
-                del extracted_text[i + 3]
-
-            # 직위
-            if not extracted_text[i + 4] in ["서클장", "서클원", "부서클장"]:
-                if CircleMemberManager().get_by_nickname(extracted_text[i]) is None:
-                    extracted_text[i + 3] += extracted_text[i + 4]
-                del extracted_text[i + 4]
-
-            # 단일 전투 최고 점수
-            if not extracted_text[i + 5].isdigit():
-                number = self.extract_numbers(extracted_text[i + 5])
-                if number == "":
-                    extracted_text[i + 5] = 0
-                else:
-                    extracted_text[i + 5] = number
-
-            # 누적 점수
-            if not extracted_text[i + 6].isdigit():
-                number = self.extract_numbers(extracted_text[i + 6])
-                if number == "":
-                    extracted_text[i + 5] = 0
-                else:
-                    extracted_text[i + 6] = number
-
-        return extracted_text
-
-    def calculate_missing_point(self, data):
-        circle_member_manager = CircleMemberManager()
-        join_date = circle_member_manager.get_by_nickname(data["nickname"], "join_date")
-
-        result = self.calculate_total_point_goal(join_date) - int(data["total_point"])
-        return result if result > 0 else 0
+    def calculate_missing_point(self, table):
+        """서클원별 부족 점수 열 (점수를 읽지 못한 행은 0으로 계산)"""
+        join_dates = np.array(self._member_column(table, "joined_on"), dtype="datetime64[D]")
+        result = self.calculate_total_point_goal(join_dates) - table.column("total_point").filled()
+        return np.maximum(result, 0)
 
-    def calculate_total_point_goal(self, join_date=None):
+    def calculate_total_point_goal(self, join_dates):
+        """가입일(datetime64[D] 배열, 명단에 없으면 NaT)별 목표 누적 점수"""
         config = ConfigManager()
 
-        # 가입일을 기준으로 목표 누적 공헌도 계산
-        today = datetime.now()
-
-        # 5시 기준으로 요일을 변경
-        if today.hour < 5:
-            today -= timedelta(days=1)  # 5시 이전이면 전날로 설정
+        # 가입일을 기준으로 목표 누적 공헌도 계산 (5시 기준 오늘 날짜)
+        today = np.datetime64(game_today(), "D")
+        dust_start_date = np.datetime64(config.get(ConfigKeys.DUST_START_DATE), "D")
+        join_dates = np.where(np.isnat(join_dates), dust_start_date, join_dates)
 
-        dust_start_date = datetime.strptime(config.get(ConfigKeys.DUST_START_DATE), "%Y-%m-%d")
-        join_date = dust_start_date if not join_date else datetime.strptime(join_date, '%Y-%m-%d')
-
-        days_joined = (today - (join_date if join_date > dust_start_date else dust_start_date)).days
+        days_joined = (today - np.maximum(join_dates, dust_start_date)).astype(np.int64)
 
         # 목표 누적 공헌도 = 90 * 가입일 수
         return config.get(ConfigKeys.DUST_POINT_LIMIT) * days_joined
@@ -175,17 +135,21 @@ class DustFrontlineExtractor(Extractor):
         member: CircleMember = circle_member_manager.get_by_nickname(row_data["nickname"])
 
         if member is None:
-            cell.fill = PatternFill(start_color="FFFFE0", end_color="FFFFE0", fill_type="solid")  # 배경색
+            cell.fill = NOT_IN_ROSTER_FILL  # 배경색
             return
 
+        if circle_member_manager.fuzzy_match(row_data["nickname"]):
+            cell.fill = FUZZY_MATCH_FILL  # 편집 거리로 추정한 서클원 (아래 경고에 해당하면 경고 색)
+
         config = ConfigManager()
-        join_period = CircleMemberManager().get_by_nickname(row_data["nickname"], "join_period")
+        join_period = member.join_period
         if join_period is None:
             return
 
-        daily_point_avg = row_data["total_point"] / join_period
+        # 점수를 읽지 못한 행은 0, 오늘 가입한 서클원은 1일로 계산
+        daily_point_avg = (row_data["total_point"] or 0) / max(join_period, 1)
         if daily_point_avg >= config.get(ConfigKeys.DUST_POINT_LIMIT):
-            cell.fill = PatternFill(start_color="FFDFDF", end_color="FFDFDF", fill_type="solid")  # 배경색
+            cell.fill = WARNING_FILL  # 배경색
 
     def get_dynamic_ratio(self, hwnd=None):
         hwnd = hwnd if hwnd else window.find_window(ConfigManager().get(ConfigKeys.WINDOW_TITLE))
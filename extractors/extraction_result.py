@@ -0,0 +1,28 @@
+class StopReason:
+    """스크롤 캡쳐를 종료한 사유"""
+    BOTTOM_REACHED = "bottom_reached"  # 스크롤했지만 목록이 더 이상 움직이지 않음 (목록 끝)
+    NOT_SCROLLABLE = "not_scrollable"  # 첫 스크롤부터 목록이 움직이지 않음
+    MAX_SCROLLS = "max_scrolls"  # 최대 스크롤 횟수 도달
+
+
+class CaptureResult:
+    """스크롤 캡쳐 결과"""
+
+    def __init__(self, image, stop_reason, scroll_count, merged_count, settle_times):
+        self.image = image
+        self.stop_reason = stop_reason
+        self.scroll_count = scroll_count
+        self.merged_count = merged_count  # 병합에 성공한 프레임 수 (첫 프레임 제외)
+        self.settle_times = settle_times
+
+
+class ExtractionResult:
+    """Extractor.run 결과"""
+
+    def __init__(self, excel_path, capture: CaptureResult):
+        self.excel_path = excel_path
+        self.capture = capture
+
+    @property
+    def stop_reason(self):
+        return self.capture.stop_reason
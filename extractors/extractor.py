@@ -1,13 +1,25 @@
 import logging
 import os
-import time
+import sqlite3
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Callable
 
+from circle_member import CircleMemberManager
 from config import ConfigManager, ConfigKeys
 from excel import Excel, ExcelColumn
-from utils import clova_ocr, window, image, mouse
+from utils import clova_ocr, window, image
+from utils.frame_source import FrameSource, LiveFrameSource, RecordingFrameSource
+from utils.history_store import HistoryStore
+from utils.matcher import create_matcher
+from utils.ocr_layout import parse_layout, typed_row
+from utils.ocr_backend import OcrBackend, ClovaBackend, ReplayBackend, RESPONSE_FOLDER_NAME
+from utils.ocr_pipeline import PipelinedOcr
+from utils.record_tokenizer import FieldRule, RecordTokenizer
+from utils.result_table import ResultTable
+from utils.stitcher import ImageStitcher
+from utils.token_segmenter import RosterSegmenter
+from .extraction_result import CaptureResult, ExtractionResult, StopReason
 
 # 로깅 설정
 logging.basicConfig(
@@ -17,11 +29,22 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S"  # 시간 형식
 )
 
+# 기존 고정 대기 시간 (초), 안정화 대기 시간 비교용
+ACTIVATE_SLEEP = 1
+SCROLL_SLEEP = 0.8
+
+SESSION_FOLDER_NAME = "sessions"
+
+# 이 값보다 신뢰도가 낮은 행은 경고 (텍스트 순서로 처리할 때)
+LOW_CONFIDENCE = 0.5
+
 
 class Extractor(ABC):
     def __init__(self, ocr_headers: list[tuple[str, str]], excel_columns: list[ExcelColumn], name=None,
-                 folder_name="output"):
+                 folder_name="output", numeric_keys=(), record_grammar: list[FieldRule] = None):
         self.ocr_headers = ocr_headers
+        self.numeric_keys = set(numeric_keys)
+        self.record_grammar = record_grammar
         self.excel_columns = excel_columns
         self.folder_name = folder_name
         self.name = name
@@ -30,10 +53,6 @@ class Extractor(ABC):
     def get_dynamic_ratio(self, hwnd=None):
         pass
 
-    def screenshot(self, hwnd=None):
-        """공통 캡쳐 프로세스 구현"""
-        return window.screenshot(self.get_dynamic_ratio(hwnd), hwnd)
-
     def _on_before_export(self, hwnd=None):
         pass
 
@@ -43,9 +62,14 @@ class Extractor(ABC):
     def _on_before_extract(self):
         pass
 
-    def _on_after_extract(self, extracted_text):
+    def _on_after_extract(self, table: ResultTable):
         pass
 
+    def create_session_path(self):
+        """캡쳐 세션 파일 경로 생성"""
+        file_name = f"{self.folder_name}_{datetime.now().strftime('%Y-%m-%d_%H%M%S')}.npz"
+        return os.path.join(os.getcwd(), SESSION_FOLDER_NAME, file_name)
+
     def create_output_directory(self):
         """결과물 디렉터리 생성"""
         directory_path = os.path.join(os.getcwd(), self.folder_name)
@@ -68,145 +92,262 @@ class Extractor(ABC):
             if result == 2:
                 return
 
-            window_title = config.get(ConfigKeys.WINDOW_TITLE)
-            max_scroll = config.get(ConfigKeys.MAX_SCROLLS)
-            scroll_repeat = config.get(ConfigKeys.SCROLL_REPEAT) + additional_scroll_repeat
-
-            hwnd = window.find_window(window_title)
-            window.activate_window(hwnd)
-            time.sleep(1)
-
-            # 첫 번째 스크린샷 찍기
-            first_screenshot = self.screenshot(hwnd)
-            first_screenshot_bin = image.binarize_image(first_screenshot)
+            source = LiveFrameSource(config.get(ConfigKeys.WINDOW_TITLE), self.get_dynamic_ratio,
+                                     motion_wait=config.get(ConfigKeys.SCROLL_MOTION_WAIT))
+            if config.get(ConfigKeys.RECORD_SESSION):
+                source = RecordingFrameSource(source, self.create_session_path())
 
-            # 스크롤 및 이미지 비교
-            scroll_count = 0
-            prev_y_offset = -1
+            backend = ClovaBackend.from_config(config, api_url, api_secret_key)
+            if config.get(ConfigKeys.OCR_RESPONSE_CACHE):
+                backend = ReplayBackend(os.path.join(os.getcwd(), RESPONSE_FOLDER_NAME), backend)
 
-            _, _, client_width, _, center_x, center_y = window.get_client_area(hwnd)
+            result = self.run(source, backend, additional_scroll_repeat, parent)
 
-            while scroll_count < max_scroll:
-                mouse.move_mouse(center_x, center_y)
-                mouse.scroll_down(scroll_repeat)
-                time.sleep(0.8)
-
-                second_screenshot = self.screenshot(hwnd)
-                second_screenshot_bin = image.binarize_image(second_screenshot)
-
-                crop_height = int(second_screenshot.shape[0] * 0.2)
-                cropped_second_screenshot_bin = second_screenshot_bin[:crop_height, :]
+            if window.show_message("추출", "추출이 완료되었습니다. 엑셀파일을 실행하시겠습니까?", flag=window.MB_OKCANCEL) == 1:
+                os.startfile(result.excel_path)
+        except Exception as e:
+            logging.error("추출 중 에러 발생", exc_info=True)  # 로그 파일에 오류 기록
+            window.show_message("에러", f"목록 추출 실패: {e}", flag=window.MB_ICONERROR)
 
-                similarity, location = image.compare_images(first_screenshot_bin, cropped_second_screenshot_bin)
+    def run(self, source: FrameSource, backend: OcrBackend, additional_scroll_repeat=0, parent=None):
+        """프레임 소스로 캡쳐, OCR, 파싱, 엑셀 저장까지 진행하고 ExtractionResult를 반환"""
+        config = ConfigManager()
+        max_scroll = config.get(ConfigKeys.MAX_SCROLLS)
+        scroll_repeat = config.get(ConfigKeys.SCROLL_REPEAT) + additional_scroll_repeat
 
-                print(f"🔍 유사도: {similarity}")
-                print(f"📍 가장 유사한 위치: {location}")
+        # 캡쳐하는 동안 OCR API 연결을 미리 맺어 둠
+        backend.prewarm()
 
-                if similarity > 0.8:
-                    y_offset = location[1]
-                    if y_offset == prev_y_offset:
-                        print("❌ y_offset이 같아서 반복을 종료합니다.")
-                        break
-                    else:
-                        prev_y_offset = y_offset
-                        first_screenshot_bin = image.merge_images(first_screenshot_bin, second_screenshot_bin, location)
-                        print("✅ 이미지 병합 성공!")
+        # 파이프라인 모드에서는 스크롤하는 동안 확정된 띠 이미지를 먼저 OCR
+        pipeline = None
+        if config.get(ConfigKeys.OCR_PIPELINE):
+            pipeline = PipelinedOcr(lambda band: backend.recognize(band, clova_ocr.PRIORITY_LOW),
+                                    max_workers=config.get(ConfigKeys.OCR_PIPELINE_WORKERS))
 
-                scroll_count += 1
-                if scroll_count == max_scroll:
-                    print("❌ 최대 시도 횟수 도달, 종료합니다.")
+        try:
+            capture_result = self.capture(source, max_scroll, scroll_repeat, pipeline)
+        except Exception:
+            if pipeline:
+                pipeline.close()
+            raise
+        finally:
+            source.close()
 
-            if parent:
-                parent.activateWindow()  # 윈도우 활성화
-                parent.raise_()  # 윈도우를 맨 위로 올림
+        if parent:
+            parent.activateWindow()  # 윈도우 활성화
+            parent.raise_()  # 윈도우를 맨 위로 올림
 
-            self._on_before_extract()
+        self._on_before_extract()
 
-            _, _, _, _, _, profile_ratio = self.get_dynamic_ratio(hwnd)
-            cropped_image = first_screenshot_bin[:, int(client_width * profile_ratio):]
+        if pipeline:
+            fields = pipeline.results()
+        else:
+            cropped_image = self._crop_profile(capture_result.image, source)
 
             # resized_image = cv2.resize(cropped_image, (0, 0), fx=0.4, fy=0.4)
             # cv2.imshow("Preview", resized_image)
             # cv2.waitKey(0)
             # cv2.destroyAllWindows()
 
-            extracted_text = clova_ocr.call_clova_ocr(cropped_image, api_url, api_secret_key)
-            print(f"📝 추출된 텍스트: {extracted_text}")
+            fields = backend.recognize(cropped_image)
+        print(f"📝 추출된 텍스트: {[field.text for field in fields]}")
+        summary = backend.summary()
+        if summary:
+            print(f"📊 {summary}")
 
-            extracted_text = self._fix_extracted_text(extracted_text)
+        table = self._parse_fields(fields)
 
-            self._on_after_extract(extracted_text)
+        self._on_after_extract(table)
 
-            # 엑셀 저장
-            directory = self.create_output_directory()
+        # 엑셀 저장
+        directory = self.create_output_directory()
 
-            today = datetime.now()
-            today_date = today.strftime('%Y-%m-%d')
-            today_time = today.strftime('%H:%M:%S')
+        today = datetime.now()
+        today_date = today.strftime('%Y-%m-%d')
+        today_time = today.strftime('%H:%M:%S')
 
-            # 요일을 한국어로 매핑
-            weekdays = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
-            weekday = weekdays[today.weekday()]
+        # 요일을 한국어로 매핑
+        weekdays = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
+        weekday = weekdays[today.weekday()]
 
-            excel_path = os.path.join(directory, f"{today_date}.xlsx")
-            headers, data = self._create_excel_data(extracted_text)
+        excel_path = os.path.join(directory, f"{today_date}.xlsx")
+        headers, table = self._create_excel_data(table)
 
-            excel = Excel()
-            excel.export(path=excel_path,
-                         sheet_name=today_date,
-                         title=f"{today_date} {today_time} {weekday}",
-                         columns=self.excel_columns,
-                         data=data)
+        excel = Excel()
+        excel.export(path=excel_path,
+                     sheet_name=today_date,
+                     title=f"{today_date} {today_time} {weekday}",
+                     columns=self.excel_columns,
+                     data=table)
 
-            # # 이미지 저장
-            # image_path = os.path.join(directory, f"{today}.jpg")
-            # image.save_image(image_path, cropped_image)
+        # 엑셀을 다시 읽지 않고 분석할 수 있도록 결과 표를 함께 저장
+        table.save(os.path.splitext(excel_path)[0] + ".npz")
 
-            if window.show_message("추출", "추출이 완료되었습니다. 엑셀파일을 실행하시겠습니까?", flag=window.MB_OKCANCEL) == 1:
-                os.startfile(excel_path)
-        except Exception as e:
-            logging.error("추출 중 에러 발생", exc_info=True)  # 로그 파일에 오류 기록
-            window.show_message("에러", f"목록 추출 실패: {e}", flag=window.MB_ICONERROR)
-
-    def _fix_extracted_text(self, extracted_text):
-        return extracted_text
+        # 서클원별 변화를 조회할 수 있도록 숫자 열을 기록에 추가 (실패해도 엑셀은 저장됨)
+        try:
+            with HistoryStore() as history:
+                history.append(self.folder_name, table, sorted(self.numeric_keys), today,
+                               self._history_members(table))
+        except sqlite3.Error:
+            logging.error("추출 기록 저장 실패", exc_info=True)
+
+        # # 이미지 저장
+        # image_path = os.path.join(directory, f"{today}.jpg")
+        # image.save_image(image_path, cropped_image)
+
+        return ExtractionResult(excel_path, capture_result)
+
+    def _crop_profile(self, stitched_image, source: FrameSource):
+        """병합 이미지에서 왼쪽 프로필 영역을 제외"""
+        _, _, _, _, _, profile_ratio = source.rect_ratio
+        return stitched_image[:, int(source.client_width * profile_ratio):]
+
+    def capture(self, source: FrameSource, max_scroll, scroll_repeat, pipeline: PipelinedOcr = None):
+        """스크롤하며 캡쳐한 프레임을 하나의 이미지로 병합
+
+        pipeline이 주어지면 병합 중 확정된 띠 이미지를 바로 OCR 요청한다.
+        스크롤 후 프레임 하단의 지문이 그대로면 목록이 움직이지 않은 것으로 보고, 한 번 더 스크롤해도 그대로면 종료한다.
+        """
+        # 첫 번째 스크린샷 찍기
+        first_screenshot, settle_time = source.start()
+        print(f"⏱️ 윈도우 활성화 대기: {settle_time:.2f}초")
+        config = ConfigManager()
+        stitcher = ImageStitcher(image.binarize_image(first_screenshot),
+                                 matcher=create_matcher(config.get(ConfigKeys.MATCHER_ENGINE)))
+        band_height = stitcher.frame_height * config.get(ConfigKeys.OCR_BAND_FRAMES)
+
+        settle_times = [settle_time]
+        second_screenshot = first_screenshot
+        fingerprint = image.frame_fingerprint(first_screenshot)
+
+        # 스크롤 및 이미지 비교
+        scroll_count = 0
+        merged_count = 0
+        unmoved = False  # 직전 스크롤에서 화면이 움직이지 않았는지 (한 번 더 스크롤해서 확인)
+        stop_reason = StopReason.MAX_SCROLLS
+        while scroll_count < max_scroll:
+            source.scroll(scroll_repeat)
+
+            second_screenshot, settle_time, settled = source.next_frame(reference=second_screenshot)
+            settle_times.append(settle_time)
+            scroll_count += 1
+            print(f"⏱️ 스크롤 안정화 대기: {settle_time:.2f}초" + ("" if settled else " (시간 초과)"))
+
+            prev_fingerprint, fingerprint = fingerprint, image.frame_fingerprint(second_screenshot)
+            if image.is_same_fingerprint(prev_fingerprint, fingerprint):
+                shift = 0
+            else:
+                similarity, shift = stitcher.add(image.binarize_image(second_screenshot))
 
-    def _create_excel_data(self, extracted_text=None):
+                print(f"🔍 유사도: {similarity}")
+                print(f"📍 스크롤 이동량: {shift}")
+
+            if shift == 0:
+                # 느린 환경에서는 스크롤이 늦게 시작될 수 있으므로, 한 번 더 스크롤해도 그대로일 때만 목록 끝으로 판단
+                if not unmoved:
+                    unmoved = True
+                    print("⚠️ 화면이 이동하지 않아서 한 번 더 스크롤하여 확인합니다.")
+                    continue
+
+                stop_reason = StopReason.BOTTOM_REACHED if merged_count else StopReason.NOT_SCROLLABLE
+                print("❌ 화면이 이동하지 않아서 반복을 종료합니다.")
+                break
+
+            unmoved = False
+            if shift is not None:
+                merged_count += 1
+                print("✅ 이미지 병합 성공!")
+
+                band = stitcher.pop_band(band_height) if pipeline else None
+                if band:
+                    top, band_image = band
+                    pipeline.submit(top, self._crop_profile(band_image, source))
+
+            if scroll_count == max_scroll:
+                print("❌ 최대 시도 횟수 도달, 종료합니다.")
+
+        fixed_sleep_time = ACTIVATE_SLEEP + SCROLL_SLEEP * (len(settle_times) - 1)
+        print(f"⏱️ 총 대기 시간: {sum(settle_times):.2f}초 (고정 대기 시 {fixed_sleep_time:.2f}초)")
+
+        band = stitcher.pop_band(band_height, final=True) if pipeline else None
+        if band:
+            top, band_image = band
+            pipeline.submit(top, self._crop_profile(band_image, source))
+
+        print(f"🏁 캡쳐 종료: {stop_reason} (스크롤 {scroll_count}회, 병합 {merged_count}회)")
+        return CaptureResult(stitcher.image, stop_reason, scroll_count, merged_count, settle_times)
+
+    def _parse_fields(self, fields):
+        """OCR 필드를 결과 표로 변환, 좌표로 열을 나누지 못하면 텍스트 순서로 처리"""
+        rows = parse_layout(fields, self.ocr_headers, self.numeric_keys)
+        if rows is not None:
+            return ResultTable.from_records(rows, self._keys, self.numeric_keys)
+
+        print("⚠️ 좌표로 행을 나누지 못해 텍스트 순서로 처리합니다.")
+        extracted_text = [field.text for field in fields]
+        if not self.record_grammar:
+            return self._split_extracted_text(extracted_text)
+        return self._tokenize_records(extracted_text)
+
+    def _segmenter(self):
+        """서클원 닉네임(이전에 찾은 OCR 변형 포함)과 레코드 규칙의 고정 어휘로 만든 분할기"""
+        manager = CircleMemberManager()
+        nicknames = [member.nickname for member in manager.members] + list(manager.aliases.aliases)
+        return RosterSegmenter.from_grammar(self.record_grammar, nicknames)
+
+    def _tokenize_records(self, extracted_text):
+        """나뉘거나 붙어서 인식된 토큰을 명단 기준으로 다시 나눈 뒤, 필드 규칙으로 레코드를 나누고 신뢰도가 낮은 행은 경고"""
+        keys = self._keys
+        tokens = self._segmenter().segment(extracted_text)
+        rows = []
+        for values, confidence in RecordTokenizer(self.record_grammar).tokenize(tokens):
+            if confidence < LOW_CONFIDENCE:
+                print(f"⚠️ 인식 신뢰도가 낮은 항목 ({confidence:.2f}): {values}")
+            rows.append(typed_row(values, keys, self.numeric_keys))
+        return ResultTable.from_records(rows, keys, self.numeric_keys)
+
+    @property
+    def _keys(self):
+        return [key for key, _ in self.ocr_headers]
+
+    def _member_column(self, table: ResultTable, attribute):
+        """닉네임 열의 중복 없는 닉네임을 한 번에 찾은 서클원 속성 열 (명단에 없으면 None)"""
+        nicknames = table.column("nickname")
+        return nicknames.expand(CircleMemberManager().get_by_nicknames(nicknames.categories, attribute))
+
+    def _history_members(self, table: ResultTable):
+        """기록에 사용할 행별 서클원 (명단에 없거나 확인하지 않은 닉네임 추정이면 None)"""
+        manager = CircleMemberManager()
+        nicknames = table.column("nickname")
+        return nicknames.expand([None if manager.fuzzy_match(nickname) else manager.get_by_nickname(nickname)
+                                 for nickname in nicknames.categories])
+
+    def _remark_column(self, table: ResultTable):
+        """비고 열 (편집 거리로 추정한 서클원은 확인할 수 있도록 추정한 명단 닉네임을 덧붙임)"""
+        manager = CircleMemberManager()
+        nicknames = table.column("nickname")
+        remarks = []
+        for nickname, remark in zip(nicknames.categories, manager.get_by_nicknames(nicknames.categories, "remark")):
+            fuzzy = manager.fuzzy_match(nickname)
+            remarks.append(" ".join(filter(None, [remark, f"(추정: {fuzzy})"])) if fuzzy else remark)
+        return nicknames.expand(remarks)
+
+    def _create_excel_data(self, table: ResultTable):
+        """엑셀 열마다 열 전체를 한 번에 계산해 표에 추가"""
         headers = [excel_header.header for excel_header in self.excel_columns]
 
-        ocr_data = self._split_extracted_text(extracted_text)
-
-        data = []
-        for ocr_row in ocr_data:
-            row = []
-            for excel_header in self.excel_columns:
-                value = excel_header.value
-
-                if isinstance(value, Callable):
-                    result = value(ocr_row)
-                    row.append(result)
-                else:
-                    row.append(value)
-
-            data.append(row)
+        for excel_header in self.excel_columns:
+            value = excel_header.value
+            if isinstance(value, Callable):
+                table.add_column(excel_header.key, value(table))
+            else:
+                table.add_column(excel_header.key, [value] * len(table))
 
-        return headers, data
+        return headers, table
 
     def _split_extracted_text(self, extracted_text):
-        result = []
-
-        # 서클원 정보는 headers의 길이만큼 반복되므로, 이를 기준으로 데이터를 묶음
-        for i in range(0, len(extracted_text), len(self.ocr_headers)):
-            row = {}
-            for j in range(len(self.ocr_headers)):
-                value = extracted_text[i + j]
-                if isinstance(value, str) and value.isdecimal():
-                    value = int(value)
-
-                row[self.ocr_headers[j][0]] = value
-            result.append(row)
-
-        return result
+        # 서클원 정보는 headers의 길이만큼 반복되므로, 이를 기준으로 열을 나눔
+        return ResultTable.from_tokens(extracted_text, self._keys, self.numeric_keys)
 
     def extract_numbers(self, input_string):
         return ''.join(char for char in input_string if char.isdigit())
@@ -25,11 +25,14 @@ class CircleMemberModel(QStandardItemModel):
             header_item.setData(header_key, Qt.UserRole)
             self.setHorizontalHeaderItem(col_idx, header_item)
 
+        # data()는 다시 그릴 때마다 호출되므로 가입기간 열 번호를 미리 계산
+        self._join_period_column = list(COLUMN_MAP).index("join_period")
+
         self.load_data()
         self.itemChanged.connect(self.on_item_changed)
 
     def data(self, index, role=Qt.DisplayRole):
-        if role == Qt.DisplayRole and self.get_column_key(index.column()) == "join_period":
+        if role == Qt.DisplayRole and index.column() == self._join_period_column:
             circle_member_manager = CircleMemberManager()
             return circle_member_manager.members[index.row()].join_period
 
@@ -62,22 +65,26 @@ class CircleMemberModel(QStandardItemModel):
         """새로운 서클원을 모델과 매니저에 추가"""
         circle_member_manager = CircleMemberManager()
         new_member = circle_member_manager.add_member()
-        circle_member_manager.save_to_json()
 
         self.appendRow(self.member_to_items(new_member))
 
     def remove_members(self, row_indices):
-        """새로운 서클원을 모델과 매니저에 추가"""
+        """선택한 서클원을 매니저에서 한 번에 삭제한 뒤 모델에서도 삭제
+
+        저장에 실패하면 매니저가 저장소에서 다시 로드하므로, 모델의 행은 저장이 끝난 뒤에만 삭제한다.
+        """
 
         if not row_indices:
             return  # 선택된 행이 없으면 아무 작업도 하지 않음
 
+        rows = sorted(row_indices, reverse=True)
         circle_member_manager = CircleMemberManager()
-        for row_idx in sorted(row_indices, reverse=True):
-            circle_member_manager.remove_member(row_idx)
-            self.removeRow(row_idx)
+        with circle_member_manager.transaction():  # 여러 명을 삭제해도 한 번에 저장
+            for row_idx in rows:
+                circle_member_manager.remove_member(row_idx)
 
-        circle_member_manager.save_to_json()
+        for row_idx in rows:
+            self.removeRow(row_idx)
 
     def on_item_changed(self, item):
         """itemChanged 시 처리할 이벤트"""
@@ -93,5 +100,5 @@ class CircleMemberModel(QStandardItemModel):
 
         setattr(member, key, item.text())
 
-        # 수정된 데이터를 저장
-        manager.save_to_json()
+        # 수정된 데이터를 저장 (닉네임 색인도 갱신)
+        manager.update_member(row, member)
@@ -7,14 +7,13 @@ from PyQt5.QtWidgets import (
     QMainWindow, QVBoxLayout, QPushButton, QWidget, QHBoxLayout, QHeaderView, QAction
 )
 
+from circle_member import POSITIONS, CircleMemberManager
 from extractors import CircleMemberExtractor, DustFrontlineExtractor
 from gui.circle_member_model import CircleMemberModel, COLUMN_MAP
 from gui.config_window import ConfigWindow
 from gui.delegates import ComboBoxDelegate, DateEditDelegate, ReadOnlyAndFormatDelegate
 from gui.sortable_table_view import SortableTableView
-
-# 직위 리스트
-POSITIONS = ["서클장", "부서클장", "서클원"]
+from utils import window
 
 circle_member_extractor = CircleMemberExtractor()
 dust_frontline_extractor = DustFrontlineExtractor()
@@ -76,10 +75,14 @@ class MainWindow(QMainWindow):
         self.remove_button = QPushButton("서클원 삭제", self)
         self.remove_button.clicked.connect(self.remove_members)
 
+        self.alias_button = QPushButton("닉네임 추정 확인", self)
+        self.alias_button.clicked.connect(self.confirm_aliases)
+
         # 버튼 레이아웃
         button_layout = QHBoxLayout()
         button_layout.addWidget(self.add_button)
         button_layout.addWidget(self.remove_button)
+        button_layout.addWidget(self.alias_button)
 
         # 메인 레이아웃
         layout = QVBoxLayout()
@@ -123,3 +126,23 @@ class MainWindow(QMainWindow):
         """ 선택한 서클원 삭제 """
         row_indices = self.circle_member_table.get_selected_model_indices()
         self.model.remove_members(row_indices)
+
+    def confirm_aliases(self):
+        """추출 중 편집 거리로 추정한 닉네임을 하나씩 확인하여, 맞는 것만 닉네임 대응표에 저장"""
+        circle_member_manager = CircleMemberManager()
+        if not circle_member_manager.fuzzy_matches:
+            window.show_message("닉네임 추정 확인", "확인할 추정 닉네임이 없습니다.")
+            return
+
+        for nickname, resolved in list(circle_member_manager.fuzzy_matches.items()):
+            result = window.show_message(
+                "닉네임 추정 확인",
+                f"OCR로 읽은 '{nickname}'은(는) 서클원 '{resolved}'입니까?\n"
+                f"[예]를 누르면 다음 추출부터 바로 '{resolved}'(으)로 처리합니다.",
+                window.MB_YESNOCANCEL | window.MB_ICONQUESTION)
+            if result == 6:  # 예
+                circle_member_manager.confirm_alias(nickname, resolved)
+            elif result == 7:  # 아니오
+                circle_member_manager.reject_alias(nickname)
+            else:  # 취소
+                break
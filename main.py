@@ -13,6 +13,7 @@ if __name__ == "__main__":
     circle_member_manager = CircleMemberManager()
 
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(config.flush)  # 입력 직후 종료해도 설정 저장
 
     main_window = MainWindow()
     main_window.show()
@@ -0,0 +1,93 @@
+"""ClovaOcrClient의 재시도, 포기, 연결 재사용 테스트 (로컬 Clova OCR 흉내 서버 사용)
+
+python -m pytest tests 또는 python -m unittest discover tests
+"""
+import unittest
+
+import numpy as np
+
+from benchmarks.clova_stub import ClovaStubServer
+from utils.clova_ocr import ClovaOcrClient, ClovaOcrError
+
+FIELDS = [{"inferText": "노루", "boundingPoly": {"vertices": [{"x": 1, "y": 2}, {"x": 11, "y": 12}]}}]
+
+
+def create_image():
+    image = np.full((40, 120), 255, dtype=np.uint8)
+    image[10:30, 10:110] = 0
+    return image
+
+
+class RecordingClient(ClovaOcrClient):
+    """재시도 전 대기 시간을 기록하는 클라이언트 (테스트가 오래 걸리지 않도록 짧은 백오프 사용)"""
+
+    def __init__(self, api_url, **kwargs):
+        kwargs.setdefault("backoff_base", 0.01)
+        kwargs.setdefault("backoff_max", 0.05)
+        super().__init__(api_url, "secret", connect_timeout=2, read_timeout=5, **kwargs)
+        self.backoffs = []
+
+    def _backoff(self, attempt, response=None):
+        delay = super()._backoff(attempt, response)
+        self.backoffs.append((attempt, response.status_code if response is not None else None, delay))
+        return delay
+
+
+class ClovaOcrClientTest(unittest.TestCase):
+    def test_retries_rate_limit_and_server_errors_with_backoff(self):
+        with ClovaStubServer(fields=FIELDS, fail_statuses=[429, 503]) as server:
+            client = RecordingClient(server.url, max_retries=3)
+            fields = client.recognize_fields([create_image()])[0]
+            client.close()
+
+        self.assertEqual([field.text for field in fields], ["노루"])
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual([(attempt, status) for attempt, status, _ in client.backoffs], [(0, 429), (1, 503)])
+        for attempt, _, delay in client.backoffs:
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(client.backoff_max, client.backoff_base * 2 ** attempt))
+
+    def test_gives_up_after_retry_limit(self):
+        with ClovaStubServer(fields=FIELDS, fail_statuses=[503] * 10) as server:
+            client = RecordingClient(server.url, max_retries=2)
+            with self.assertRaises(ClovaOcrError) as context:
+                client.recognize_fields([create_image()])
+            client.close()
+
+        self.assertIn("503", str(context.exception))
+        self.assertEqual(len(server.requests), 3)  # 첫 요청 + 재시도 2번
+        self.assertEqual(len(client.backoffs), 2)
+
+    def test_does_not_retry_client_errors(self):
+        with ClovaStubServer(fields=FIELDS, fail_statuses=[400]) as server:
+            client = RecordingClient(server.url, max_retries=3)
+            with self.assertRaises(ClovaOcrError):
+                client.recognize_fields([create_image()])
+            client.close()
+
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(client.backoffs, [])
+
+    def test_reuses_pooled_connection(self):
+        with ClovaStubServer(fields=FIELDS) as server:
+            client = RecordingClient(server.url)
+            for _ in range(5):
+                client.recognize_fields([create_image()])
+            client.close()
+
+        self.assertEqual(len(server.requests), 5)
+        self.assertEqual(len(server.connections), 1)
+
+    def test_malformed_response_raises_clova_ocr_error(self):
+        responses = [{}, {"images": []}, {"images": [{"inferResult": "ERROR", "message": "invalid image"}]}]
+        for response in responses:
+            with self.subTest(response=response):
+                with ClovaStubServer(respond=lambda payload: response) as server:
+                    client = RecordingClient(server.url)
+                    with self.assertRaises(ClovaOcrError):
+                        client.recognize_fields([create_image()])
+                    client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
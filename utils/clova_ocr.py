@@ -1,9 +1,244 @@
 import base64
+import heapq
+import itertools
 import json
+import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
 
 import cv2
 import requests
+from requests.adapters import HTTPAdapter
+
+from utils import image as image_utils
+from utils.ocr_payload import PayloadOptions, encode_payload
+
+# 재시도할 HTTP 상태 코드 (요청 제한, 서버 오류)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 오류 메시지에 포함할 응답 내용의 최대 길이
+MAX_ERROR_BODY = 1000
+
+# 타일 OCR 기본값
+DEFAULT_TILE_OVERLAP = 200
+MIN_TILE_HEIGHT = 200  # 목록 한 행보다 크게 (이보다 작은 설정값은 이 값으로 처리)
+DEFAULT_CONCURRENCY = 2
+
+# 요청 우선순위 (작을수록 먼저 전송)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+# 월간 사용량 파일
+USAGE_FILE_NAME = "ocr_usage.json"
+USAGE_PATH = os.path.join(os.getcwd(), USAGE_FILE_NAME)
+
+
+class ClovaOcrError(Exception):
+    """Clova OCR API 호출이 재시도 후에도 실패했거나 응답에 인식 결과가 없는 경우"""
+    pass
+
+
+class OcrUsage:
+    """월별 OCR 호출 수와 전송 바이트를 파일에 누적하고, 한도에 가까워지면 경고하는 클래스
+
+    monthly_limit이 0이면 경고 없이 기록만 한다.
+    """
+
+    def __init__(self, path=USAGE_PATH, monthly_limit=0, warn_ratio=0.9):
+        self.path = path
+        self.monthly_limit = monthly_limit
+        self.warn_ratio = warn_ratio
+        self._lock = threading.Lock()
+        self._warned_month = None
+        self._usage = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ OCR 사용량 파일을 읽지 못했습니다: {e}")
+            return {}
+
+    def _save(self):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._usage, f, ensure_ascii=False, indent=4)
+        os.replace(temp_path, self.path)
+
+    def month(self, month=None):
+        """해당 월(YYYY-MM, 기본값 이번 달)의 {"calls": 호출 수, "bytes": 전송 바이트}"""
+        month = month or datetime.now().strftime("%Y-%m")
+        return dict(self._usage.get(month, {"calls": 0, "bytes": 0}))
+
+    def record(self, size):
+        """호출 1회와 전송 바이트를 기록"""
+        month = datetime.now().strftime("%Y-%m")
+        with self._lock:
+            usage = self._usage.setdefault(month, {"calls": 0, "bytes": 0})
+            usage["calls"] += 1
+            usage["bytes"] += size
+            calls = usage["calls"]
+            try:
+                self._save()
+            except OSError as e:
+                print(f"⚠️ OCR 사용량을 저장하지 못했습니다: {e}")
+
+            if not self.monthly_limit:
+                return
+            if calls > self.monthly_limit:
+                print(f"⚠️ 이번 달 OCR 호출 한도를 초과했습니다 ({calls}/{self.monthly_limit}회)")
+            elif calls >= self.monthly_limit * self.warn_ratio and self._warned_month != month:
+                self._warned_month = month
+                print(f"⚠️ 이번 달 OCR 호출이 한도에 가까워졌습니다 ({calls}/{self.monthly_limit}회)")
+
+
+class CallStats:
+    """호출별 대기 시간(스케줄러 큐)과 응답 시간을 모으는 클래스"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.queue_delays = []
+        self.latencies = []
+
+    def record(self, queue_delay, latency):
+        with self._lock:
+            self.queue_delays.append(queue_delay)
+            self.latencies.append(latency)
+
+    def summary(self):
+        if not self.latencies:
+            return "OCR 호출 없음"
+
+        def describe(values):
+            values = sorted(values)
+            p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+            return f"평균 {sum(values) / len(values) * 1000:.0f}ms, p95 {p95 * 1000:.0f}ms"
+
+        return (f"OCR 호출 {len(self.latencies)}회, 대기 {describe(self.queue_delays)}, "
+                f"응답 {describe(self.latencies)}")
+
+
+class RequestScheduler:
+    """OCR 요청을 초당 호출 수(토큰 버킷), 동시 요청 수, 우선순위에 맞춰 내보내는 스케줄러
+
+    요청 제한에 걸려 429로 실패하는 대신 보내기 전에 기다린다.
+    rate가 0이면 초당 호출 수를 제한하지 않는다.
+    """
+
+    def __init__(self, rate=0, burst=1, max_in_flight=DEFAULT_CONCURRENCY, usage: OcrUsage = None):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_in_flight = max(1, max_in_flight)
+        self.usage = usage
+        self.stats = CallStats()
+
+        self._condition = threading.Condition()
+        self._waiting = []  # (우선순위, 순번) 힙
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _wait_time(self, ticket):
+        """ticket이 지금 보낼 수 있으면 0, 토큰을 기다려야 하면 대기 초, 차례가 아니면 None"""
+        if self._waiting[0] != ticket or self._in_flight >= self.max_in_flight:
+            return None
+        if not self.rate:
+            return 0
+
+        self._refill()
+        return 0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+
+    @contextmanager
+    def slot(self, priority=PRIORITY_NORMAL, size=0):
+        """요청을 보낼 차례가 될 때까지 기다린 뒤 블록 안에서 요청을 보냄"""
+        enqueued_at = time.monotonic()
+        with self._condition:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._waiting, ticket)
+            while True:
+                wait = self._wait_time(ticket)
+                if wait == 0:
+                    break
+                self._condition.wait(wait)
+
+            heapq.heappop(self._waiting)
+            self._in_flight += 1
+            if self.rate:
+                self._tokens -= 1
+            self._condition.notify_all()
+
+        if self.usage:
+            self.usage.record(size)
+
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+            self.stats.record(started_at - enqueued_at, time.monotonic() - started_at)
+
+
+class OcrField:
+    """OCR로 인식한 글자 영역 하나 (좌표는 요청한 이미지 기준)"""
+    __slots__ = ("text", "left", "top", "right", "bottom", "confidence", "line_break")
+
+    def __init__(self, text, left=0, top=0, right=0, bottom=0, confidence=1.0, line_break=False):
+        self.text = text
+        self.left = left
+        self.top = top
+        self.right = right
+        self.bottom = bottom
+        self.confidence = confidence
+        self.line_break = line_break
+
+    def __repr__(self):
+        return f"OcrField({self.text!r}, ({self.left}, {self.top}, {self.right}, {self.bottom}))"
+
+    @property
+    def center_x(self):
+        return (self.left + self.right) / 2
+
+    @property
+    def center_y(self):
+        return (self.top + self.bottom) / 2
+
+    def scaled(self, factor):
+        """좌표에 factor를 곱한 필드 (축소해서 보낸 이미지의 좌표를 원본 좌표로 되돌릴 때 사용)"""
+        return OcrField(self.text, self.left * factor, self.top * factor, self.right * factor,
+                        self.bottom * factor, self.confidence, self.line_break)
+
+    def offset(self, dy):
+        """세로로 dy만큼 이동한 필드"""
+        return OcrField(self.text, self.left, self.top + dy, self.right, self.bottom + dy,
+                        self.confidence, self.line_break)
+
+    def iou(self, other):
+        """두 영역의 IoU (겹치는 면적 / 합친 면적)"""
+        width = min(self.right, other.right) - max(self.left, other.left)
+        height = min(self.bottom, other.bottom) - max(self.top, other.top)
+        if width <= 0 or height <= 0:
+            return 0.0
+
+        intersection = width * height
+        area = (self.right - self.left) * (self.bottom - self.top)
+        other_area = (other.right - other.left) * (other.bottom - other.top)
+        return intersection / (area + other_area - intersection)
 
 
 def encode_image_to_base64(image, ext="jpg"):
@@ -11,25 +246,227 @@ def encode_image_to_base64(image, ext="jpg"):
     return base64.b64encode(buffer).decode("utf-8")
 
 
-def call_clova_ocr(image, api_url, secret_key, format="jpg"):
-    headers = {"Content-Type": "application/json", "X-OCR-SECRET": secret_key}
-    image_base64 = encode_image_to_base64(image)
-
-    payload = {
-        "images": [{"format": format, "name": "ocr_image", "data": image_base64}],
-        "lang": "ko",
-        "requestId": "string",
-        "resultType": "string",
-        "timestamp": int(time.time()),
-        "version": "V2"
-    }
-
-    response = requests.post(api_url, headers=headers, data=json.dumps(payload))
-    if response.status_code == 200:
-        return parse_ocr_result(response.json())
-    else:
-        print(f"❌ OCR API 호출 실패: {response.status_code}, 응답: {response.text}")
-        return None
+class ClovaOcrClient:
+    """Clova OCR API 클라이언트
+
+    keep-alive 연결을 재사용하는 requests.Session을 유지하고,
+    요청마다 연결/응답 타임아웃을 적용하며 429/5xx 응답은 지수 백오프(jitter 포함)로 재시도한다.
+    """
+
+    def __init__(self, api_url, secret_key, connect_timeout=5, read_timeout=60, max_retries=3,
+                 backoff_base=0.5, backoff_max=8.0, pool_size=4, scheduler: RequestScheduler = None):
+        self.api_url = api_url
+        self.scheduler = scheduler or RequestScheduler(max_in_flight=pool_size)
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Content-Type": "application/json", "X-OCR-SECRET": secret_key})
+
+    def prewarm(self):
+        """캡쳐하는 동안 백그라운드에서 DNS, TCP, TLS 연결을 미리 맺어 둠"""
+        thread = threading.Thread(target=self._prewarm, name="ocr-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def _prewarm(self):
+        try:
+            self.session.head(self.api_url, timeout=self.timeout).close()
+        except requests.RequestException as e:
+            print(f"⚠️ OCR API 연결 준비 실패: {e}")
+
+    def _backoff(self, attempt, response=None):
+        """재시도 전 대기 시간 (Retry-After 헤더가 있으면 우선)"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def post(self, payload, priority=PRIORITY_NORMAL):
+        """payload를 스케줄러 순서에 맞춰 전송하고 응답 JSON을 반환, 재시도 후에도 실패하면 ClovaOcrError"""
+        data = json.dumps(payload)
+        for attempt in range(self.max_retries + 1):
+            response = None
+            try:
+                with self.scheduler.slot(priority, len(data)):
+                    response = self.session.post(self.api_url, data=data, timeout=self.timeout)
+                if response.status_code == 200:
+                    try:
+                        return response.json()
+                    except ValueError:
+                        raise ClovaOcrError(f"OCR API 응답을 읽을 수 없습니다: {response.text[:MAX_ERROR_BODY]}")
+
+                error = f"{response.status_code}, 응답: {response.text}"
+                if response.status_code not in RETRY_STATUS_CODES:
+                    raise ClovaOcrError(f"OCR API 호출 실패: {error}")
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = str(e)
+
+            if attempt < self.max_retries:
+                delay = self._backoff(attempt, response)
+                print(f"⚠️ OCR API 호출 실패 ({error}), {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                time.sleep(delay)
+
+        raise ClovaOcrError(f"OCR API 호출 실패: {error}")
+
+    def recognize_fields(self, images, options: PayloadOptions = None, priority=PRIORITY_NORMAL):
+        """이미지 목록을 한 번의 요청으로 OCR하여 이미지별 OcrField 목록을 반환 (좌표는 원본 이미지 기준)"""
+        options = options or PayloadOptions()
+        encoded = [encode_payload(image, options) for image in images]
+        payload = {
+            "images": [{"format": options.format, "name": f"ocr_image_{i}", "data": data}
+                       for i, (data, _) in enumerate(encoded)],
+            "lang": "ko",
+            "requestId": "string",
+            "resultType": "string",
+            "timestamp": int(time.time()),
+            "version": "V2"
+        }
+        image_fields = parse_ocr_fields(check_ocr_result(self.post(payload, priority), len(images)))
+        return [fields if scale == 1.0 else [field.scaled(1 / scale) for field in fields]
+                for fields, (_, scale) in zip(image_fields, encoded)]
+
+    def recognize(self, image, options: PayloadOptions = None):
+        """이미지를 OCR하여 추출된 텍스트 목록을 반환"""
+        return [field.text for field in self.recognize_fields([image], options)[0]]
+
+    def recognize_tiled(self, image, tile_height, overlap=DEFAULT_TILE_OVERLAP, max_workers=DEFAULT_CONCURRENCY,
+                        batch=False, options: PayloadOptions = None, priority=PRIORITY_NORMAL):
+        """세로로 긴 이미지를 겹치는 타일로 나눠 OCR하고, 읽는 순서대로 합친 OcrField 목록을 반환
+
+        batch=True면 모든 타일을 한 요청의 images로 보내고, 아니면 최대 max_workers개씩 동시에 요청한다.
+        """
+        tiles = split_into_tiles(image, tile_height, overlap)
+        tile_images = [tile for _, tile in tiles]
+        print(f"🧩 OCR 타일 {len(tiles)}개 ({'단일 요청' if batch else f'동시 요청 {max_workers}개'})")
+
+        if batch:
+            tile_fields = self.recognize_fields(tile_images, options, priority)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ocr-tile") as executor:
+                tile_fields = list(executor.map(lambda tile: self.recognize_fields([tile], options, priority)[0],
+                                                tile_images))
+
+        return merge_tile_fields(tiles, tile_fields)
+
+    def close(self):
+        self.session.close()
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(api_url, secret_key, scheduler: RequestScheduler = None):
+    """API 정보별로 하나의 클라이언트를 재사용 (연결 유지), scheduler를 주면 클라이언트의 스케줄러를 교체"""
+    with _clients_lock:
+        client = _clients.get((api_url, secret_key))
+        if client is None:
+            client = _clients[(api_url, secret_key)] = ClovaOcrClient(api_url, secret_key, scheduler=scheduler)
+        elif scheduler is not None:
+            client.scheduler = scheduler
+        return client
+
+
+def call_clova_ocr_fields(image, api_url, secret_key, options: PayloadOptions = None, tile_height=None,
+                          tile_overlap=DEFAULT_TILE_OVERLAP, max_workers=DEFAULT_CONCURRENCY, batch=False,
+                          priority=PRIORITY_NORMAL):
+    """이미지를 OCR하여 OcrField 목록을 반환, tile_height보다 긴 이미지는 타일로 나눠 요청"""
+    client = get_client(api_url, secret_key)
+    if tile_height and image.shape[0] > tile_height:
+        return client.recognize_tiled(image, tile_height, tile_overlap, max_workers, batch, options, priority)
+
+    return client.recognize_fields([image], options, priority)[0]
+
+
+def call_clova_ocr(image, api_url, secret_key, format="jpg", **tile_options):
+    """이미지를 OCR하여 추출된 텍스트 목록을 반환"""
+    fields = call_clova_ocr_fields(image, api_url, secret_key, PayloadOptions(format=format), **tile_options)
+    return [field.text for field in fields]
+
+
+def split_into_tiles(image, tile_height, overlap=DEFAULT_TILE_OVERLAP):
+    """이미지를 글자 행을 자르지 않는 위치에서 overlap만큼 겹치는 타일로 나눔 [(y 좌표, 타일)]"""
+    height = image.shape[0]
+    tile_height = max(tile_height, MIN_TILE_HEIGHT)
+    overlap = min(overlap, tile_height // 4)
+
+    tiles = []
+    top = 0
+    while True:
+        if height - top <= tile_height:
+            tiles.append((top, image[top:]))
+            return tiles
+
+        bottom = image_utils.find_row_safe_cut(image, top + tile_height - overlap, top + tile_height)
+        tiles.append((top, image[top:bottom]))
+
+        # 다음 타일은 이전 타일과 overlap만큼 겹치게 시작
+        top = image_utils.find_row_safe_cut(image, bottom - overlap, bottom - overlap // 2) if overlap > 1 else bottom
+
+
+def merge_tile_fields(tiles, tile_fields, duplicate_iou=0.5):
+    """타일별 필드를 원본 좌표로 옮겨 합치고, 겹친 구간에서 중복 인식된 필드를 제거
+
+    tiles는 split_into_tiles의 결과, tile_fields는 타일별 OcrField 목록이다.
+    """
+    merged = []
+    prev_fields = []
+    prev_bottom = 0
+    for (top, tile), fields in zip(tiles, tile_fields):
+        fields = [field.offset(top) for field in fields]
+
+        # 이전 타일과 겹치는 구간의 필드는 같은 위치의 필드가 이미 있으면 버림
+        overlapped = [field for field in prev_fields if field.bottom > top]
+        kept = [field for field in fields
+                if field.top >= prev_bottom
+                or not any(field.iou(other) >= duplicate_iou for other in overlapped)]
+
+        merged.extend(kept)
+        prev_fields = kept
+        prev_bottom = top + tile.shape[0]
+
+    return merged
+
+
+def check_ocr_result(result, image_count):
+    """200 응답이라도 이미지별 결과가 없거나 SUCCESS가 아니면 응답 내용과 함께 ClovaOcrError"""
+    images = result.get("images") if isinstance(result, dict) else None
+    if not isinstance(images, list) or len(images) != image_count:
+        raise ClovaOcrError(f"OCR API 응답 형식 오류 (이미지 {image_count}개 요청), 응답: {_error_body(result)}")
+
+    failed = [index for index, image_data in enumerate(images)
+              if not isinstance(image_data, dict) or image_data.get("inferResult") != "SUCCESS"]
+    if failed:
+        raise ClovaOcrError(f"OCR 인식 실패 (이미지 {failed}), 응답: {_error_body(result)}")
+    return result
+
+
+def _error_body(result):
+    return json.dumps(result, ensure_ascii=False)[:MAX_ERROR_BODY]
+
+
+def parse_ocr_fields(result):
+    """OCR 응답을 이미지별 OcrField 목록으로 변환"""
+    images = []
+    try:
+        for image_data in result.get("images", []):
+            fields = []
+            for field in image_data.get("fields", []):
+                vertices = field.get("boundingPoly", {}).get("vertices", [])
+                xs = [vertex.get("x", 0) for vertex in vertices] or [0]
+                ys = [vertex.get("y", 0) for vertex in vertices] or [0]
+                fields.append(OcrField(field.get("inferText", ""), min(xs), min(ys), max(xs), max(ys),
+                                       field.get("inferConfidence", 1.0), field.get("lineBreak", False)))
+            images.append(fields)
+    except Exception as e:
+        print(f"⚠️ OCR 데이터 파싱 중 오류 발생: {e}")
+    return images
 
 
 def parse_ocr_result(result):
@@ -0,0 +1,146 @@
+import os
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from utils import window, mouse
+from utils.screen_capture import ScreenCapturer
+from utils.settle import SettleDetector
+
+# 화면 안정화 최대 대기 시간 (초), 스크롤은 움직이기 시작할 때까지 기다리는 시간(motion_wait)에 여유를 더한 값 이상
+ACTIVATE_TIMEOUT = 2.0
+SCROLL_SETTLE_TIMEOUT = 1.5
+SCROLL_SETTLE_MARGIN = 0.7
+
+# 윈도우 활성화 후 최소 대기 시간, 활성화 전과 화면이 같을 때(이미 앞에 있던 경우 등) 기다리는 시간 (초)
+ACTIVATE_MIN_WAIT = 0.2
+ACTIVATE_MOTION_WAIT = 1.0
+
+
+class FrameSource(ABC):
+    """Extractor에 스크롤 캡쳐 프레임을 공급하는 인터페이스"""
+
+    rect_ratio = None  # get_dynamic_ratio() 결과
+    client_width = None
+
+    @abstractmethod
+    def start(self):
+        """캡쳐를 시작하고 (첫 프레임, 대기 시간)을 반환"""
+        pass
+
+    @abstractmethod
+    def scroll(self, scroll_repeat):
+        """목록을 스크롤"""
+        pass
+
+    @abstractmethod
+    def next_frame(self, reference=None):
+        """스크롤 후 프레임을 가져와 (프레임, 대기 시간, 안정화 여부)를 반환"""
+        pass
+
+    def close(self):
+        pass
+
+
+class LiveFrameSource(FrameSource):
+    """게임 윈도우를 직접 캡쳐하는 프레임 소스 (Windows 전용)"""
+
+    def __init__(self, window_title, get_dynamic_ratio, motion_wait=0.8):
+        self.hwnd = window.find_window(window_title)
+        self.get_dynamic_ratio = get_dynamic_ratio
+        self.motion_wait = motion_wait  # 스크롤 후 화면이 움직이기 시작할 때까지 기다리는 시간 (초)
+        self.capturer = None
+        self.settle_detector = None
+        self.center = None
+
+    def start(self):
+        self.rect_ratio = self.get_dynamic_ratio(self.hwnd)
+        _, _, self.client_width, _, center_x, center_y = window.get_client_area(self.hwnd)
+        self.center = (center_x, center_y)
+
+        bbox = window.get_screenshot_bbox(self.rect_ratio, self.hwnd)
+        print(f"📸 Left: {bbox[0]}, Top: {bbox[1]}, Right: {bbox[2]}, Bottom: {bbox[3]}")
+
+        # grayscale 링 버퍼에 바로 캡쳐하고, 고정 sleep 대신 화면이 멈출 때까지 대기
+        self.capturer = ScreenCapturer(bbox)
+        self.settle_detector = SettleDetector(self.capturer.capture, motion_wait=self.motion_wait,
+                                              timeout=ACTIVATE_TIMEOUT)
+
+        # 활성화 전 화면을 기준으로, 활성화 후 다시 그려지기 전의 화면을 첫 프레임으로 쓰지 않도록 대기
+        reference = self.capturer.capture().copy()
+        window.activate_window(self.hwnd)
+        frame, settle_time, _ = self.settle_detector.wait(reference=reference, min_wait=ACTIVATE_MIN_WAIT,
+                                                          motion_wait=ACTIVATE_MOTION_WAIT)
+        self.settle_detector.timeout = max(SCROLL_SETTLE_TIMEOUT, self.motion_wait + SCROLL_SETTLE_MARGIN)
+        return frame, settle_time
+
+    def scroll(self, scroll_repeat):
+        mouse.move_mouse(*self.center)
+        mouse.scroll_down(scroll_repeat)
+
+    def next_frame(self, reference=None):
+        return self.settle_detector.wait(reference=reference)
+
+    def close(self):
+        if self.capturer:
+            self.capturer.close()
+
+
+class RecordingFrameSource(FrameSource):
+    """다른 프레임 소스를 감싸서 캡쳐한 프레임을 .npz 세션 파일로 저장하는 프레임 소스"""
+
+    def __init__(self, source: FrameSource, path):
+        self.source = source
+        self.path = path
+        self.frames = []
+
+    def start(self):
+        frame, settle_time = self.source.start()
+        self.rect_ratio = self.source.rect_ratio
+        self.client_width = self.source.client_width
+        self.frames.append(frame.copy())  # 링 버퍼 프레임은 재사용되므로 복사
+        return frame, settle_time
+
+    def scroll(self, scroll_repeat):
+        self.source.scroll(scroll_repeat)
+
+    def next_frame(self, reference=None):
+        frame, settle_time, settled = self.source.next_frame(reference)
+        self.frames.append(frame.copy())
+        return frame, settle_time, settled
+
+    def close(self):
+        self.source.close()
+        self.save()
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        np.savez_compressed(self.path, frames=np.stack(self.frames),
+                            rect_ratio=np.array(self.rect_ratio, dtype=np.float64),
+                            client_width=np.array(self.client_width))
+        print(f"✅ 캡쳐 세션 저장 완료: {self.path}")
+
+
+class ReplayFrameSource(FrameSource):
+    """저장된 세션 파일의 프레임을 순서대로 재생하는 프레임 소스 (Win32 호출 없음)"""
+
+    def __init__(self, path):
+        with np.load(path) as session:
+            self.frames = session["frames"]
+            self.rect_ratio = tuple(session["rect_ratio"].tolist())
+            self.client_width = int(session["client_width"])
+        self.index = 0
+
+    def start(self):
+        self.index = 0
+        return self.frames[0], 0.0
+
+    def scroll(self, scroll_repeat):
+        # 녹화가 끝나면 마지막 프레임에 머무름 (화면이 더 이상 움직이지 않는 상태)
+        self.index = min(self.index + 1, len(self.frames) - 1)
+
+    def next_frame(self, reference=None):
+        return self.frames[self.index], 0.0, True
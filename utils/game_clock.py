@@ -0,0 +1,23 @@
+import time
+from datetime import date, datetime, timedelta
+
+# 게임의 하루가 바뀌는 시각 (5시 이전은 전날)
+RESET_HOUR = 5
+
+_today = None
+_expires_at = 0.0  # 다음 초기화 시각 (time.time() 기준)
+
+
+def game_today() -> date:
+    """5시 기준 오늘 날짜, 다음 5시까지는 계산한 날짜를 그대로 사용"""
+    global _today, _expires_at
+    if _today is None or time.time() >= _expires_at:
+        now = datetime.now()
+        reset = now.replace(hour=RESET_HOUR, minute=0, second=0, microsecond=0)
+        if now < reset:
+            _today = (now - timedelta(days=1)).date()  # 5시 이전이면 전날로 설정
+        else:
+            _today = now.date()
+            reset += timedelta(days=1)
+        _expires_at = reset.timestamp()
+    return _today
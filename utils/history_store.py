@@ -0,0 +1,224 @@
+import glob
+import os
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+
+from utils.result_table import ResultTable, NumberColumn
+
+HISTORY_FILENAME = "history.db"
+HISTORY_PATH = os.path.join(os.getcwd(), HISTORY_FILENAME)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    extractor TEXT NOT NULL,
+    date TEXT NOT NULL,
+    time TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    extractor TEXT NOT NULL,
+    date TEXT NOT NULL,
+    member TEXT NOT NULL,
+    nickname TEXT NOT NULL,
+    ocr_nickname TEXT NOT NULL,
+    uid TEXT,
+    metric TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    PRIMARY KEY (extractor, member, metric, date, run_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS history_by_run ON history (run_id, metric, member);
+CREATE INDEX IF NOT EXISTS history_by_nickname ON history (extractor, nickname, date);
+CREATE INDEX IF NOT EXISTS history_by_uid ON history (extractor, uid, metric, date) WHERE uid IS NOT NULL;
+CREATE INDEX IF NOT EXISTS runs_by_date ON runs (extractor, date);
+"""
+
+# OCR 닉네임으로 기록하던 이전 형식의 history 표를 서클원 키 형식으로 옮기는 SQL
+MIGRATE_V1 = """
+ALTER TABLE history RENAME TO history_v0;
+DROP INDEX IF EXISTS history_by_run;
+DROP INDEX IF EXISTS history_by_uid;
+""" + SCHEMA + """
+INSERT OR REPLACE INTO history
+SELECT run_id, extractor, date, CASE WHEN uid IS NOT NULL THEN 'uid:' || uid ELSE 'nickname:' || nickname END,
+       nickname, nickname, uid, metric, value
+FROM history_v0;
+DROP TABLE history_v0;
+"""
+
+
+def member_key(nickname, uid=None):
+    """기록의 서클원 키 (UID가 있으면 닉네임을 바꿔도 이어지도록 UID, 없으면 명단 닉네임)"""
+    return f"uid:{uid}" if uid else f"nickname:{nickname}"
+
+
+# 같은 날 여러 번 추출했으면 그날의 마지막 추출만 사용
+LATEST_RUNS = "SELECT MAX(id) FROM runs WHERE extractor = ? GROUP BY date"
+
+
+class HistoryStore:
+    """추출 결과 기록 (SQLite)
+
+    추출할 때마다 숫자 열(공헌도, 점수, 레벨 등)을 (추출기, 날짜, 서클원, 항목) 단위로 한 행씩 추가한다.
+    서클원은 명단에서 찾은 서클원의 키(member_key)로 기록하여 OCR이 닉네임을 다르게 읽어도 같은 기록으로 모으고,
+    OCR로 읽은 닉네임은 ocr_nickname 열에 따로 남긴다.
+    - 서클원별 변화: (추출기, 서클원, 항목, 날짜) 기본 키
+    - 날짜별 전체 목록: 그날의 마지막 추출 번호를 찾은 뒤 (추출 번호, 항목) 색인
+    조회 결과는 numpy 배열(날짜는 datetime64[D], 값은 int64)로 반환한다.
+    """
+
+    def __init__(self, path=HISTORY_PATH):
+        self.path = path
+        self.connection = sqlite3.connect(path, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self._migrate()
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def _migrate(self):
+        """이전 형식(OCR 닉네임 기준)의 기록을 서클원 키 형식으로 옮김"""
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(history)")]
+        if not columns or "member" in columns:
+            return
+
+        try:
+            self.connection.executescript(f"BEGIN IMMEDIATE;{MIGRATE_V1}COMMIT;")
+        except sqlite3.Error:
+            if self.connection.in_transaction:
+                self.connection.execute("ROLLBACK")
+            raise
+
+    def append(self, extractor, table: ResultTable, metrics, when: datetime = None, members=None) -> int:
+        """추출 결과 표의 숫자 열(metrics)을 한 번의 트랜잭션으로 추가하고 추출 번호를 반환
+
+        members는 행별로 명단에서 찾은 서클원(nickname, uid 속성) 또는 None이며,
+        주지 않거나 None인 행은 OCR 닉네임과 표의 UID 열로 기록한다.
+        """
+        when = when or datetime.now()
+        date = when.strftime('%Y-%m-%d')
+        ocr_nicknames = table.values("nickname")
+        uids = table.values("uid") if "uid" in table else [None] * len(table)
+        members = members if members is not None else [None] * len(table)
+
+        # 행별 (서클원 키, 명단 닉네임, UID)
+        keys = []
+        for ocr_nickname, uid, member in zip(ocr_nicknames, uids, members):
+            nickname, uid = (member.nickname, member.uid) if member is not None else (ocr_nickname, uid)
+            keys.append((member_key(nickname, uid or None), nickname, uid or None))
+
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            run_id = self.connection.execute("INSERT INTO runs (extractor, date, time) VALUES (?, ?, ?)",
+                                             (extractor, date, when.strftime('%H:%M:%S'))).lastrowid
+            for metric in metrics:
+                if metric not in table or not isinstance(table.column(metric), NumberColumn):
+                    continue
+                column = table.column(metric)
+                present = np.ones(len(table), dtype=bool) if column.missing is None else ~column.missing
+                values = column.values.tolist()
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO history "
+                    "(run_id, extractor, date, member, nickname, uid, ocr_nickname, metric, value) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    ((run_id, extractor, date, *keys[index], ocr_nicknames[index], metric, int(values[index]))
+                     for index in np.flatnonzero(present) if ocr_nicknames[index]))
+        return run_id
+
+    def import_folder(self, extractor, folder, metrics, find_members=None) -> int:
+        """엑셀 옆에 저장된 결과 표(.npz) 중 아직 기록되지 않은 날짜를 가져오고 가져온 파일 수를 반환
+
+        find_members(table)를 주면 그 결과를 append의 members로 사용한다.
+        """
+        recorded = set(self.dates(extractor).astype(str))
+        count = 0
+        for path in sorted(glob.glob(os.path.join(folder, "*.npz"))):
+            name = os.path.splitext(os.path.basename(path))[0]
+            try:
+                when = datetime.strptime(name, '%Y-%m-%d')
+            except ValueError:
+                continue
+            if name in recorded:
+                continue
+            table = ResultTable.load(path)
+            self.append(extractor, table, metrics, when, find_members(table) if find_members else None)
+            count += 1
+        return count
+
+    def dates(self, extractor):
+        """기록이 있는 날짜 (datetime64[D], 오름차순)"""
+        cursor = self.connection.execute(
+            "SELECT DISTINCT date FROM runs WHERE extractor = ? ORDER BY date", (extractor,))
+        return np.array([row[0] for row in cursor], dtype="datetime64[D]")
+
+    def member_history(self, extractor, nickname, metric):
+        """서클원 한 명의 날짜별 값 (dates: datetime64[D], values: int64)
+
+        닉네임으로 가장 최근 기록의 서클원 키를 찾은 뒤 그 키로 조회하므로,
+        OCR이 다르게 읽은 날이나 UID가 있는 서클원이 닉네임을 바꾸기 전의 기록도 포함된다.
+        """
+        row = self.connection.execute(
+            "SELECT member FROM history WHERE extractor = ? AND nickname = ? ORDER BY date DESC LIMIT 1",
+            (extractor, nickname)).fetchone()
+        cursor = self.connection.execute(
+            f"SELECT date, value FROM history WHERE extractor = ? AND member = ? AND metric = ? "
+            f"AND run_id IN ({LATEST_RUNS}) ORDER BY date",
+            (extractor, row[0] if row else member_key(nickname), metric, extractor))
+        return self._date_values(cursor.fetchall())
+
+    def member_history_by_uid(self, extractor, uid, metric):
+        """UID로 찾은 날짜별 값 (닉네임을 바꾼 서클원도 이어서 조회)"""
+        cursor = self.connection.execute(
+            f"SELECT date, value FROM history WHERE extractor = ? AND uid = ? AND metric = ? "
+            f"AND run_id IN ({LATEST_RUNS}) ORDER BY date", (extractor, uid, metric, extractor))
+        return self._date_values(cursor.fetchall())
+
+    def _latest_run(self, extractor, date):
+        """그날의 마지막 추출 번호 (없으면 None)"""
+        row = self.connection.execute("SELECT MAX(id) FROM runs WHERE extractor = ? AND date = ?",
+                                      (extractor, str(date))).fetchone()
+        return row[0]
+
+    def on_date(self, extractor, date, metric):
+        """한 날짜의 전체 서클원 값 (nicknames: object, values: int64), 날짜는 'YYYY-MM-DD' 또는 datetime64"""
+        cursor = self.connection.execute(
+            "SELECT nickname, value FROM history WHERE run_id = ? AND metric = ? ORDER BY nickname",
+            (self._latest_run(extractor, date), metric))
+        return self._nickname_values(cursor.fetchall())
+
+    def compare(self, extractor, metric, date, previous_date):
+        """두 날짜에 모두 기록된 서클원의 값 (nicknames: 현재 명단 닉네임, values, previous_values), 주간 비교용"""
+        cursor = self.connection.execute(
+            "SELECT current.nickname, current.value, previous.value "
+            "FROM history AS current JOIN history AS previous "
+            "ON previous.run_id = ? AND previous.metric = current.metric AND previous.member = current.member "
+            "WHERE current.run_id = ? AND current.metric = ? ORDER BY current.nickname",
+            (self._latest_run(extractor, previous_date), self._latest_run(extractor, date), metric))
+        rows = cursor.fetchall()
+        nicknames = np.array([row[0] for row in rows], dtype=object)
+        values = np.array([row[1] for row in rows], dtype=np.int64)
+        previous_values = np.array([row[2] for row in rows], dtype=np.int64)
+        return nicknames, values, previous_values
+
+    @staticmethod
+    def _date_values(rows):
+        dates = np.array([row[0] for row in rows], dtype="datetime64[D]")
+        values = np.array([row[1] for row in rows], dtype=np.int64)
+        return dates, values
+
+    @staticmethod
+    def _nickname_values(rows):
+        nicknames = np.array([row[0] for row in rows], dtype=object)
+        values = np.array([row[1] for row in rows], dtype=np.int64)
+        return nicknames, values
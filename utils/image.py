@@ -3,6 +3,9 @@ import numpy as np
 
 
 def binarize_image(image):
+    if image.ndim == 2:
+        return image  # 이미 grayscale로 캡쳐된 프레임
+
     gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     # _, binary_image = cv2.threshold(gray_image, 175, 255, cv2.THRESH_BINARY)
     return gray_image
@@ -21,6 +24,42 @@ def merge_images(first_screenshot, second_screenshot, location):
     return np.vstack((first_part, second_screenshot))
 
 
+def find_row_safe_cut(image, start, end):
+    """start~end 구간에서 글자를 가로지르지 않는(가로 변화가 가장 적은) 행의 y 좌표를 반환
+
+    최소값이 여러 개면 가장 아래 행을 선택하고, 구간이 비어 있으면 이미지 안으로 맞춘 start를 반환한다.
+    """
+    start, end = max(0, start), min(end, image.shape[0])
+    if end <= start:
+        return min(start, image.shape[0])
+
+    region = image[start:end].astype(np.int16)
+    activity = np.abs(np.diff(region, axis=1)).sum(axis=1)
+    return start + len(activity) - 1 - int(np.argmin(activity[::-1]))
+
+
+def frame_fingerprint(image, band_ratio=0.25, scale=0.25):
+    """프레임 하단 띠를 축소한 지문
+
+    스크롤 후 목록이 움직였는지 빠르게 판단하는 용도로 is_same_fingerprint로 비교한다.
+    """
+    gray_image = binarize_image(image)
+    band = gray_image[gray_image.shape[0] - max(1, int(gray_image.shape[0] * band_ratio)):]
+    return cv2.resize(band, (0, 0), fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+
+def is_same_fingerprint(fingerprint1, fingerprint2, pixel_tolerance=24, max_changed_ratio=0.001):
+    """두 지문에서 크게 바뀐 픽셀의 비율이 max_changed_ratio 이하면 같은 화면으로 판단
+
+    목록 행은 모양이 비슷하므로 평균 차이가 아니라 글자처럼 국소적으로 바뀐 픽셀을 센다.
+    """
+    if fingerprint1.shape != fingerprint2.shape:
+        return False
+
+    changed = cv2.absdiff(fingerprint1, fingerprint2) > pixel_tolerance
+    return changed.mean() <= max_changed_ratio
+
+
 def save_image(image, path):
     """이미지를 파일로 저장"""
     cv2.imwrite(path, image)
@@ -0,0 +1,114 @@
+from abc import ABC, abstractmethod
+
+import cv2
+import numpy as np
+
+
+class TemplateMatcher(ABC):
+    """이미지 안에서 템플릿 위치를 찾는 엔진의 인터페이스
+
+    호출 결과는 image.compare_images와 같은 (유사도, (x, y)) 형식이다.
+    """
+
+    @abstractmethod
+    def match(self, image, template):
+        pass
+
+    def __call__(self, image, template):
+        return self.match(image, template)
+
+
+def normalized_correlation(image, template, x, y):
+    """(x, y) 위치에서 TM_CCOEFF_NORMED와 같은 방식으로 계산한 유사도"""
+    height, width = template.shape[:2]
+    region = image[y:y + height, x:x + width].astype(np.float32)
+    template = template.astype(np.float32)
+
+    region = region - region.mean()
+    template = template - template.mean()
+    denominator = np.sqrt((region * region).sum() * (template * template).sum())
+    return float((region * template).sum() / denominator) if denominator > 0 else 0.0
+
+
+class FullMatcher(TemplateMatcher):
+    """원본 해상도 전체에 cv2.matchTemplate(TM_CCOEFF_NORMED)를 적용하는 기본 엔진"""
+
+    def match(self, image, template):
+        result = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        return max_val, max_loc
+
+
+class PyramidMatcher(TemplateMatcher):
+    """축소 이미지에서 대략적인 위치를 찾고 원본 해상도의 좁은 영역에서 보정하는 엔진"""
+
+    def __init__(self, scale=0.25, refine_margin=None):
+        self.scale = scale
+        self.refine_margin = refine_margin if refine_margin else int(round(2 / scale))
+
+    def match(self, image, template):
+        small_image = cv2.resize(image, (0, 0), fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+        small_template = cv2.resize(template, (0, 0), fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+        if min(small_template.shape[:2]) < 4:
+            return FullMatcher().match(image, template)
+
+        result = cv2.matchTemplate(small_image, small_template, cv2.TM_CCOEFF_NORMED)
+        _, _, _, (coarse_x, coarse_y) = cv2.minMaxLoc(result)
+
+        # 원본 해상도에서 주변 refine_margin 픽셀만 다시 탐색
+        height, width = template.shape[:2]
+        left = max(0, int(coarse_x / self.scale) - self.refine_margin)
+        top = max(0, int(coarse_y / self.scale) - self.refine_margin)
+        right = min(image.shape[1], int(coarse_x / self.scale) + width + self.refine_margin)
+        bottom = min(image.shape[0], int(coarse_y / self.scale) + height + self.refine_margin)
+
+        result = cv2.matchTemplate(image[top:bottom, left:right], template, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, (x, y) = cv2.minMaxLoc(result)
+        return max_val, (left + x, top + y)
+
+
+class PhaseCorrelationMatcher(TemplateMatcher):
+    """FFT 위상 상관으로 세로 이동량만 추정하는 엔진 (템플릿과 이미지의 너비가 같아야 함)"""
+
+    def __init__(self, column_scale=0.125, candidates=5):
+        # 세로 이동량만 구하므로 가로 해상도는 줄여서 FFT 열 수를 줄임
+        self.column_scale = column_scale
+        self.candidates = candidates
+
+    def _shrink_columns(self, image):
+        width = max(1, int(image.shape[1] * self.column_scale))
+        return cv2.resize(image, (width, image.shape[0]), interpolation=cv2.INTER_AREA).astype(np.float32)
+
+    def match(self, image, template):
+        if image.shape[1] != template.shape[1]:
+            return FullMatcher().match(image, template)
+
+        image_height, template_height = image.shape[0], template.shape[0]
+        size = cv2.getOptimalDFTSize(image_height + template_height)
+
+        small_image = self._shrink_columns(image)
+        small_template = self._shrink_columns(template)
+        image_spectrum = np.fft.rfft(small_image - small_image.mean(), n=size, axis=0)
+        template_spectrum = np.fft.rfft(small_template - small_template.mean(), n=size, axis=0)
+
+        # 열별 교차 스펙트럼을 합산한 뒤 크기로 정규화 (세로 방향 위상 상관)
+        cross_power = (image_spectrum * np.conj(template_spectrum)).sum(axis=1)
+        cross_power /= np.abs(cross_power) + 1e-9
+        correlation = np.fft.irfft(cross_power, n=size)
+
+        # 반복되는 목록 행 때문에 생기는 비슷한 봉우리는 원본 해상도 유사도로 다시 비교
+        correlation = correlation[:image_height - template_height + 1]
+        candidates = np.argpartition(correlation, -min(self.candidates, len(correlation)))[-self.candidates:]
+        return max((normalized_correlation(image, template, 0, int(y)), (0, int(y))) for y in candidates)
+
+
+MATCHERS = {
+    "full": FullMatcher,
+    "pyramid": PyramidMatcher,
+    "phase": PhaseCorrelationMatcher,
+}
+
+
+def create_matcher(name):
+    """설정값으로 매칭 엔진 생성 (알 수 없는 이름이면 기본 엔진)"""
+    return MATCHERS.get(name, FullMatcher)()
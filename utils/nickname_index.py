@@ -0,0 +1,180 @@
+import json
+import os
+import unicodedata
+
+# OCR이 자주 헷갈리는 글자를 같은 글자로 취급 (한글은 자모로 나눈 뒤 비교하므로 중성 자모 기준)
+CONFUSABLES = str.maketrans({
+    "1": "l", "I": "l", "i": "l", "|": "l", "!": "l",
+    "0": "o", "O": "o",
+    "ᅤ": "ᅨ",  # ㅒ -> ㅖ
+    "ᅢ": "ᅦ",  # ㅐ -> ㅔ
+    "ᅫ": "ᅰ",  # ㅙ -> ㅞ
+    "ᅬ": "ᅰ",  # ㅚ -> ㅞ
+})
+
+# 닉네임 길이(자모 기준) 대비 허용하는 편집 거리 비율과 최대 편집 거리
+DISTANCE_RATIO = 1 / 3
+DEFAULT_MAX_DISTANCE = 2
+
+
+def normalize_nickname(text):
+    """NFC 정규화, 앞뒤 공백 제거"""
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def nickname_key(text):
+    """비교용 키: 공백 제거, 한글은 자모로 분해, 헷갈리는 글자 통일, 대소문자 무시"""
+    text = "".join(normalize_nickname(text).split())
+    return unicodedata.normalize("NFD", text).translate(CONFUSABLES).casefold()
+
+
+def edit_distance(a, b, limit=None):
+    """레벤슈타인 거리, limit을 넘는 것이 확실하면 limit + 1"""
+    if limit is not None and abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class GramIndex:
+    """q-gram 역색인: 편집 거리 d 이내의 키는 질의 키의 q-gram 중 (개수 - q*d)개 이상을 공유하므로,
+    공유 q-gram 수와 길이로 후보를 먼저 거른 뒤 후보만 편집 거리를 계산한다.
+    """
+
+    def __init__(self, gram_size=2):
+        self.gram_size = gram_size
+        self.keys = []
+        self._postings = {}  # q-gram -> [키 번호]
+        self._by_length = {}  # 키 길이 -> [키 번호]
+        self.verified = 0  # 지금까지 편집 거리를 계산한 키 수 (통계용)
+
+    def grams(self, key):
+        padded = f"^{key}$"
+        return {padded[i:i + self.gram_size] for i in range(max(len(padded) - self.gram_size + 1, 1))}
+
+    def add(self, key):
+        key_id = len(self.keys)
+        self.keys.append(key)
+        for gram in self.grams(key):
+            self._postings.setdefault(gram, []).append(key_id)
+        self._by_length.setdefault(len(key), []).append(key_id)
+
+    def _candidates(self, key, max_distance):
+        query_grams = self.grams(key)
+        required = len(query_grams) - self.gram_size * max_distance
+        if required <= 0:
+            # 공유 q-gram으로 거를 수 없는 짧은 키는 길이로만 거름
+            return [key_id for length in range(len(key) - max_distance, len(key) + max_distance + 1)
+                    for key_id in self._by_length.get(length, ())]
+
+        counts = {}
+        for gram in query_grams:
+            for key_id in self._postings.get(gram, ()):
+                counts[key_id] = counts.get(key_id, 0) + 1
+        return [key_id for key_id, count in counts.items()
+                if count >= required and abs(len(self.keys[key_id]) - len(key)) <= max_distance]
+
+    def search(self, key, max_distance):
+        """[(거리, 키)] 거리 max_distance 이내의 키 목록"""
+        candidates = self._candidates(key, max_distance)
+        self.verified += len(candidates)
+        matches = []
+        for key_id in candidates:
+            distance = edit_distance(key, self.keys[key_id], max_distance)
+            if distance <= max_distance:
+                matches.append((distance, self.keys[key_id]))
+        return matches
+
+
+class NicknameIndex:
+    """명단 닉네임 색인: 정확히 일치 -> 비교용 키 일치 -> q-gram 색인으로 편집 거리 이내의 가장 가까운 닉네임"""
+
+    def __init__(self, nicknames=(), max_distance=DEFAULT_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._nicknames = set()
+        self._by_key = {}  # 비교용 키 -> [닉네임]
+        self._grams = GramIndex()
+        for nickname in nicknames:
+            self.add(nickname)
+
+    def __contains__(self, nickname):
+        return nickname in self._nicknames
+
+    def __len__(self):
+        return len(self._nicknames)
+
+    def add(self, nickname):
+        if not nickname or nickname in self._nicknames:
+            return
+
+        self._nicknames.add(nickname)
+        key = nickname_key(nickname)
+        if key not in self._by_key:
+            self._grams.add(key)
+        self._by_key.setdefault(key, []).append(nickname)
+
+    def budget(self, key):
+        """키 길이에 따른 허용 편집 거리 (짧은 닉네임은 엄격하게)"""
+        return min(self.max_distance, int(len(key) * DISTANCE_RATIO))
+
+    def search(self, text):
+        """(닉네임, 편집 거리), 가장 가까운 닉네임이 하나로 정해지지 않으면 None"""
+        if text in self._nicknames:
+            return text, 0
+
+        key = nickname_key(text)
+        candidates = self._by_key.get(key)
+        if candidates:
+            return (candidates[0], 0) if len(candidates) == 1 else None
+
+        matches = self._grams.search(key, self.budget(key))
+        if not matches:
+            return None
+
+        best = min(distance for distance, _ in matches)
+        nicknames = [nickname for distance, match_key in matches if distance == best
+                     for nickname in self._by_key[match_key]]
+        return (nicknames[0], best) if len(nicknames) == 1 else None
+
+
+class AliasTable:
+    """OCR로 읽은 닉네임 -> 명단 닉네임 대응표 (JSON 파일에 저장되어 다음 실행에서도 바로 찾음)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.aliases = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.aliases = json.load(f)
+        except FileNotFoundError:
+            self.aliases = {}
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ 닉네임 대응표를 읽지 못했습니다: {e}")
+            self.aliases = {}
+
+    def save(self):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.aliases, f, ensure_ascii=False, indent=4)
+        os.replace(temp_path, self.path)
+
+    def get(self, variant):
+        return self.aliases.get(variant)
+
+    def add(self, variant, nickname):
+        if self.aliases.get(variant) == nickname:
+            return
+
+        self.aliases[variant] = nickname
+        self.save()
@@ -0,0 +1,192 @@
+import hashlib
+import json
+import os
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from utils import clova_ocr
+from utils.clova_ocr import OcrField, PRIORITY_NORMAL
+from utils.ocr_payload import PayloadOptions
+
+# 녹화한 OCR 응답을 저장하는 폴더
+RESPONSE_FOLDER_NAME = "ocr_responses"
+
+
+class OcrBackendError(Exception):
+    """OCR 백엔드가 이미지를 인식하지 못한 경우 (녹화된 응답이 없는 경우 등)"""
+    pass
+
+
+class OcrBackend(ABC):
+    """이미지를 받아 OcrField(글자, 좌표, 신뢰도) 목록을 반환하는 OCR 엔진 인터페이스"""
+
+    @abstractmethod
+    def recognize(self, image, priority=PRIORITY_NORMAL):
+        pass
+
+    def prewarm(self):
+        """캡쳐하는 동안 미리 해 둘 준비 작업 (연결 등)"""
+        pass
+
+    def summary(self):
+        """실행 후 출력할 호출 통계, 없으면 None"""
+        return None
+
+
+def image_hash(image):
+    """이미지 크기와 픽셀 내용으로 만든 키"""
+    image = np.ascontiguousarray(image)
+    digest = hashlib.sha1(str(image.shape).encode("utf-8"))
+    digest.update(image.data)
+    return digest.hexdigest()
+
+
+def fields_to_json(fields):
+    return [{"text": field.text, "left": field.left, "top": field.top, "right": field.right,
+             "bottom": field.bottom, "confidence": field.confidence, "line_break": field.line_break}
+            for field in fields]
+
+
+def fields_from_json(data):
+    return [OcrField(**field) for field in data]
+
+
+class ClovaBackend(OcrBackend):
+    """Clova OCR API 백엔드 (설정한 높이보다 긴 이미지는 겹치는 타일로 나눠 요청)"""
+
+    def __init__(self, api_url, secret_key, options: PayloadOptions = None, tile_height=None,
+                 tile_overlap=clova_ocr.DEFAULT_TILE_OVERLAP, max_workers=clova_ocr.DEFAULT_CONCURRENCY,
+                 batch=False, scheduler: clova_ocr.RequestScheduler = None):
+        self.api_url = api_url
+        self.secret_key = secret_key
+        self.options = options
+        self.tile_height = tile_height
+        self.tile_overlap = tile_overlap
+        self.max_workers = max_workers
+        self.batch = batch
+        self.client = clova_ocr.get_client(api_url, secret_key, scheduler)
+
+    @classmethod
+    def from_config(cls, config, api_url, secret_key):
+        from config import ConfigKeys
+
+        scheduler = clova_ocr.RequestScheduler(
+            rate=config.get(ConfigKeys.OCR_RATE_LIMIT),
+            burst=config.get(ConfigKeys.OCR_RATE_BURST),
+            max_in_flight=config.get(ConfigKeys.OCR_MAX_IN_FLIGHT),
+            usage=clova_ocr.OcrUsage(monthly_limit=config.get(ConfigKeys.OCR_MONTHLY_LIMIT)))
+        tile_height = config.get(ConfigKeys.OCR_TILE_HEIGHT)
+        if tile_height and tile_height < clova_ocr.MIN_TILE_HEIGHT:
+            print(f"⚠️ {ConfigKeys.OCR_TILE_HEIGHT}({tile_height})가 너무 작아 {clova_ocr.MIN_TILE_HEIGHT}(으)로 처리합니다.")
+            tile_height = clova_ocr.MIN_TILE_HEIGHT
+
+        return cls(api_url, secret_key,
+                   options=PayloadOptions.from_config(config),
+                   tile_height=tile_height,
+                   tile_overlap=config.get(ConfigKeys.OCR_TILE_OVERLAP),
+                   max_workers=config.get(ConfigKeys.OCR_TILE_CONCURRENCY),
+                   batch=config.get(ConfigKeys.OCR_TILE_BATCH),
+                   scheduler=scheduler)
+
+    def recognize(self, image, priority=PRIORITY_NORMAL):
+        return clova_ocr.call_clova_ocr_fields(image, self.api_url, self.secret_key, self.options,
+                                               tile_height=self.tile_height, tile_overlap=self.tile_overlap,
+                                               max_workers=self.max_workers, batch=self.batch, priority=priority)
+
+    def prewarm(self):
+        self.client.prewarm()
+
+    def summary(self):
+        return self.client.scheduler.stats.summary()
+
+
+class ReplayBackend(OcrBackend):
+    """이미지 내용 해시별로 녹화된 응답(JSON)을 돌려주는 백엔드
+
+    backend가 주어지면 녹화가 없는 이미지는 backend로 인식한 뒤 녹화하므로,
+    같은 캡쳐를 다시 처리할 때는 API를 호출하지 않는다.
+    """
+
+    def __init__(self, directory, backend: OcrBackend = None):
+        self.directory = directory
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def recognize(self, image, priority=PRIORITY_NORMAL):
+        key = image_hash(image)
+        path = self._path(key)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                fields = fields_from_json(json.load(f)["fields"])
+            self.hits += 1
+            return fields
+
+        if self.backend is None:
+            raise OcrBackendError(f"녹화된 OCR 응답이 없습니다: {key}")
+
+        fields = self.backend.recognize(image, priority)
+        self.misses += 1
+        self.save(key, fields)
+        return fields
+
+    def save(self, key, fields):
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory, exist_ok=True)
+
+        path = self._path(key)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"fields": fields_to_json(fields)}, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def prewarm(self):
+        if self.backend:
+            self.backend.prewarm()
+
+    def summary(self):
+        summary = f"녹화된 OCR 응답 사용 {self.hits}회, 새로 녹화 {self.misses}회"
+        if self.backend and self.misses:
+            summary += f" ({self.backend.summary()})"
+        return summary
+
+
+class SyntheticBackend(OcrBackend):
+    """생성한 목록 이미지의 정답 필드를 돌려주는 백엔드 (벤치마크용)
+
+    요청 이미지는 canvas의 일부를 세로로 자르고 왼쪽 일부(프로필 영역)를 잘라낸 이미지여야 한다.
+    요청 이미지의 행을 canvas의 행과 바이트 단위로 대조해 위치를 찾고, 그 안에 중심이 있는 필드를 반환한다.
+    """
+
+    def __init__(self, canvas, fields):
+        self.canvas = canvas
+        self.fields = fields
+        self._row_index = {}  # 왼쪽에서 잘라낸 폭별 {행 해시: [y]}
+
+    def _locate(self, image):
+        """요청 이미지의 canvas 기준 (x, y)"""
+        x = self.canvas.shape[1] - image.shape[1]
+        rows = self._row_index.get(x)
+        if rows is None:
+            rows = self._row_index[x] = {}
+            for y, row in enumerate(self.canvas[:, x:]):
+                rows.setdefault(row.tobytes(), []).append(y)
+
+        # 배경처럼 여러 번 나오는 행은 건너뛰고, canvas에 한 번만 나오는 행으로 위치를 정함
+        for offset, row in enumerate(image):
+            candidates = rows.get(row.tobytes(), [])
+            if len(candidates) == 1:
+                return x, candidates[0] - offset
+        raise OcrBackendError("생성한 목록 이미지에서 요청 이미지의 위치를 찾지 못했습니다.")
+
+    def recognize(self, image, priority=PRIORITY_NORMAL):
+        x, y = self._locate(image)
+        height, width = image.shape[:2]
+        return [OcrField(field.text, field.left - x, field.top - y, field.right - x, field.bottom - y,
+                         field.confidence, field.line_break)
+                for field in self.fields
+                if y <= field.center_y < y + height and x <= field.center_x < x + width]
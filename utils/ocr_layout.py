@@ -0,0 +1,139 @@
+import numpy as np
+
+# 같은 글자 줄로 묶을 중심 y 차이 (글자 높이 대비)
+LINE_TOLERANCE_RATIO = 0.5
+
+# 줄 간격을 두 그룹(같은 항목 안 / 항목 사이)으로 나눌 때, 두 그룹 평균의 최소 비율
+RECORD_GAP_CONTRAST = 1.5
+
+
+def _split_points(values, threshold):
+    """정렬된 values에서 간격이 threshold보다 큰 위치마다 새 그룹 번호를 매김"""
+    return np.concatenate(([0], np.cumsum(np.diff(values) > threshold)))
+
+
+def _record_gap_threshold(gaps):
+    """줄 간격을 Otsu 방식으로 두 그룹으로 나누는 기준값, 두 그룹이 구분되지 않으면 None"""
+    if len(gaps) < 2:
+        return None
+
+    gaps = np.sort(gaps)
+    counts = np.arange(1, len(gaps))
+    cumulative = np.cumsum(gaps)[:-1]
+    low_means = cumulative / counts
+    high_means = (gaps.sum() - cumulative) / (len(gaps) - counts)
+    between_variance = counts * (len(gaps) - counts) * (high_means - low_means) ** 2
+
+    best = int(np.argmax(between_variance))
+    if high_means[best] < low_means[best] * RECORD_GAP_CONTRAST:
+        return None
+    return (gaps[best] + gaps[best + 1]) / 2
+
+
+def group_records(fields):
+    """필드를 글자 줄로 묶은 뒤 줄 간격으로 항목(레코드)을 나눔
+
+    반환값은 (레코드 번호 배열, 레코드 안의 상대 y 배열)이며 필드 순서와 같다.
+    """
+    centers_y = np.array([field.center_y for field in fields], dtype=np.float64)
+    heights = np.array([field.bottom - field.top for field in fields], dtype=np.float64)
+    line_tolerance = max(1.0, float(np.median(heights)) * LINE_TOLERANCE_RATIO)
+
+    # 중심 y로 정렬해서 가까운 필드끼리 한 줄로 묶음
+    order = np.argsort(centers_y, kind="stable")
+    line_ids = np.empty(len(fields), dtype=np.int64)
+    line_ids[order] = _split_points(centers_y[order], line_tolerance)
+
+    line_count = line_ids.max() + 1
+    line_centers = np.bincount(line_ids, weights=centers_y, minlength=line_count) / np.bincount(line_ids)
+
+    # 줄 간격이 두 종류로 뚜렷하게 나뉘면 큰 간격을 항목 경계로, 아니면 한 줄을 한 항목으로 봄
+    threshold = _record_gap_threshold(np.diff(line_centers))
+    if threshold is None:
+        line_record_ids = np.arange(line_count)
+    else:
+        line_record_ids = _split_points(line_centers, threshold)
+
+    record_ids = line_record_ids[line_ids]
+    record_tops = np.full(record_ids.max() + 1, np.inf)
+    np.minimum.at(record_tops, record_ids, line_centers[line_ids])
+    return record_ids, centers_y - record_tops[record_ids]
+
+
+def parse_layout(fields, ocr_headers, numeric_keys=()):
+    """Clova 필드의 좌표로 항목별 행을 만들어 [{header_key: 값}] 목록을 반환
+
+    필드 수가 헤더 수와 정확히 같은 항목들로 헤더별 위치(줄, x)를 학습한 뒤,
+    모든 필드를 가장 가까운 줄의 x 구간에 해당하는 헤더에 배정한다.
+    한 헤더에 배정된 필드가 여럿이면(글자가 나뉘어 인식된 경우) x 순서대로 이어 붙인다.
+    좌표가 없거나 학습할 항목이 없으면 None을 반환한다.
+    """
+    keys = [key for key, _ in ocr_headers]
+    if not fields or all(field.bottom <= field.top for field in fields):
+        return None
+
+    record_ids, relative_y = group_records(fields)
+    centers_x = np.array([field.center_x for field in fields], dtype=np.float64)
+
+    # 항목 안에서 읽는 순서(위 -> 아래, 왼쪽 -> 오른쪽)로 정렬
+    line_height = float(np.median([field.bottom - field.top for field in fields]))
+    relative_line = np.round(relative_y / max(line_height, 1.0))
+    order = np.lexsort((centers_x, relative_line, record_ids))
+
+    record_sizes = np.bincount(record_ids)
+    clean_records = np.flatnonzero(record_sizes == len(keys))
+    if len(clean_records) == 0:
+        return None
+
+    # 헤더별 기준 위치 학습: 정렬된 순서상 i번째 필드가 i번째 헤더
+    clean_order = order[np.isin(record_ids[order], clean_records)].reshape(-1, len(keys))
+    anchor_x = np.median(centers_x[clean_order], axis=0)
+    anchor_y = np.median(relative_y[clean_order], axis=0)
+
+    # 기준 y가 비슷한 헤더끼리 같은 줄로 묶고, 줄마다 x 구간 경계를 계산
+    anchor_lines = _split_points(np.sort(anchor_y), line_height * LINE_TOLERANCE_RATIO)
+    anchor_lines = anchor_lines[np.argsort(np.argsort(anchor_y, kind="stable"), kind="stable")]
+    line_y = np.array([anchor_y[anchor_lines == line].mean() for line in range(anchor_lines.max() + 1)])
+
+    field_lines = np.argmin(np.abs(relative_y[:, None] - line_y[None, :]), axis=1)
+    field_headers = np.empty(len(fields), dtype=np.int64)
+    for line in range(len(line_y)):
+        header_indices = np.flatnonzero(anchor_lines == line)
+        header_indices = header_indices[np.argsort(anchor_x[header_indices])]
+        boundaries = (anchor_x[header_indices][1:] + anchor_x[header_indices][:-1]) / 2
+
+        in_line = field_lines == line
+        field_headers[in_line] = header_indices[np.searchsorted(boundaries, centers_x[in_line])]
+
+    rows = []
+    for record_id in range(record_ids.max() + 1):
+        values = {}
+        for index in order[record_ids[order] == record_id]:
+            key = keys[field_headers[index]]
+            values[key] = values.get(key, "") + fields[index].text
+
+        if not values.get(keys[0]):
+            print(f"⚠️ {keys[0]} 값이 없는 항목을 제외합니다: {values}")
+            continue
+
+        rows.append(typed_row(values, keys, numeric_keys))
+
+    return rows
+
+
+def typed_row(values, keys, numeric_keys=()):
+    """{키: 문자열}을 헤더 순서의 행으로 변환 (숫자 키는 숫자만 남겨 int, 없는 값은 빈 문자열)"""
+    row = {}
+    for key in keys:
+        value = values.get(key)
+        if key in numeric_keys:
+            digits = "".join(char for char in value or "" if char.isdigit())
+            if not digits:
+                print(f"⚠️ {values.get(keys[0])}의 {key} 값을 숫자로 읽지 못해 0으로 처리합니다: {value!r}")
+            value = int(digits) if digits else 0
+        elif value is None:
+            value = ""
+        elif value.isdecimal():
+            value = int(value)
+        row[key] = value
+    return row
@@ -0,0 +1,126 @@
+import base64
+
+import cv2
+import numpy as np
+
+from utils import image as image_utils
+
+# 글자가 있는 행으로 볼 가로 변화량 (해당 행에서 밝기가 크게 바뀌는 픽셀 비율)
+TEXT_ROW_EDGE_THRESHOLD = 40
+TEXT_ROW_MIN_EDGE_RATIO = 0.01
+MIN_GLYPH_HEIGHT = 4
+
+
+class PayloadOptions:
+    """OCR 요청 이미지 인코딩 설정
+
+    format: "jpg" 또는 "png"
+    quality: JPEG 품질 (cv2 기본값 95)
+    png_compression: PNG 압축 수준 (0~9, 크기에는 영향 없이 인코딩 시간만 바뀜)
+    glyph_height: 글자 높이가 이 값(px)이 되도록 축소, 0이면 원본 크기
+    gray_levels: 밝기 단계 수로 양자화, 256이면 양자화하지 않음
+    blank_columns: 배경색으로 지울 가로 구간 [(시작 비율, 끝 비율)] (아바타, 아이콘 등)
+    """
+
+    def __init__(self, format="jpg", quality=95, png_compression=3, glyph_height=0, gray_levels=256,
+                 blank_columns=()):
+        self.format = format
+        self.quality = quality
+        self.png_compression = png_compression
+        self.glyph_height = glyph_height
+        self.gray_levels = gray_levels
+        self.blank_columns = [tuple(column) for column in blank_columns]
+
+    def __repr__(self):
+        parts = [self.format if self.format != "jpg" else f"jpg q{self.quality}"]
+        if self.glyph_height:
+            parts.append(f"glyph {self.glyph_height}px")
+        if self.gray_levels < 256:
+            parts.append(f"{self.gray_levels} levels")
+        if self.blank_columns:
+            parts.append(f"blank {len(self.blank_columns)}")
+        return ", ".join(parts)
+
+    @classmethod
+    def from_config(cls, config):
+        from config import ConfigKeys
+
+        return cls(format=config.get(ConfigKeys.OCR_FORMAT),
+                   quality=config.get(ConfigKeys.OCR_JPEG_QUALITY),
+                   glyph_height=config.get(ConfigKeys.OCR_GLYPH_HEIGHT),
+                   gray_levels=config.get(ConfigKeys.OCR_GRAY_LEVELS),
+                   blank_columns=config.get(ConfigKeys.OCR_BLANK_COLUMNS))
+
+
+def estimate_glyph_height(image):
+    """글자가 있는 행들이 연속된 구간 높이의 중앙값으로 글자 높이를 추정, 글자가 없으면 None"""
+    gray_image = image_utils.binarize_image(image)
+    edges = np.abs(np.diff(gray_image.astype(np.int16), axis=1)) > TEXT_ROW_EDGE_THRESHOLD
+    active = edges.mean(axis=1) > TEXT_ROW_MIN_EDGE_RATIO
+
+    # 활성 행 구간의 시작/끝 위치
+    changes = np.diff(np.concatenate(([0], active.view(np.int8), [0])))
+    runs = np.flatnonzero(changes == -1) - np.flatnonzero(changes == 1)
+    runs = runs[runs >= MIN_GLYPH_HEIGHT]
+    return int(np.median(runs)) if len(runs) else None
+
+
+def blank_columns(image, columns):
+    """가로 구간을 바로 왼쪽(구간이 왼쪽 끝이면 오른쪽) 열의 밝기로 채운 복사본"""
+    image = image.copy()
+    width = image.shape[1]
+    for start_ratio, end_ratio in columns:
+        left, right = int(width * start_ratio), min(width, int(width * end_ratio))
+        if left >= right:
+            continue
+
+        fill_column = left - 1 if left > 0 else min(right, width - 1)
+        image[:, left:right] = image[:, fill_column:fill_column + 1]
+    return image
+
+
+def quantize(image, levels):
+    """밝기를 levels 단계로 줄임 (각 단계의 가운데 값으로 매핑)"""
+    step = 256 / levels
+    table = (np.floor(np.arange(256) / step) * step + step / 2).clip(0, 255).astype(np.uint8)
+    return cv2.LUT(image, table)
+
+
+def prepare_image(image, options: PayloadOptions):
+    """설정에 따라 전송할 이미지를 만들고 (이미지, 축소 비율)을 반환"""
+    image = image_utils.binarize_image(image)
+
+    if options.blank_columns:
+        image = blank_columns(image, options.blank_columns)
+
+    scale = 1.0
+    if options.glyph_height:
+        glyph_height = estimate_glyph_height(image)
+        if glyph_height and glyph_height > options.glyph_height:
+            scale = options.glyph_height / glyph_height
+            image = cv2.resize(image, (0, 0), fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+    if options.gray_levels < 256:
+        image = quantize(image, options.gray_levels)
+
+    return image, scale
+
+
+def encode_image(image, options: PayloadOptions):
+    """이미지를 설정한 형식으로 인코딩한 바이트"""
+    if options.format == "png":
+        params = [cv2.IMWRITE_PNG_COMPRESSION, options.png_compression]
+    else:
+        params = [cv2.IMWRITE_JPEG_QUALITY, options.quality]
+
+    _, buffer = cv2.imencode(f".{options.format}", image, params)
+    return buffer.tobytes()
+
+
+def encode_payload(image, options: PayloadOptions):
+    """OCR 요청에 넣을 (base64 문자열, 축소 비율)을 반환
+
+    응답 좌표는 축소된 이미지 기준이므로 1 / 축소 비율을 곱해 원본 좌표로 되돌려야 한다.
+    """
+    prepared_image, scale = prepare_image(image, options)
+    return base64.b64encode(encode_image(prepared_image, options)).decode("utf-8"), scale
@@ -0,0 +1,31 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PipelinedOcr:
+    """스크롤 중 확정된 띠(band) 이미지를 백그라운드에서 OCR하고 세로 위치 순으로 결과를 합치는 클래스
+
+    recognize는 띠 이미지를 받아 OcrField 목록을 반환하는 함수다.
+    """
+
+    def __init__(self, recognize, max_workers=2):
+        self.recognize = recognize
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ocr")
+        self.futures = []
+
+    def submit(self, top, band_image):
+        """띠 이미지의 OCR을 예약"""
+        print(f"📤 OCR 요청 (y={top}, 높이={band_image.shape[0]})")
+        self.futures.append((top, self.executor.submit(self.recognize, band_image)))
+
+    def results(self):
+        """모든 띠의 OCR이 끝나길 기다린 뒤 병합 이미지 좌표로 옮겨 y 좌표 순서대로 합친 필드 목록을 반환"""
+        try:
+            merged = []
+            for top, future in sorted(self.futures, key=lambda item: item[0]):
+                merged.extend(field.offset(top) for field in future.result())
+            return merged
+        finally:
+            self.close()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
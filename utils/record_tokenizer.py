@@ -0,0 +1,161 @@
+TEXT = "text"
+ENUM = "enum"
+PREFIX = "prefix"
+NUMBER = "number"
+MARKER = "marker"
+
+# 행 신뢰도 감점 (곱함)
+ABSORB_PENALTY = 0.9  # 나뉘어 인식된 토큰을 이어 붙인 경우
+COERCE_PENALTY = 0.8  # 숫자 필드에서 숫자가 아닌 글자를 버린 경우
+MISMATCH_PENALTY = 0.6  # 규칙에 맞지 않는 토큰을 그대로 받은 경우
+MISSING_PENALTY = 0.5  # 필드가 인식되지 않은 경우
+
+
+class FieldRule:
+    """레코드 한 필드의 토큰 규칙
+
+    kind별 의미:
+    - TEXT: 아무 토큰 (닉네임, 상태 등)
+    - ENUM: values 중 하나 (직위)
+    - PREFIX: pattern으로 시작 (Lv)
+    - NUMBER: 숫자 (쉼표 허용), maximum이 있으면 그보다 큰 숫자는 이 필드가 아님
+    - MARKER: pattern을 포함 (단일 전투, 누적 점수 같은 제목)
+    """
+
+    def __init__(self, key, kind=TEXT, pattern=None, values=(), maximum=None):
+        self.key = key
+        self.kind = kind
+        self.pattern = pattern
+        self.values = tuple(values)
+        self.maximum = maximum
+
+    def __repr__(self):
+        return f"FieldRule({self.key!r}, {self.kind!r})"
+
+    @property
+    def strict(self):
+        """토큰 모양으로 이 필드인지 판단할 수 있는 규칙인지 (TEXT는 판단 불가)"""
+        return self.kind != TEXT
+
+    def matches(self, value):
+        """완성된 값이 규칙에 맞는지"""
+        if self.kind == ENUM:
+            return value in self.values
+        if self.kind == PREFIX:
+            return value.startswith(self.pattern)
+        if self.kind == NUMBER:
+            return value.replace(",", "").isdigit()
+        if self.kind == MARKER:
+            return self.pattern in value
+        return True
+
+    def starts(self, token):
+        """토큰이 이 필드의 시작(또는 전체)일 수 있는지"""
+        if self.kind == ENUM:
+            return any(value.startswith(token) for value in self.values)
+        if self.kind == NUMBER:
+            # "1,234"나 "123점"처럼 2/3 이상이 숫자인 토큰 ("1시간 전", "member_01"은 제외)
+            digits = "".join(char for char in token if char.isdigit())
+            if not digits or len(digits) * 3 < len(token.replace(",", "")) * 2:
+                return False
+            return self.maximum is None or int(digits) <= self.maximum
+        if self.kind == MARKER:
+            return self.pattern in token or self.pattern.startswith(token)
+        return self.matches(token)
+
+    def continues(self, value, token):
+        """다음 토큰이 확실히 이 필드의 나머지인지 ("부서" + "클장", "Lv." + "45")"""
+        if self.kind == ENUM:
+            return value not in self.values and any(option.startswith(value + token) for option in self.values)
+        if self.kind == PREFIX:
+            return not any(char.isdigit() for char in value) and token.isdigit()
+        return False
+
+    def absorbs(self, value, token):
+        """다음 필드가 시작되지 않았을 때 다음 토큰을 이어 붙일 수 있는지"""
+        if self.kind == ENUM:
+            return self.continues(value, token)
+        return self.kind != NUMBER
+
+    def normalize(self, value):
+        """(정리한 값, 감점)"""
+        if self.kind == NUMBER and not self.matches(value):
+            digits = "".join(char for char in value if char.isdigit())
+            return digits, COERCE_PENALTY if digits else MISMATCH_PENALTY
+        if self.kind == NUMBER:
+            return value.replace(",", ""), 1.0
+        return value, 1.0 if self.matches(value) else MISMATCH_PENALTY
+
+
+class RecordTokenizer:
+    """필드 규칙(grammar)에 따라 OCR 토큰 목록을 한 번 훑어 레코드로 나누는 클래스
+
+    토큰마다 현재 필드와 다음 필드의 규칙을 비교하여
+    - 다음 필드가 시작되기 전까지 나뉘어 인식된 토큰은 현재 필드에 이어 붙이고
+    - 현재 필드 대신 다음 필드가 나오면 현재 필드를 빈 값으로 둔다.
+    토큰을 지우거나 끼워 넣지 않으므로 전체 O(n)이며, 한 레코드의 보정이 다음 레코드의 위치를 밀지 않는다.
+    """
+
+    def __init__(self, grammar: list[FieldRule]):
+        self.grammar = grammar
+
+    def _rule_after(self, index, step=1):
+        """index 필드 다음 step번째 규칙 (레코드 끝을 넘으면 다음 레코드의 규칙)"""
+        return self.grammar[(index + step) % len(self.grammar)]
+
+    def _is_missing(self, index, tokens, position):
+        """index 필드가 빠지고 tokens[position]이 다음 필드(또는 그 다음 필드)부터 시작하는지"""
+        rule, next_rule, after_next = self.grammar[index], self._rule_after(index), self._rule_after(index, 2)
+        token = tokens[position]
+        if not rule.strict or rule.starts(token):
+            return False
+        if any(later.strict and later.starts(token) for later in (next_rule, after_next)):
+            return True
+
+        # 다음 필드가 아무 토큰이나 받는 필드면, 그 다음 토큰이 다음다음 필드로 시작하는지로 판단
+        return (not next_rule.strict and after_next.strict and position + 1 < len(tokens)
+                and after_next.starts(tokens[position + 1]))
+
+    def _is_split(self, index, value, tokens, position):
+        """tokens[position]이 index 필드의 값(value)에서 나뉘어 인식된 나머지인지"""
+        rule, next_rule, after_next = self.grammar[index], self._rule_after(index), self._rule_after(index, 2)
+        token = tokens[position]
+        if rule.continues(value, token):
+            return True
+        if not next_rule.strict or next_rule.starts(token) or not rule.absorbs(value, token):
+            return False
+
+        # 그 다음 필드와 완전히 일치하는 토큰이면 다음 필드가 빠진 것으로 보고 멈춤
+        # (단, 바로 뒤 토큰이 다음 필드로 시작하면 "member_01" + "2"처럼 나뉜 것)
+        if after_next.strict and after_next.matches(token):
+            return position + 1 < len(tokens) and next_rule.starts(tokens[position + 1])
+        return True
+
+    def tokenize(self, tokens):
+        """[(레코드 {키: 문자열}, 신뢰도 0~1)] 목록을 반환"""
+        records = []
+        position = 0
+        while position < len(tokens):
+            values = {}
+            confidence = 1.0
+            for index, rule in enumerate(self.grammar):
+                # 이 필드가 빠지고 다음 필드가 먼저 나온 경우
+                if position >= len(tokens) or self._is_missing(index, tokens, position):
+                    values[rule.key] = ""
+                    confidence *= MISSING_PENALTY
+                    continue
+
+                value = tokens[position]
+                position += 1
+
+                # 다음 필드가 시작되기 전까지 나뉘어 인식된 토큰을 이어 붙임
+                while position < len(tokens) and self._is_split(index, value, tokens, position):
+                    value += tokens[position]
+                    position += 1
+                    confidence *= ABSORB_PENALTY
+
+                values[rule.key], penalty = rule.normalize(value)
+                confidence *= penalty
+
+            records.append((values, confidence))
+        return records
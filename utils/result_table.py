@@ -0,0 +1,237 @@
+import sys
+
+import numpy as np
+
+# .npz 안에서 글자 열을 저장하는 배열 이름의 접미사
+CODES_SUFFIX = "__codes"
+CATEGORIES_SUFFIX = "__categories"
+MISSING_SUFFIX = "__missing"
+
+
+class NumberColumn:
+    """숫자 열: int64/float64 배열과 값이 없는 행의 마스크"""
+
+    def __init__(self, values, missing=None):
+        self.values = np.asarray(values)
+        self.missing = missing if missing is not None and missing.any() else None
+
+    def __len__(self):
+        return len(self.values)
+
+    @classmethod
+    def from_values(cls, values):
+        """int/None 목록으로 생성 (None은 0으로 두고 마스크에 표시)"""
+        missing = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+        filled = [0 if value is None else value for value in values]
+        dtype = np.float64 if any(isinstance(value, float) for value in filled) else np.int64
+        return cls(np.array(filled, dtype=dtype), missing)
+
+    def array(self):
+        if self.missing is None:
+            return self.values
+        return np.where(self.missing, None, self.values.astype(object))
+
+    def filled(self, fill=0):
+        """값이 없는 행을 fill로 채운 숫자 배열 (열 전체 계산용)"""
+        if self.missing is None:
+            return self.values
+        return np.where(self.missing, fill, self.values)
+
+    def tolist(self):
+        values = self.values.tolist()
+        if self.missing is not None:
+            for index in np.flatnonzero(self.missing):
+                values[index] = None
+        return values
+
+
+class TextColumn:
+    """글자 열: 중복 없는 글자 목록(intern)과 행별 번호 (-1은 값 없음)"""
+
+    def __init__(self, codes, categories):
+        self.codes = np.asarray(codes, dtype=np.int32)
+        self.categories = [sys.intern(category) for category in categories]
+
+    def __len__(self):
+        return len(self.codes)
+
+    @classmethod
+    def from_values(cls, values):
+        index = {}
+        codes = np.empty(len(values), dtype=np.int32)
+        for row, value in enumerate(values):
+            if value is None:
+                codes[row] = -1
+                continue
+            value = value if isinstance(value, str) else str(value)
+            code = index.get(value)
+            if code is None:
+                code = index[value] = len(index)
+            codes[row] = code
+        return cls(codes, list(index))
+
+    def _lookup(self):
+        """번호 -> 글자 배열 (마지막 칸은 값 없음)"""
+        lookup = np.empty(len(self.categories) + 1, dtype=object)
+        lookup[:-1] = self.categories
+        return lookup
+
+    def array(self):
+        return self._lookup()[self.codes]
+
+    def tolist(self):
+        return self.array().tolist()
+
+    def expand(self, values):
+        """중복 없는 글자별 값 목록(categories 순서)을 행별로 펼친 object 배열 (값이 없는 행은 None)"""
+        lookup = np.empty(len(self.categories) + 1, dtype=object)
+        lookup[:-1] = values
+        return lookup[self.codes]
+
+    def map(self, function):
+        """중복 없는 글자마다 function을 한 번씩 호출한 결과를 행별로 펼친 object 배열"""
+        return self.expand([function(category) for category in self.categories])
+
+
+def _column_from_values(values):
+    """배열/목록의 자료형에 따라 숫자 열 또는 글자 열 생성"""
+    if isinstance(values, (NumberColumn, TextColumn)):
+        return values
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iub":
+        return NumberColumn(values.astype(np.int64))
+    if isinstance(values, np.ndarray) and values.dtype.kind == "f":
+        return NumberColumn(values)
+
+    values = list(values)
+    present = [value for value in values if value is not None]
+    if present and all(isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+                       for value in present):
+        return NumberColumn.from_values([None if value is None else value.item() if hasattr(value, "item")
+                                         else value for value in values])
+    return TextColumn.from_values(values)
+
+
+class ResultRow:
+    """ResultTable의 한 행 (행마다 딕셔너리를 만들지 않고 열 목록에서 바로 읽음)"""
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, key):
+        return self.table.values(key)[self.index]
+
+    def get(self, key, default=None):
+        return self[key] if key in self.table else default
+
+
+class ResultTable:
+    """추출 결과를 열 단위로 보관하는 표
+
+    숫자 열은 numpy 배열, 글자 열은 중복 없는 글자 목록과 번호 배열로 저장하며,
+    파생 열은 열 전체를 한 번에 계산해 add_column으로 추가한다.
+    save/load로 엑셀 파일 옆의 .npz에 저장하고 다시 읽을 수 있다.
+    """
+
+    def __init__(self, columns=None):
+        self._columns = {}
+        self._lists = {}  # 열별 파이썬 목록 캐시 (엑셀 저장, 행 조회용)
+        for key, values in (columns or {}).items():
+            self.add_column(key, values)
+
+    @classmethod
+    def from_records(cls, records, keys, numeric_keys=()):
+        """[{키: 값}] 목록으로 생성 (숫자 키는 int, 나머지는 글자)"""
+        table = cls()
+        for key in keys:
+            values = [record.get(key) for record in records]
+            if key in numeric_keys:
+                table.add_column(key, NumberColumn.from_values(values))
+            else:
+                table.add_column(key, TextColumn.from_values(values))
+        return table
+
+    @classmethod
+    def from_tokens(cls, tokens, keys, numeric_keys=()):
+        """헤더 순서대로 반복되는 토큰 목록으로 생성 (열별로 건너뛰며 잘라 행별 딕셔너리 없이 생성)"""
+        row_count = len(tokens) // len(keys)
+        table = cls()
+        for offset, key in enumerate(keys):
+            values = tokens[offset:row_count * len(keys):len(keys)]
+            if key in numeric_keys:
+                digits = ["".join(char for char in value if char.isdigit()) for value in values]
+                table.add_column(key, np.array([int(value) if value else 0 for value in digits], dtype=np.int64))
+            else:
+                table.add_column(key, TextColumn.from_values(values))
+        return table
+
+    def __len__(self):
+        return len(next(iter(self._columns.values()))) if self._columns else 0
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def __getitem__(self, key):
+        """열 배열 (숫자 열은 int64/float64, 값이 없는 행이 있거나 글자 열이면 object)"""
+        return self._columns[key].array()
+
+    @property
+    def keys(self):
+        return list(self._columns)
+
+    def column(self, key):
+        return self._columns[key]
+
+    def add_column(self, key, values):
+        column = _column_from_values(values)
+        if self._columns and len(column) != len(self):
+            raise ValueError(f"열 길이가 다릅니다: {key} ({len(column)}행, 표 {len(self)}행)")
+        self._columns[key] = column
+        self._lists.pop(key, None)
+
+    def map_text(self, key, function):
+        """글자 열의 중복 없는 값마다 function을 한 번씩 호출한 결과 열"""
+        return self._columns[key].map(function)
+
+    def values(self, key):
+        values = self._lists.get(key)
+        if values is None:
+            values = self._lists[key] = self._columns[key].tolist()
+        return values
+
+    def row(self, index):
+        return ResultRow(self, index)
+
+    def rows(self, keys):
+        """keys 순서의 행 목록 (엑셀 저장용)"""
+        return [list(row) for row in zip(*(self.values(key) for key in keys))]
+
+    def records(self):
+        """[{키: 값}] 목록 (비교, 디버깅용)"""
+        return [dict(zip(self.keys, row)) for row in self.rows(self.keys)]
+
+    def save(self, path):
+        arrays = {}
+        for key, column in self._columns.items():
+            if isinstance(column, TextColumn):
+                arrays[key + CODES_SUFFIX] = column.codes
+                arrays[key + CATEGORIES_SUFFIX] = np.array(column.categories, dtype=str)
+            else:
+                arrays[key] = column.values
+                if column.missing is not None:
+                    arrays[key + MISSING_SUFFIX] = column.missing
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        table = cls()
+        with np.load(path) as data:
+            for name in data.files:
+                if name.endswith(CODES_SUFFIX):
+                    key = name[:-len(CODES_SUFFIX)]
+                    table.add_column(key, TextColumn(data[name], data[key + CATEGORIES_SUFFIX].tolist()))
+                elif not name.endswith((CATEGORIES_SUFFIX, MISSING_SUFFIX)):
+                    missing = data[name + MISSING_SUFFIX] if name + MISSING_SUFFIX in data.files else None
+                    table.add_column(name, NumberColumn(data[name], missing))
+        return table
@@ -0,0 +1,218 @@
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+# 저장소에 저장하는 서클원 필드 (CircleMember.to_dict 순서)
+MEMBER_FIELDS = ["nickname", "uid", "arcalive_id", "join_date", "position", "remark"]
+
+
+def write_json_atomic(path, data):
+    """임시 파일에 쓴 뒤 교체하여, 저장 중 종료되어도 기존 파일이 깨지지 않게 저장"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+class RosterStore(ABC):
+    """서클원 명단 저장소
+
+    서클원은 {"id": 번호, 필드: 값} 딕셔너리로 주고받으며, id는 저장소가 정한다.
+    transaction() 안의 변경은 마지막에 한 번에 저장(커밋)된다.
+    """
+
+    def __init__(self):
+        self._depth = 0
+
+    @abstractmethod
+    def load(self) -> list[dict]:
+        pass
+
+    @abstractmethod
+    def insert(self, data) -> int:
+        pass
+
+    @abstractmethod
+    def update(self, member_id, data):
+        pass
+
+    @abstractmethod
+    def delete(self, member_id):
+        pass
+
+    @abstractmethod
+    def _commit(self):
+        pass
+
+    def _rollback(self):
+        pass
+
+    @contextmanager
+    def transaction(self):
+        """여러 변경을 한 번에 저장, 중간에 예외가 나면 저장하지 않음 (중첩하면 가장 바깥에서 저장)"""
+        self._depth += 1
+        try:
+            yield self
+        except Exception:
+            self._depth -= 1
+            if self._depth == 0:
+                self._rollback()
+            raise
+        else:
+            self._depth -= 1
+            if self._depth == 0:
+                self._commit()
+
+    def _changed(self):
+        """트랜잭션 밖의 변경은 바로 저장"""
+        if self._depth == 0:
+            self._commit()
+
+    def export_json(self, path):
+        """기존 circle_members.json 형식으로 내보내기"""
+        write_json_atomic(path, [{field: data.get(field) for field in MEMBER_FIELDS} for data in self.load()])
+
+    def close(self):
+        pass
+
+
+class JsonRosterStore(RosterStore):
+    """circle_members.json 저장소 (변경마다 파일 전체를 원자적으로 다시 씀)"""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self._members = {}  # id -> 필드 딕셔너리 (추가 순서 유지)
+        self._next_id = 1
+        self._snapshot = None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for data in json.load(f):
+                    self._add(data)
+        except FileNotFoundError:
+            print(f"{self.path} 파일이 존재하지 않습니다.")
+
+    def load(self):
+        return [{"id": member_id, **data} for member_id, data in self._members.items()]
+
+    @contextmanager
+    def transaction(self):
+        if self._depth == 0:
+            self._snapshot = dict(self._members)
+        with super().transaction():
+            yield self
+
+    def _add(self, data):
+        member_id = self._next_id
+        self._next_id += 1
+        self._members[member_id] = {field: data.get(field) for field in MEMBER_FIELDS}
+        return member_id
+
+    def insert(self, data):
+        member_id = self._add(data)
+        self._changed()
+        return member_id
+
+    def update(self, member_id, data):
+        self._members[member_id] = {field: data.get(field) for field in MEMBER_FIELDS}
+        self._changed()
+
+    def delete(self, member_id):
+        self._members.pop(member_id, None)
+        self._changed()
+
+    def _commit(self):
+        write_json_atomic(self.path, list(self._members.values()))
+
+    def _rollback(self):
+        if self._snapshot is not None:
+            self._members = self._snapshot
+
+
+class SqliteRosterStore(RosterStore):
+    """SQLite 저장소 (WAL 모드, 서클원 한 명 단위로 변경하므로 저장 시간이 명단 크기와 무관)
+
+    처음 열 때 서클원이 없고 json_path의 파일이 있으면 한 번만 가져온다.
+    """
+
+    def __init__(self, path, json_path=None):
+        super().__init__()
+        self.path = path
+        self.connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS members (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            + ", ".join(f"{field} TEXT" for field in MEMBER_FIELDS) + ")")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        if json_path:
+            self.migrate_from_json(json_path)
+
+    def _execute(self, sql, parameters=()):
+        if self._depth == 0:
+            with self._immediate():
+                return self.connection.execute(sql, parameters)
+        return self.connection.execute(sql, parameters)
+
+    @contextmanager
+    def _immediate(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    @contextmanager
+    def transaction(self):
+        if self._depth == 0:
+            self.connection.execute("BEGIN IMMEDIATE")
+        with super().transaction():
+            yield self
+
+    def _commit(self):
+        self.connection.execute("COMMIT")
+
+    def _rollback(self):
+        self.connection.execute("ROLLBACK")
+
+    def load(self):
+        cursor = self.connection.execute(f"SELECT id, {', '.join(MEMBER_FIELDS)} FROM members ORDER BY id")
+        return [dict(zip(["id"] + MEMBER_FIELDS, row)) for row in cursor]
+
+    def insert(self, data):
+        cursor = self._execute(
+            f"INSERT INTO members ({', '.join(MEMBER_FIELDS)}) VALUES ({', '.join('?' for _ in MEMBER_FIELDS)})",
+            [data.get(field) for field in MEMBER_FIELDS])
+        return cursor.lastrowid
+
+    def update(self, member_id, data):
+        self._execute(f"UPDATE members SET {', '.join(f'{field} = ?' for field in MEMBER_FIELDS)} WHERE id = ?",
+                      [data.get(field) for field in MEMBER_FIELDS] + [member_id])
+
+    def delete(self, member_id):
+        self._execute("DELETE FROM members WHERE id = ?", (member_id,))
+
+    def migrate_from_json(self, json_path):
+        """JSON 명단을 한 번만 가져옴 (가져온 기록은 meta 테이블에 남김)"""
+        migrated = self.connection.execute("SELECT value FROM meta WHERE key = 'migrated_from'").fetchone()
+        has_members = self.connection.execute("SELECT 1 FROM members LIMIT 1").fetchone()
+        if migrated or has_members or not os.path.exists(json_path):
+            return
+
+        with open(json_path, 'r', encoding='utf-8') as f:
+            members = json.load(f)
+
+        with self.transaction():
+            for data in members:
+                self.insert(data)
+            self.connection.execute("INSERT INTO meta (key, value) VALUES ('migrated_from', ?)", (json_path,))
+        print(f"✅ {json_path}에서 서클원 {len(members)}명을 가져왔습니다.")
+
+    def close(self):
+        self.connection.close()
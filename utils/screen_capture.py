@@ -0,0 +1,98 @@
+import ctypes
+from ctypes import wintypes
+
+import cv2
+import numpy as np
+
+SRCCOPY = 0x00CC0020
+DIB_RGB_COLORS = 0
+BI_RGB = 0
+
+DEFAULT_RING_SIZE = 3
+
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [("biSize", wintypes.DWORD),
+                ("biWidth", wintypes.LONG),
+                ("biHeight", wintypes.LONG),
+                ("biPlanes", wintypes.WORD),
+                ("biBitCount", wintypes.WORD),
+                ("biCompression", wintypes.DWORD),
+                ("biSizeImage", wintypes.DWORD),
+                ("biXPelsPerMeter", wintypes.LONG),
+                ("biYPelsPerMeter", wintypes.LONG),
+                ("biClrUsed", wintypes.DWORD),
+                ("biClrImportant", wintypes.DWORD)]
+
+
+class FrameRing:
+    """미리 할당한 grayscale 버퍼를 돌려 쓰는 프레임 링 버퍼
+
+    반환된 프레임은 ring_size번 더 저장하기 전까지만 유효하므로,
+    오래 보관해야 하는 쪽에서 복사해야 한다.
+    """
+
+    def __init__(self, width, height, ring_size=DEFAULT_RING_SIZE):
+        self.width = width
+        self.height = height
+        self.bgra = np.empty((height, width, 4), dtype=np.uint8)  # 캡쳐 원본을 받는 버퍼
+        self.buffers = [np.empty((height, width), dtype=np.uint8) for _ in range(ring_size)]
+        self.index = 0
+
+    def store(self, color=False):
+        """self.bgra의 내용을 다음 grayscale 버퍼로 변환하여 반환, color=True면 BGR 복사본도 함께 반환"""
+        gray = self.buffers[self.index]
+        self.index = (self.index + 1) % len(self.buffers)
+
+        cv2.cvtColor(self.bgra, cv2.COLOR_BGRA2GRAY, dst=gray)
+        if color:
+            return gray, cv2.cvtColor(self.bgra, cv2.COLOR_BGRA2BGR)
+        return gray
+
+
+class ScreenCapturer:
+    """GDI BitBlt로 화면 영역을 FrameRing 버퍼에 바로 캡쳐하는 클래스 (Windows 전용)"""
+
+    def __init__(self, bbox, ring_size=DEFAULT_RING_SIZE):
+        self.left, self.top, right, bottom = bbox
+        width, height = right - self.left, bottom - self.top
+        self.ring = FrameRing(width, height, ring_size)
+
+        user32, gdi32 = ctypes.windll.user32, ctypes.windll.gdi32
+        user32.GetDC.restype = wintypes.HDC
+        gdi32.CreateCompatibleDC.restype = wintypes.HDC
+        gdi32.CreateCompatibleBitmap.restype = wintypes.HBITMAP
+        gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+        gdi32.BitBlt.argtypes = [wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                 wintypes.HDC, ctypes.c_int, ctypes.c_int, wintypes.DWORD]
+        gdi32.GetDIBits.argtypes = [wintypes.HDC, wintypes.HBITMAP, wintypes.UINT, wintypes.UINT,
+                                    ctypes.c_void_p, ctypes.c_void_p, wintypes.UINT]
+        gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+        gdi32.DeleteDC.argtypes = [wintypes.HDC]
+        user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+
+        self.screen_dc = user32.GetDC(None)
+        self.memory_dc = gdi32.CreateCompatibleDC(self.screen_dc)
+        self.bitmap = gdi32.CreateCompatibleBitmap(self.screen_dc, width, height)
+        gdi32.SelectObject(self.memory_dc, self.bitmap)
+
+        # 위에서 아래로 저장되는 32bit DIB (biHeight가 음수)
+        self.bitmap_info = BITMAPINFOHEADER(biSize=ctypes.sizeof(BITMAPINFOHEADER), biWidth=width,
+                                            biHeight=-height, biPlanes=1, biBitCount=32, biCompression=BI_RGB)
+
+    def capture(self, color=False):
+        """화면을 캡쳐하여 grayscale 프레임을 반환, color=True면 (grayscale, BGR)을 반환"""
+        gdi32 = ctypes.windll.gdi32
+        ring = self.ring
+
+        gdi32.BitBlt(self.memory_dc, 0, 0, ring.width, ring.height, self.screen_dc, self.left, self.top, SRCCOPY)
+        gdi32.GetDIBits(self.memory_dc, self.bitmap, 0, ring.height, ring.bgra.ctypes.data,
+                        ctypes.byref(self.bitmap_info), DIB_RGB_COLORS)
+        return ring.store(color)
+
+    def close(self):
+        if self.bitmap:
+            ctypes.windll.gdi32.DeleteObject(self.bitmap)
+            ctypes.windll.gdi32.DeleteDC(self.memory_dc)
+            ctypes.windll.user32.ReleaseDC(None, self.screen_dc)
+            self.bitmap = None
@@ -0,0 +1,60 @@
+import time
+
+import cv2
+import numpy as np
+
+
+class SettleDetector:
+    """스크롤 후 화면이 멈출 때까지 기다리는 클래스
+
+    고정된 sleep 대신 축소한 ROI 캡쳐를 반복해서 비교하고,
+    연속된 두 캡쳐의 차이가 tolerance 이하이면 즉시 반환한다.
+    """
+
+    def __init__(self, capture, probe_scale=0.125, tolerance=1.0, interval=0.03, min_wait=0.05, motion_wait=0.8,
+                 timeout=2.0):
+        self.capture = capture
+        self.probe_scale = probe_scale
+        self.tolerance = tolerance
+        self.interval = interval
+        self.min_wait = min_wait
+        self.motion_wait = motion_wait
+        self.timeout = timeout
+
+    def _probe(self, frame):
+        probe = cv2.resize(frame, (0, 0), fx=self.probe_scale, fy=self.probe_scale, interpolation=cv2.INTER_AREA)
+        return probe.astype(np.int16)
+
+    def _is_same(self, probe, other):
+        return np.abs(probe - other).mean() <= self.tolerance
+
+    def wait(self, reference=None, min_wait=None, motion_wait=None):
+        """화면이 멈추면 (마지막 캡쳐 프레임, 대기 시간, 안정화 여부)를 반환
+
+        reference(스크롤/활성화 전 프레임)를 주면 화면이 아직 움직이기 전의 정지 상태를
+        안정화로 오인하지 않도록 motion_wait 동안은 reference와 다른 화면을 기다린다.
+        min_wait, motion_wait를 주면 이번 대기에만 기본값 대신 사용한다.
+        """
+        min_wait = self.min_wait if min_wait is None else min_wait
+        motion_wait = self.motion_wait if motion_wait is None else motion_wait
+
+        start = time.perf_counter()
+        reference_probe = self._probe(reference) if reference is not None else None
+        time.sleep(min_wait)
+
+        frame = self.capture()
+        prev_probe = self._probe(frame)
+        while True:
+            elapsed = time.perf_counter() - start
+            if elapsed >= self.timeout:
+                return frame, elapsed, False
+
+            time.sleep(self.interval)
+            frame = self.capture()
+            probe = self._probe(frame)
+
+            if self._is_same(probe, prev_probe):
+                not_moved = reference_probe is not None and self._is_same(probe, reference_probe)
+                if not not_moved or time.perf_counter() - start >= motion_wait:
+                    return frame, time.perf_counter() - start, True
+            prev_probe = probe
@@ -0,0 +1,111 @@
+import numpy as np
+
+from utils import image
+
+INITIAL_CAPACITY_FRAMES = 4
+
+
+class ImageStitcher:
+    """스크롤 캡쳐 이미지를 하나의 긴 캔버스로 이어 붙이는 클래스
+
+    새 프레임의 상단 템플릿은 항상 마지막으로 붙인 프레임 안에서만 찾으므로
+    누적 높이와 무관하게 프레임당 비교/병합 비용이 일정하다.
+    """
+
+    def __init__(self, first_frame, template_ratio=0.2, min_similarity=0.8, confident_similarity=0.98,
+                 search_margin_ratio=0.1, matcher=None):
+        self.frame_height, self.width = first_frame.shape[:2]
+        self.template_height = max(1, int(self.frame_height * template_ratio))
+        self.min_similarity = min_similarity
+        self.confident_similarity = confident_similarity
+        self.search_margin = max(self.template_height // 2, int(self.frame_height * search_margin_ratio))
+        self.matcher = matcher if matcher else image.compare_images
+
+        # 캔버스는 미리 할당하고 부족하면 두 배로 늘림 (amortized O(1) append)
+        capacity = self.frame_height * INITIAL_CAPACITY_FRAMES
+        self._canvas = np.empty((capacity,) + first_frame.shape[1:], dtype=first_frame.dtype)
+        self._canvas[:self.frame_height] = first_frame
+        self.height = self.frame_height
+
+        self.last_frame_top = 0  # 마지막으로 붙인 프레임의 캔버스 내 y 좌표, 이 위쪽은 더 이상 바뀌지 않음
+        self.band_top = 0  # pop_band로 아직 내보내지 않은 구간의 시작 y 좌표
+        self.expected_shift = None  # 직전 스크롤 이동량 (다음 탐색 창의 기준)
+
+    @property
+    def image(self):
+        """지금까지 병합된 캔버스 (복사 없는 view)"""
+        return self._canvas[:self.height]
+
+    def _search_window(self):
+        """다음 프레임의 템플릿을 찾을 캔버스 구간 (start, end)"""
+        start, end = self.last_frame_top, self.height
+        if self.expected_shift is not None:
+            center = self.last_frame_top + self.expected_shift
+            start = max(start, center - self.search_margin)
+            end = min(end, center + self.template_height + self.search_margin)
+            if end - start < self.template_height:
+                return self.last_frame_top, self.height
+        return start, end
+
+    def _match(self, template, start, end):
+        similarity, (x, y) = self.matcher(self._canvas[start:end], template)
+        return similarity, start + y
+
+    def add(self, frame):
+        """새 프레임을 병합하고 (유사도, 이동량)을 반환. 매칭 실패 시 이동량은 None"""
+        template = frame[:self.template_height]
+
+        start, end = self._search_window()
+        similarity, y = self._match(template, start, end)
+
+        # 예상 위치에서 확실하게 찾지 못하면 마지막 프레임 전체를 다시 탐색
+        # (반복되는 목록 행에 잘못 매칭되거나 화면이 움직이지 않은 경우)
+        if similarity < self.confident_similarity and (start, end) != (self.last_frame_top, self.height):
+            similarity, y = max((similarity, y), self._match(template, self.last_frame_top, self.height))
+
+        if similarity <= self.min_similarity:
+            return similarity, None
+
+        shift = y - self.last_frame_top
+        if shift > 0:
+            self._append(frame, y)
+            self.expected_shift = shift
+
+        return similarity, shift
+
+    def _append(self, frame, y):
+        required = y + frame.shape[0]
+        if required > self._canvas.shape[0]:
+            capacity = self._canvas.shape[0]
+            while capacity < required:
+                capacity *= 2
+
+            canvas = np.empty((capacity,) + self._canvas.shape[1:], dtype=self._canvas.dtype)
+            canvas[:self.height] = self._canvas[:self.height]
+            self._canvas = canvas
+
+        self._canvas[y:required] = frame
+        self.height = required
+        self.last_frame_top = y
+
+    def pop_band(self, min_height, final=False):
+        """확정된 구간이 min_height 이상 쌓이면 행 경계에서 잘라 (y 좌표, 이미지)를 반환
+
+        final=True면 남은 구간 전체를 반환한다. 내보낼 구간이 없으면 None.
+        """
+        if final:
+            bottom = self.height
+        else:
+            finalized = self.last_frame_top
+            if finalized - self.band_top < min_height:
+                return None
+
+            search_start = max(self.band_top + min_height // 2, finalized - self.template_height)
+            bottom = image.find_row_safe_cut(self._canvas, search_start, finalized)
+
+        if bottom <= self.band_top:
+            return None
+
+        top = self.band_top
+        self.band_top = bottom
+        return top, self._canvas[top:bottom]
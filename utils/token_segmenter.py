@@ -0,0 +1,152 @@
+from collections import deque
+
+from utils.record_tokenizer import ENUM, MARKER, PREFIX, FieldRule
+
+# 토큰 중간을 자를 때의 감점 (사전 단어 점수는 글자 수)
+CUT_PENALTY = 2
+
+
+class AhoCorasick:
+    """여러 단어를 한 번에 찾는 Aho-Corasick 자동자, 검색은 O(글자 수 + 찾은 수)"""
+
+    def __init__(self, words):
+        self.words = list(words)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]  # 노드에서 끝나는 단어 번호 (실패 링크로 이어지는 단어 포함)
+
+        for word_id, word in enumerate(self.words):
+            node = 0
+            for char in word:
+                child = self._goto[node].get(char)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][char] = child
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = child
+            self._output[node].append(word_id)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+                queue.append(child)
+
+    def find(self, text):
+        """(시작 위치, 단어 번호)를 차례로 반환"""
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for word_id in self._output[node]:
+                yield position + 1 - len(self.words[word_id]), word_id
+
+
+class RosterSegmenter:
+    """서클원 닉네임과 고정 어휘(직위, Lv, 제목)로 OCR 토큰을 다시 나누는 클래스
+
+    토큰을 이어 붙인 문자열에서 사전 단어를 Aho-Corasick으로 찾고, 동적 계획법으로
+    (사전 단어 글자 수 - 토큰 중간을 자른 횟수 * CUT_PENALTY)가 가장 큰 분할을 고른다.
+    - 두 토큰으로 나뉜 닉네임은 하나로 합치고 ("하얀" + "새벽" -> "하얀새벽")
+    - 붙어서 인식된 닉네임과 직위는 나눈다 ("하얀새벽서클원" -> "하얀새벽", "서클원")
+    토큰 중간은 고정 어휘의 앞뒤에서만 자르고, 닉네임은 토큰 처음에서만 시작하므로
+    명단에 없는 닉네임이 명단의 닉네임으로 시작하거나 끝나도 나누지 않는다.
+    접두어 단어(Lv, 제목)는 뒤의 글자까지 한 토큰으로 둔다 ("Lv.45").
+    """
+
+    def __init__(self, nicknames=(), words=(), prefixes=()):
+        self.nicknames = [nickname for nickname in dict.fromkeys(nicknames) if nickname]
+        self.words = [word for word in dict.fromkeys(words) if word]
+        self.prefixes = [prefix for prefix in dict.fromkeys(prefixes) if prefix]
+        self._automaton = AhoCorasick(self.nicknames + self.words + self.prefixes)
+
+    @classmethod
+    def from_grammar(cls, grammar: list[FieldRule], nicknames=()):
+        """레코드 규칙의 직위(ENUM), 접두어(PREFIX), 제목(MARKER)과 닉네임으로 사전을 만듦"""
+        words, prefixes = [], []
+        for rule in grammar:
+            if rule.kind == ENUM:
+                words.extend(rule.values)
+            elif rule.kind in (PREFIX, MARKER):
+                prefixes.append(rule.pattern)
+        return cls(nicknames, words, prefixes)
+
+    def segment(self, tokens):
+        """다시 나눈 토큰 목록"""
+        tokens = [token for token in tokens if token]
+        text = "".join(tokens)
+        length = len(text)
+        if not length:
+            return []
+
+        boundary = [False] * (length + 1)
+        offset = 0
+        for token in tokens:
+            boundary[offset] = True
+            offset += len(token)
+        boundary[length] = True
+
+        # 시작 위치별 (단어 번호), 자를 수 있는 위치 (토큰 경계, 고정 어휘의 시작과 끝)
+        nickname_count = len(self.nicknames)
+        prefix_start = nickname_count + len(self.words)
+        matches = [[] for _ in range(length)]
+        cuttable = boundary[:]
+        for start, word_id in self._automaton.find(text):
+            if word_id < nickname_count and not boundary[start]:
+                continue
+            matches[start].append(word_id)
+            if word_id >= nickname_count:
+                cuttable[start] = True
+                if word_id < prefix_start:
+                    cuttable[start + len(self._automaton.words[word_id])] = True
+
+        # 위치 p 다음의 토큰 경계와, 다음 자를 수 있는 위치
+        next_boundary = [length] * length
+        next_cut = [length] * length
+        boundary_after = cut_after = length
+        for position in range(length - 1, -1, -1):
+            next_boundary[position], next_cut[position] = boundary_after, cut_after
+            if boundary[position]:
+                boundary_after = position
+            if cuttable[position]:
+                cut_after = position
+
+        scores = [None] * (length + 1)
+        previous = [0] * (length + 1)
+        scores[0] = 0
+        for start in range(length):
+            if scores[start] is None:
+                continue
+
+            # (끝 위치, 점수): 사전에 없는 글자는 경계나 다음 자를 수 있는 위치까지 0점
+            candidates = [(next_boundary[start], 0), (next_cut[start], 0)]
+            for word_id in matches[start]:
+                word_length = len(self._automaton.words[word_id])
+                end = start + word_length
+                if word_id >= prefix_start and end < length and not cuttable[end]:
+                    end = next_cut[end]
+                candidates.append((end, word_length))
+
+            for end, score in candidates:
+                if not cuttable[end]:
+                    continue
+                score += scores[start] - (0 if boundary[end] else CUT_PENALTY)
+                if scores[end] is None or score > scores[end]:
+                    scores[end] = score
+                    previous[end] = start
+
+        segments = []
+        end = length
+        while end > 0:
+            start = previous[end]
+            segments.append(text[start:end])
+            end = start
+        return segments[::-1]
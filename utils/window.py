@@ -1,7 +1,5 @@
 import ctypes
 
-import numpy as np
-from PIL import ImageGrab
 
 # 아이콘 상수
 MB_ICONERROR = 0x10         # ❌ 오류 아이콘
@@ -84,8 +82,8 @@ def show_message(title, message, flag=MB_ICONINFORMATION):
     return ctypes.windll.user32.MessageBoxW(0, message, title, flag)  # 0x40: 아이콘, 0x1: OK 버튼
 
 
-def screenshot(rect_ratio, hwnd=None, window_title=None):
-    """동적으로 설정된 비율을 적용하여 스크린샷을 찍는 함수"""
+def get_screenshot_bbox(rect_ratio, hwnd=None, window_title=None):
+    """동적으로 설정된 비율을 적용한 캡쳐 영역의 스크린 좌표 (left, top, right, bottom)"""
     if not hwnd:
         hwnd = find_window(window_title)
 
@@ -97,6 +95,4 @@ def screenshot(rect_ratio, hwnd=None, window_title=None):
     right = client_x + client_width - int(client_width * right_ratio * 2)
     bottom = client_y + client_height - int(client_width * bottom_ratio)
 
-    print(f"📸 Left: {left}, Top: {top}, Right: {right}, Bottom: {bottom}")
-
-    return np.array(ImageGrab.grab(bbox=(left, top, right, bottom)))
+    return left, top, right, bottom